@@ -12,6 +12,7 @@ from typing import (
     Callable,
     Dict,
     List,
+    Literal,
     Optional,
     Protocol,
     Sequence,
@@ -81,6 +82,7 @@ if TYPE_CHECKING:
     )
     from .types.message import (
         AllowedMentions as AllowedMentionsPayload,
+        Message as MessagePayload,
         MessageReference as MessageReferencePayload,
     )
     from .ui.view import View
@@ -456,6 +458,7 @@ class GuildChannel:
 
     def _fill_overwrites(self, data: GuildChannelPayload) -> None:
         self._overwrites = []
+        self.guild._invalidate_permissions()
         everyone_index = 0
         everyone_id = self.guild.id
 
@@ -601,6 +604,52 @@ class GuildChannel:
         """
         return f"https://discord.com/channels/{self.guild.id}/{self.id}"
 
+    def _apply_member_overwrites(self, obj: Member, base: Permissions) -> Permissions:
+        roles = obj._roles
+
+        # Apply @everyone allow/deny first since it's special
+        try:
+            maybe_everyone = self._overwrites[0]
+            if maybe_everyone.id == self.guild.id:
+                base.handle_overwrite(allow=maybe_everyone.allow, deny=maybe_everyone.deny)
+                remaining_overwrites = self._overwrites[1:]
+            else:
+                remaining_overwrites = self._overwrites
+        except IndexError:
+            remaining_overwrites = self._overwrites
+
+        denies = 0
+        allows = 0
+
+        # Apply channel specific role permission overwrites
+        for overwrite in remaining_overwrites:
+            if overwrite.is_role() and roles.has(overwrite.id):
+                denies |= overwrite.deny
+                allows |= overwrite.allow
+
+        base.handle_overwrite(allow=allows, deny=denies)
+
+        # Apply member specific permission overwrites
+        for overwrite in remaining_overwrites:
+            if overwrite.is_member() and overwrite.id == obj.id:
+                base.handle_overwrite(allow=overwrite.allow, deny=overwrite.deny)
+                break
+
+        # if you can't send a message in a channel then you can't have certain
+        # permissions as well
+        if not base.send_messages:
+            base.send_tts_messages = False
+            base.mention_everyone = False
+            base.embed_links = False
+            base.attach_files = False
+
+        # if you can't read a channel then you have no permissions there
+        if not base.read_messages:
+            denied = Permissions.all_channel()
+            base.value &= ~denied.value
+
+        return base
+
     def permissions_for(self, obj: Union[Member, Role], /) -> Permissions:
         """Handles permission resolution for the :class:`~nextcord.Member`
         or :class:`~nextcord.Role`.
@@ -684,60 +733,34 @@ class GuildChannel:
 
             return base
 
-        roles = obj._roles
-        get_role = self.guild.get_role
-
-        # Apply guild roles that the member has.
-        for role_id in roles:
-            role = get_role(role_id)
-            if role is not None:
-                base.value |= role._permissions
-
-        # Guild-wide Administrator -> True for everything
-        # Bypass all channel-specific overrides
-        if base.administrator:
-            return Permissions.all()
-
-        # Apply @everyone allow/deny first since it's special
-        try:
-            maybe_everyone = self._overwrites[0]
-            if maybe_everyone.id == self.guild.id:
-                base.handle_overwrite(allow=maybe_everyone.allow, deny=maybe_everyone.deny)
-                remaining_overwrites = self._overwrites[1:]
-            else:
-                remaining_overwrites = self._overwrites
-        except IndexError:
-            remaining_overwrites = self._overwrites
-
-        denies = 0
-        allows = 0
-
-        # Apply channel specific role permission overwrites
-        for overwrite in remaining_overwrites:
-            if overwrite.is_role() and roles.has(overwrite.id):
-                denies |= overwrite.deny
-                allows |= overwrite.allow
-
-        base.handle_overwrite(allow=allows, deny=denies)
+        if obj.guild is self.guild:
+            # both the guild permissions and the resolved channel permissions are
+            # cached on the member until its roles or the guild's roles,
+            # owner or overwrites change
+            guild_permissions = obj.guild_permissions
+            if guild_permissions.administrator:
+                return guild_permissions
+
+            cache = obj._channel_permissions_cache()
+            value = cache.get(self.id)
+            if value is None:
+                value = cache[self.id] = self._apply_member_overwrites(obj, guild_permissions).value
+            base = Permissions(value)
+        else:
+            get_role = self.guild.get_role
 
-        # Apply member specific permission overwrites
-        for overwrite in remaining_overwrites:
-            if overwrite.is_member() and overwrite.id == obj.id:
-                base.handle_overwrite(allow=overwrite.allow, deny=overwrite.deny)
-                break
+            # Apply guild roles that the member has.
+            for role_id in obj._roles:
+                role = get_role(role_id)
+                if role is not None:
+                    base.value |= role._permissions
 
-        # if you can't send a message in a channel then you can't have certain
-        # permissions as well
-        if not base.send_messages:
-            base.send_tts_messages = False
-            base.mention_everyone = False
-            base.embed_links = False
-            base.attach_files = False
+            # Guild-wide Administrator -> True for everything
+            # Bypass all channel-specific overrides
+            if base.administrator:
+                return Permissions.all()
 
-        # if you can't read a channel then you have no permissions there
-        if not base.read_messages:
-            denied = Permissions.all_channel()
-            base.value &= ~denied.value
+            base = self._apply_member_overwrites(obj, base)
 
         # if you are timed out then you lose all permissions except view_channel and read_message_history
         if obj.communication_disabled_until is not None:
@@ -914,7 +937,7 @@ class GuildChannel:
         obj = cls(state=self._state, guild=self.guild, data=data)
 
         # temporarily add it to the cache
-        self.guild._channels[obj.id] = obj  # type: ignore
+        self.guild._add_channel(obj)  # type: ignore
         return obj
 
     async def clone(self, *, name: Optional[str] = None, reason: Optional[str] = None) -> Self:
@@ -1649,6 +1672,32 @@ class Messageable:
         data = await self._state.http.get_message(channel.id, id)
         return self._state.create_message(channel=channel, data=data)
 
+    @overload
+    def history(
+        self,
+        *,
+        limit: Optional[int] = ...,
+        before: Optional[SnowflakeTime] = ...,
+        after: Optional[SnowflakeTime] = ...,
+        around: Optional[SnowflakeTime] = ...,
+        oldest_first: Optional[bool] = ...,
+        prefetch: int = ...,
+        raw: Literal[False] = ...,
+    ) -> AsyncIterator[Message]: ...
+
+    @overload
+    def history(
+        self,
+        *,
+        limit: Optional[int] = ...,
+        before: Optional[SnowflakeTime] = ...,
+        after: Optional[SnowflakeTime] = ...,
+        around: Optional[SnowflakeTime] = ...,
+        oldest_first: Optional[bool] = ...,
+        prefetch: int = ...,
+        raw: Literal[True],
+    ) -> AsyncIterator[MessagePayload]: ...
+
     def history(
         self,
         *,
@@ -1657,7 +1706,9 @@ class Messageable:
         after: Optional[SnowflakeTime] = None,
         around: Optional[SnowflakeTime] = None,
         oldest_first: Optional[bool] = None,
-    ) -> AsyncIterator[Message]:
+        prefetch: int = 0,
+        raw: bool = False,
+    ) -> Union[AsyncIterator[Message], AsyncIterator[MessagePayload]]:
         """|asynciter|
 
         Returns an async iterator that enables receiving the destination's message history.
@@ -1699,6 +1750,17 @@ class Messageable:
         oldest_first: Optional[:class:`bool`]
             If set to ``True``, return messages in oldest->newest order. Defaults to ``True`` if
             ``after`` is specified, otherwise ``False``.
+        prefetch: :class:`int`
+            The number of pages to request ahead of the messages being consumed, so that
+            fetching the next page overlaps with processing the current one.
+            Defaults to ``0``, which only requests a page once the previous one was consumed.
+
+            .. versionadded:: 3.2
+        raw: :class:`bool`
+            Whether to yield the raw message payloads as :class:`dict` instead of
+            building :class:`~nextcord.Message` objects. Defaults to ``False``.
+
+            .. versionadded:: 3.2
 
         Raises
         ------
@@ -1713,7 +1775,14 @@ class Messageable:
             The message with the message data parsed.
         """
         return history_iterator(
-            self, limit=limit, before=before, after=after, around=around, oldest_first=oldest_first
+            self,
+            limit=limit,
+            before=before,
+            after=after,
+            around=around,
+            oldest_first=oldest_first,
+            prefetch=prefetch,
+            raw=raw,
         )
 
 
@@ -4,13 +4,13 @@ from __future__ import annotations
 
 import io
 import os
-from typing import TYPE_CHECKING, Any, Literal, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, AsyncIterator, Literal, Optional, Tuple, Union
 
 import yarl
 
 from . import utils
 from .errors import DiscordException, InvalidArgument
-from .file import File
+from .file import File, _spool, _write_chunks
 
 __all__ = ("Asset",)
 
@@ -54,6 +54,36 @@ class AssetMixin:
 
         return await self._state.http.get_from_cdn(self.url)
 
+    def stream(self, *, chunk_size: int = 65536) -> AsyncIterator[bytes]:
+        """Returns an async iterator over the content of this asset, downloading
+        it in chunks instead of loading it into memory at once.
+
+        .. versionadded:: 3.2
+
+        Parameters
+        ----------
+        chunk_size: :class:`int`
+            The maximum size of each chunk in bytes. Defaults to 64 KiB.
+
+        Raises
+        ------
+        DiscordException
+            There was no internal connection state.
+        HTTPException
+            Downloading the asset failed.
+        NotFound
+            The asset was deleted.
+
+        Yields
+        ------
+        :class:`bytes`
+            A chunk of the content of the asset.
+        """
+        if self._state is None:
+            raise DiscordException("Invalid state (no ConnectionState provided)")
+
+        return self._state.http.stream_from_cdn(self.url, chunk_size=chunk_size)
+
     async def save(
         self, fp: Union[str, bytes, os.PathLike, io.BufferedIOBase], *, seek_begin: bool = True
     ) -> int:
@@ -61,6 +91,9 @@ class AssetMixin:
 
         Saves this asset into a file-like object.
 
+        .. versionchanged:: 3.2
+            The asset is now written in chunks while it is downloaded.
+
         Parameters
         ----------
         fp: Union[:class:`io.BufferedIOBase`, :class:`os.PathLike`]
@@ -86,15 +119,7 @@ class AssetMixin:
             The number of bytes written.
         """
 
-        data = await self.read()
-        if isinstance(fp, io.BufferedIOBase):
-            written = fp.write(data)
-            if seek_begin:
-                fp.seek(0)
-            return written
-
-        with open(fp, "wb") as f:  # noqa: ASYNC230
-            return f.write(data)
+        return await _write_chunks(self.stream(), fp, seek_begin=seek_begin)
 
     async def to_file(
         self,
@@ -111,6 +136,10 @@ class AssetMixin:
 
         .. versionadded:: 2.0
 
+        .. versionchanged:: 3.2
+            The asset is now downloaded in chunks into a temporary file
+            that only stays in memory while it is small.
+
         Parameters
         ----------
         filename: Optional[:class:`str`]
@@ -129,6 +158,10 @@ class AssetMixin:
 
             .. versionadded:: 2.2
 
+            .. versionchanged:: 3.2
+                The downloaded file is always closed, as it may be backed by
+                a temporary file on disk.
+
         Raises
         ------
         DiscordException
@@ -148,14 +181,14 @@ class AssetMixin:
             The asset as a file suitable for sending.
         """
 
-        data = await self.read()
+        fp = await _spool(self.stream())
         file_filename = filename if filename is not MISSING else yarl.URL(self.url).name
         return File(
-            io.BytesIO(data),
+            fp,
             filename=file_filename,
             description=description,
             spoiler=spoiler,
-            force_close=force_close,
+            force_close=True,
         )
 
 
@@ -0,0 +1,201 @@
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ItemsView,
+    Iterator,
+    KeysView,
+    MutableMapping,
+    Optional,
+    Protocol,
+    TypeVar,
+    ValuesView,
+    runtime_checkable,
+)
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+__all__ = (
+    "CacheStore",
+    "CACHE_ENTITIES",
+    "LRUCacheStore",
+)
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+CACHE_ENTITIES = ("users", "guilds", "emojis", "stickers", "members", "channels", "threads")
+
+
+@runtime_checkable
+class CacheStore(Protocol[K, V]):
+    """A protocol describing the storage used for one kind of cached entity.
+
+    The library only ever accesses its caches through the operations listed
+    here, so any object implementing them can be used in place of the default
+    :class:`dict` store through the ``cache_stores`` parameter of :class:`Client`,
+    which maps an entity type from :data:`CACHE_ENTITIES` to a zero-argument
+    callable returning a new store.
+    This allows size-bounded, time-based or off-heap stores to be plugged in per
+    entity type.
+
+    Keys are always the :class:`int` ID of the entity. A store is allowed to
+    forget entries at any time; a missing entry is treated like any other cache miss.
+
+    The following operations must be supported:
+
+    .. container:: operations
+
+        .. describe:: store[key]
+
+            Returns the entity for ``key``, raising :exc:`KeyError` if it is missing.
+
+        .. describe:: store[key] = value
+
+            Stores ``value`` under ``key``.
+
+        .. describe:: del store[key]
+
+            Removes ``key``, raising :exc:`KeyError` if it is missing.
+
+        .. describe:: key in store
+
+            Checks if ``key`` is stored.
+
+        .. describe:: len(store)
+
+            Returns the number of stored entities.
+
+        .. describe:: iter(store)
+
+            Iterates over the stored keys.
+
+    .. versionadded:: 3.2
+    """
+
+    def __getitem__(self, key: K, /) -> V: ...
+
+    def __setitem__(self, key: K, value: V, /) -> None: ...
+
+    def __delitem__(self, key: K, /) -> None: ...
+
+    def __contains__(self, key: object, /) -> bool: ...
+
+    def __len__(self) -> int: ...
+
+    def __iter__(self) -> Iterator[K]: ...
+
+    def get(self, key: K, default: Any = None, /) -> Any:
+        """Returns the entity for ``key``, or ``default`` if it is missing."""
+        ...
+
+    def pop(self, key: K, default: Any = ..., /) -> Any:
+        """Removes and returns the entity for ``key``, or ``default`` if it is missing."""
+        ...
+
+    def values(self) -> Any:
+        """Returns an iterable over every stored entity."""
+        ...
+
+    def items(self) -> Any:
+        """Returns an iterable over every stored ``(key, entity)`` pair."""
+        ...
+
+    def clear(self) -> None:
+        """Removes every stored entity."""
+        ...
+
+
+CacheStoreFactory = Callable[[], CacheStore[int, Any]]
+
+
+class LRUCacheStore(MutableMapping[int, V]):
+    """A :class:`CacheStore` holding at most ``maxsize`` entities.
+
+    Once full, the least recently stored or looked up entity is evicted.
+    Iterating over the store does not count as looking entities up.
+
+    .. versionadded:: 3.2
+
+    Parameters
+    ----------
+    maxsize: :class:`int`
+        The maximum number of entities to keep.
+
+    Attributes
+    ----------
+    on_evict: Optional[Callable[[:class:`int`, Any], None]]
+        Called with the key and the entity whenever an entity is evicted.
+        The library sets this on the stores it creates, to clean up what
+        refers to the evicted entities.
+    """
+
+    __slots__ = ("maxsize", "on_evict", "_data")
+
+    def __init__(self, maxsize: int) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be greater than 0")
+
+        self.maxsize: int = maxsize
+        self.on_evict: Optional[Callable[[int, V], None]] = None
+        self._data: OrderedDict[int, V] = OrderedDict()
+
+    @classmethod
+    def factory(cls, maxsize: int) -> Callable[[], Self]:
+        """Returns a factory creating stores of the given size, for use in ``cache_stores``."""
+        return lambda: cls(maxsize)
+
+    def __getitem__(self, key: int) -> V:
+        value = self._data[key]
+        self._data.move_to_end(key)
+        return value
+
+    def __setitem__(self, key: int, value: V) -> None:
+        data = self._data
+        data[key] = value
+        data.move_to_end(key)
+        if len(data) > self.maxsize:
+            evicted_key, evicted = data.popitem(last=False)
+            if self.on_evict is not None:
+                self.on_evict(evicted_key, evicted)
+
+    def __delitem__(self, key: int) -> None:
+        del self._data[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._data)
+
+    # iterating must not reorder the entities, which the inherited views
+    # would do by going through __getitem__
+    def keys(self) -> KeysView[int]:
+        return self._data.keys()
+
+    def values(self) -> ValuesView[V]:
+        return self._data.values()
+
+    def items(self) -> ItemsView[int, V]:
+        return self._data.items()
+
+    def get(self, key: int, default: Optional[Any] = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __repr__(self) -> str:
+        return f"<LRUCacheStore maxsize={self.maxsize} size={len(self._data)}>"
@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import functools
 import logging
+import os
 import signal
 import sys
 import traceback
@@ -13,11 +15,13 @@ from typing import (
     Any,
     AsyncIterator,
     Callable,
+    ContextManager,
     Coroutine,
     Dict,
     Generator,
     Iterable,
     List,
+    Literal,
     Optional,
     Sequence,
     Set,
@@ -47,20 +51,24 @@ from .enums import (
     ApplicationCommandType,
     ChannelType,
     InteractionType,
+    RequestPriority,
     Status,
     VoiceRegion,
 )
 from .errors import *
+from .executor import EventExecutor
 from .flags import ApplicationFlags, Intents
 from .gateway import *
+from .gateway import GATEWAY_INFLATERS, HAS_ZSTD
 from .guild import Guild
 from .guild_preview import GuildPreview
-from .http import HTTPClient
+from .http import HTTPClient, RequestQueueStats, RouteCacheStats
 from .interactions import Interaction
 from .invite import Invite
 from .iterators import guild_iterator
 from .mentions import AllowedMentions
 from .object import Object
+from .session import SessionStore, ShardSession, _create_snapshot, _restore_snapshot
 from .stage_instance import StageInstance
 from .state import ConnectionState
 from .sticker import GuildSticker, StandardSticker, StickerPack, _sticker_factory
@@ -81,6 +89,7 @@ if TYPE_CHECKING:
     from .abc import GuildChannel, PrivateChannel, Snowflake, SnowflakeTime
     from .application_command import ClientCog, SlashApplicationSubcommand
     from .asset import Asset
+    from .cache import CacheStoreFactory
     from .channel import DMChannel
     from .enums import IntegrationType, InteractionContextType, Locale
     from .file import File
@@ -88,8 +97,11 @@ if TYPE_CHECKING:
     from .member import Member
     from .message import Attachment, Message
     from .permissions import Permissions
+    from .raw_models import RawReactionActionEvent
+    from .reaction import Reaction
     from .scheduled_events import ScheduledEvent
     from .types.checks import CoroFunc
+    from .types.guild import Guild as GuildPayload
     from .types.interactions import ApplicationCommand as ApplicationCommandPayload
     from .voice_client import VoiceProtocol
 
@@ -101,6 +113,50 @@ InterT = TypeVar("InterT", bound="Interaction")
 
 _log = logging.getLogger(__name__)
 
+WaitForKeys = Tuple[Optional[int], Optional[int], Optional[int]]
+
+# the (message ID, channel ID, user ID) of the events wait_for can be keyed by
+_WAIT_FOR_KEY_NAMES: Tuple[str, str, str] = ("message_id", "channel_id", "user_id")
+
+
+def _message_keys(message: Message) -> WaitForKeys:
+    return message.id, message.channel.id, message.author.id
+
+
+def _reaction_keys(reaction: Reaction, user: Union[Member, User]) -> WaitForKeys:
+    return reaction.message.id, reaction.message.channel.id, user.id
+
+
+def _raw_reaction_keys(payload: RawReactionActionEvent) -> WaitForKeys:
+    return payload.message_id, payload.channel_id, payload.user_id
+
+
+def _interaction_keys(interaction: Interaction) -> WaitForKeys:
+    message = interaction.message
+    user = interaction.user
+    return (
+        None if message is None else message.id,
+        interaction.channel_id,
+        None if user is None else user.id,
+    )
+
+
+async def _raise_inline_error(exc: Exception, *_args: Any, **_kwargs: Any) -> None:
+    raise exc
+
+
+_WAIT_FOR_KEYS: Dict[str, Callable[..., WaitForKeys]] = {
+    "message": _message_keys,
+    "message_delete": _message_keys,
+    "message_edit": lambda _before, after: _message_keys(after),
+    "reaction_add": _reaction_keys,
+    "reaction_remove": _reaction_keys,
+    "raw_reaction_add": _raw_reaction_keys,
+    "raw_reaction_remove": _raw_reaction_keys,
+    "typing": lambda channel, user, _when: (None, channel.id, user.id),
+    "interaction": _interaction_keys,
+}
+
 
 def _cancel_tasks(loop: asyncio.AbstractEventLoop) -> None:
     tasks = {t for t in asyncio.all_tasks(loop=loop) if not t.done()}
@@ -268,6 +324,82 @@ class Client:
         Defaults to ``None``.
 
         .. versionadded:: 2.3
+    cache_stores: Optional[Dict[:class:`str`, Callable[[], :class:`CacheStore`]]]
+        A mapping of entity types in :data:`CACHE_ENTITIES` to factories creating the
+        :class:`CacheStore` used to cache them, such as :meth:`LRUCacheStore.factory`.
+        Entity types that are not given use a plain :class:`dict`. Per-guild stores
+        (``members``, ``channels`` and ``threads``) are created once for every guild.
+
+        .. versionadded:: 3.2
+    gateway_compression: :class:`str`
+        The transport compression to use for the gateway connection, either
+        ``zlib-stream`` (the default) or ``zstd-stream``. The latter requires
+        Python 3.14+ or the ``zstandard`` package to be installed.
+
+        .. versionadded:: 3.2
+    skip_unused_events: :class:`bool`
+        Whether to skip parsing gateway events that nothing listens to, either through
+        an event handler, :meth:`add_listener` or :meth:`wait_for`. This only affects events
+        that do not keep the cache up to date, such as typing, invites and integrations,
+        along with message and reaction events when the message cache is disabled.
+        Defaults to ``False``.
+
+        .. versionadded:: 3.2
+    coalesce_get_requests: :class:`bool`
+        Whether identical ``GET`` requests (same route, query parameters and authorization)
+        made while one is already in flight should share its response instead of being
+        sent again. Defaults to ``False``.
+
+        .. versionadded:: 3.2
+    get_cache_ttls: Optional[Dict[:class:`str`, :class:`float`]]
+        A mapping of route paths, such as ``"/channels/{channel_id}/messages/{message_id}"``,
+        to the amount of seconds successful ``GET`` responses of that route are cached for.
+        Requests to these routes are also coalesced. Hit and miss counts are available in
+        :attr:`route_cache_stats`.
+
+        .. versionadded:: 3.2
+    session_store: Optional[:class:`SessionStore`]
+        Where to save the gateway session of every shard when the client is closed,
+        such as a :class:`FileSessionStore`. On the next start, saved sessions are
+        resumed instead of identifying again, skipping the ``GUILD_CREATE`` events
+        of every guild. Resumed sessions dispatch :func:`on_ready` once they have
+        resumed. Defaults to ``None``.
+
+        .. note::
+
+            To keep the session alive, :meth:`close` disconnects without the normal
+            close code while a session store is set.
+
+        .. versionadded:: 3.2
+    cache_snapshot: :class:`bool`
+        Whether to also save the cached guilds, channels and roles along with the
+        client's own members to the ``session_store``, and restore them before resuming.
+        Without it, the cache stays empty after resuming until the guilds are updated.
+        Defaults to ``False``.
+
+        .. versionadded:: 3.2
+    shared_heartbeat: :class:`bool`
+        Whether to send the gateway heartbeats of every shard from a single task
+        instead of starting a thread per shard. Useful for processes running many shards.
+        Defaults to ``False``.
+
+        .. versionadded:: 3.2
+    event_executor: Optional[:class:`EventExecutor`]
+        Limits how many event handlers run at once, queueing or dropping the others.
+        Defaults to ``None``, where every event handler runs in a task of its own right away.
+
+        .. versionadded:: 3.2
+    gateway_stats: :class:`bool`
+        Whether to count the traffic of the gateway connection of every shard, see
+        :meth:`gateway_stats`. Defaults to ``False``.
+
+        .. versionadded:: 3.2
+    gateway_stats_interval: Optional[:class:`float`]
+        The interval in seconds at which :func:`on_gateway_stats` is dispatched for
+        every shard when ``gateway_stats`` is enabled. Defaults to ``None``, which
+        doesn't dispatch it.
+
+        .. versionadded:: 3.2
 
     Attributes
     ----------
@@ -305,6 +437,17 @@ class Client:
         rollout_update_known: bool = True,
         rollout_all_guilds: bool = False,
         default_guild_ids: Optional[List[int]] = None,
+        cache_stores: Optional[Dict[str, CacheStoreFactory]] = None,
+        gateway_compression: Literal["zlib-stream", "zstd-stream"] = "zlib-stream",
+        skip_unused_events: bool = False,
+        coalesce_get_requests: bool = False,
+        get_cache_ttls: Optional[Dict[str, float]] = None,
+        session_store: Optional[SessionStore] = None,
+        cache_snapshot: bool = False,
+        shared_heartbeat: bool = False,
+        event_executor: Optional[EventExecutor] = None,
+        gateway_stats: bool = False,
+        gateway_stats_interval: Optional[float] = None,
     ) -> None:
         # self.ws is set in the connect method
         self.ws: DiscordWebSocket = None  # type: ignore
@@ -314,7 +457,17 @@ class Client:
             self.loop = asyncio.new_event_loop()
         asyncio.set_event_loop(self.loop)
         self._listeners: Dict[str, List[Tuple[asyncio.Future, Callable[..., bool]]]] = {}
+        # wait_for calls keyed by a (key name, ID) pair, so only the matching ones are checked
+        self._keyed_listeners: Dict[
+            str, Dict[Tuple[str, int], List[Tuple[asyncio.Future, Callable[..., bool]]]]
+        ] = {}
         self.extra_events: Dict[str, List[CoroFunc]] = {}
+        self._inline_events: Dict[str, List[Callable[..., Any]]] = {}
+        # event name -> (method name, coroutine handlers, inline handlers, handler set on
+        # the instance), compiled on first dispatch and cleared whenever the handlers change
+        self._dispatch_table: Dict[
+            str, Tuple[str, Tuple[CoroFunc, ...], Tuple[Callable[..., Any], ...], Any]
+        ] = {}
 
         self.shard_id: Optional[int] = shard_id
         self.shard_count: Optional[int] = shard_count
@@ -325,6 +478,8 @@ class Client:
             proxy_auth=proxy_auth,
             assume_unsync_clock=assume_unsync_clock,
             dispatch=self.dispatch,
+            coalesce_get_requests=coalesce_get_requests,
+            get_cache_ttls=get_cache_ttls,
         )
 
         self._handlers: Dict[str, Callable] = {"ready": self._handle_ready}
@@ -332,6 +487,26 @@ class Client:
         self._hooks: Dict[str, Callable] = {"before_identify": self._call_before_identify_hook}
 
         self._enable_debug_events: bool = enable_debug_events
+        self._session_store: Optional[SessionStore] = session_store
+        self._cache_snapshot: bool = cache_snapshot
+        self._heartbeat_scheduler: Optional[HeartbeatScheduler] = (
+            HeartbeatScheduler() if shared_heartbeat else None
+        )
+        self._event_executor: Optional[EventExecutor] = event_executor
+        self._gateway_stats: Optional[Dict[Optional[int], GatewayStats]] = (
+            {} if gateway_stats else None
+        )
+        self._gateway_stats_interval: Optional[float] = gateway_stats_interval
+        self._gateway_stats_task: Optional[asyncio.Task] = None
+
+        if gateway_compression not in GATEWAY_INFLATERS:
+            raise ValueError(
+                f"gateway_compression must be one of {', '.join(GATEWAY_INFLATERS)}, "
+                f"not {gateway_compression!r}"
+            )
+        if gateway_compression == "zstd-stream" and not HAS_ZSTD:
+            raise RuntimeError("zstd-stream compression requires Python 3.14+ or zstandard")
+        self._gateway_compression: str = gateway_compression
 
         self._connection: ConnectionState = self._get_state(
             max_messages=max_messages,
@@ -344,6 +519,8 @@ class Client:
             intents=intents,
             chunk_guilds_at_startup=chunk_guilds_at_startup,
             member_cache_flags=member_cache_flags,
+            cache_stores=cache_stores,
+            skip_unused_events=skip_unused_events,
         )
 
         self._connection.shard_count = self.shard_count
@@ -391,6 +568,8 @@ class Client:
         intents: Intents,
         chunk_guilds_at_startup: bool,
         member_cache_flags: MemberCacheFlags,
+        cache_stores: Optional[Dict[str, CacheStoreFactory]],
+        skip_unused_events: bool,
     ) -> ConnectionState:
         return ConnectionState(
             dispatch=self.dispatch,
@@ -408,6 +587,8 @@ class Client:
             intents=intents,
             chunk_guilds_at_startup=chunk_guilds_at_startup,
             member_cache_flags=member_cache_flags,
+            cache_stores=cache_stores,
+            skip_unused_events=skip_unused_events,
         )
 
     def _handle_ready(self) -> None:
@@ -434,6 +615,96 @@ class Client:
             return self.ws.is_ratelimited()
         return False
 
+    def gateway_stats(self) -> Dict[Optional[int], Dict[str, Any]]:
+        """Returns a snapshot of the counters about the gateway traffic of every shard,
+        by shard ID. The shard ID is ``None`` for clients that are not sharded.
+
+        This is empty unless ``gateway_stats`` is enabled. Every snapshot has these keys:
+
+        - ``frames_received``: The amount of websocket frames received.
+        - ``bytes_received``: The amount of bytes received, before decompressing.
+        - ``bytes_decompressed``: The amount of bytes received, after decompressing.
+        - ``decompress_time``: The seconds spent decompressing frames.
+        - ``decode_time``: The seconds spent decoding the JSON of payloads.
+        - ``events``: The amount of events received, by event type such as ``MESSAGE_CREATE``.
+        - ``parse_time``: The seconds spent parsing events, by event type.
+        - ``payloads_sent``: The amount of payloads sent, including heartbeats.
+        - ``bytes_sent``: The amount of bytes sent.
+        - ``ratelimit_wait``: The seconds spent waiting for the gateway rate limit.
+
+        The counters are kept across reconnects.
+
+        .. versionadded:: 3.2
+
+        Returns
+        -------
+        Dict[Optional[:class:`int`], Dict[:class:`str`, Any]]
+            The snapshots of every shard.
+        """
+        if self._gateway_stats is None:
+            return {}
+
+        return {shard_id: stats.to_dict() for shard_id, stats in self._gateway_stats.items()}
+
+    def _start_gateway_stats(self) -> None:
+        if self._gateway_stats_interval is None or self._gateway_stats_task is not None:
+            return
+
+        self._gateway_stats_task = asyncio.create_task(
+            self._dispatch_gateway_stats(self._gateway_stats_interval),
+            name="nextcord: gateway stats",
+        )
+
+    def _stop_gateway_stats(self) -> None:
+        if self._gateway_stats_task is not None:
+            self._gateway_stats_task.cancel()
+            self._gateway_stats_task = None
+
+    async def _dispatch_gateway_stats(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            for shard_id, stats in self.gateway_stats().items():
+                self.dispatch("gateway_stats", shard_id, stats)
+
+    def request_priority(self, priority: RequestPriority) -> ContextManager[None]:
+        """Returns a context manager setting the :class:`.RequestPriority` of every request made
+        within it, including in tasks created within it.
+
+        When the global rate limit is saturated, waiting requests are admitted with weighted fair
+        queuing, so for example a mass role assignment made with :attr:`.RequestPriority.bulk` does
+        not delay interaction responses.
+
+        .. versionadded:: 3.2
+
+        Example
+        -------
+
+        .. code-block:: python3
+
+            with client.request_priority(nextcord.RequestPriority.bulk):
+                for member in guild.members:
+                    await member.add_roles(role)
+        """
+        return self.http.request_priority(priority)
+
+    @property
+    def route_cache_stats(self) -> Dict[str, RouteCacheStats]:
+        """Dict[:class:`str`, :class:`~nextcord.http.RouteCacheStats`]: The coalescing and response cache
+        statistics of every route path that had a coalesced ``GET`` request.
+
+        .. versionadded:: 3.2
+        """
+        return self.http.route_cache_stats
+
+    @property
+    def request_queue_stats(self) -> Dict[RequestPriority, RequestQueueStats]:
+        """Dict[:class:`.RequestPriority`, :class:`~nextcord.http.RequestQueueStats`]: A snapshot of the
+        global rate limit queue depth and wait times of every request priority.
+
+        .. versionadded:: 3.2
+        """
+        return self.http.get_request_queue_stats()
+
     @property
     def user(self) -> Optional[ClientUser]:
         """Optional[:class:`.ClientUser`]: Represents the connected client. ``None`` if not logged in."""
@@ -537,52 +808,117 @@ class Client:
         event_name: str,
         *args: Any,
         **kwargs: Any,
-    ) -> asyncio.Task:
+    ) -> Optional[asyncio.Task]:
         wrapped = self._run_event(coro, event_name, *args, **kwargs)
+        if self._event_executor is not None:
+            return self._event_executor.submit(event_name, wrapped)
+
         # Schedules the task
         return asyncio.create_task(wrapped, name=f"nextcord: {event_name}")
 
+    def _get_handlers(
+        self, event: str
+    ) -> Tuple[str, Tuple[CoroFunc, ...], Tuple[Callable[..., Any], ...], Any]:
+        entry = self._dispatch_table.get(event)
+        # handlers assigned to the instance directly rather than through event()
+        # are noticed by comparing with the one the entry was compiled with
+        if entry is not None and self.__dict__.get(entry[0]) is entry[3]:
+            return entry
+
+        method = "on_" + event
+        handlers = list(self.extra_events.get(method, ()))
+        with contextlib.suppress(AttributeError):
+            handlers.insert(0, getattr(self, method))
+
+        entry = (
+            method,
+            tuple(handlers),
+            tuple(self._inline_events.get(method, ())),
+            self.__dict__.get(method),
+        )
+        self._dispatch_table[event] = entry
+        return entry
+
+    def _has_listeners(self, event: str) -> bool:
+        _, handlers, inline, _ = self._get_handlers(event)
+        return bool(
+            self._listeners.get(event) or self._keyed_listeners.get(event) or handlers or inline
+        )
+
+    @staticmethod
+    def _resolve_listeners(
+        listeners: List[Tuple[asyncio.Future, Callable[..., bool]]], args: Tuple[Any, ...]
+    ) -> bool:
+        # returns whether every listener was removed
+        removed = []
+        for i, (future, condition) in enumerate(listeners):
+            if future.cancelled():
+                removed.append(i)
+                continue
+
+            try:
+                result = condition(*args)
+            except Exception as exc:
+                future.set_exception(exc)
+                removed.append(i)
+            else:
+                if result:
+                    if len(args) == 0:
+                        future.set_result(None)
+                    elif len(args) == 1:
+                        future.set_result(args[0])
+                    else:
+                        future.set_result(args)
+                    removed.append(i)
+
+        if len(removed) == len(listeners):
+            return True
+
+        for idx in reversed(removed):
+            del listeners[idx]
+        return False
+
+    def _discard_keyed_listener(
+        self, event: str, key: Tuple[str, int], future: asyncio.Future
+    ) -> None:
+        keyed = self._keyed_listeners.get(event)
+        listeners = keyed and keyed.get(key)
+        if not listeners:
+            return
+
+        listeners[:] = [entry for entry in listeners if entry[0] is not future]
+        if not listeners:
+            del keyed[key]  # type: ignore
+            if not keyed:
+                del self._keyed_listeners[event]
+
     def dispatch(self, event: str, *args: Any, **kwargs: Any) -> None:
         _log.debug("Dispatching event %s", event)
-        method = "on_" + event
+        method, handlers, inline, _ = self._get_handlers(event)
 
         listeners = self._listeners.get(event)
-        if listeners:
-            removed = []
-            for i, (future, condition) in enumerate(listeners):
-                if future.cancelled():
-                    removed.append(i)
-                    continue
+        if listeners and self._resolve_listeners(listeners, args):
+            self._listeners.pop(event)
 
-                try:
-                    result = condition(*args)
-                except Exception as exc:
-                    future.set_exception(exc)
-                    removed.append(i)
-                else:
-                    if result:
-                        if len(args) == 0:
-                            future.set_result(None)
-                        elif len(args) == 1:
-                            future.set_result(args[0])
-                        else:
-                            future.set_result(args)
-                        removed.append(i)
-
-            if len(removed) == len(listeners):
-                self._listeners.pop(event)
-            else:
-                for idx in reversed(removed):
-                    del listeners[idx]
+        keyed = self._keyed_listeners.get(event)
+        if keyed:
+            for key in zip(_WAIT_FOR_KEY_NAMES, _WAIT_FOR_KEYS[event](*args), strict=True):
+                listeners = keyed.get(key)  # type: ignore
+                if listeners and self._resolve_listeners(listeners, args):
+                    del keyed[key]  # type: ignore
 
-        try:
-            coro = getattr(self, method)
-        except AttributeError:
-            pass
-        else:
-            self._schedule_event(coro, method, *args, **kwargs)
+            if not keyed:
+                self._keyed_listeners.pop(event)
+
+        for func in inline:
+            try:
+                func(*args, **kwargs)
+            except Exception as exc:
+                # reported the same way as errors of coroutine handlers
+                raise_error = functools.partial(_raise_inline_error, exc)
+                self._schedule_event(raise_error, method, *args, **kwargs)
 
-        for coro in self.extra_events.get(method, []):
+        for coro in handlers:
             self._schedule_event(coro, method, *args, **kwargs)
 
     async def on_error(self, event_method: str, *args: Any, **kwargs: Any) -> None:
@@ -724,6 +1060,15 @@ class Client:
             "initial": True,
             "shard_id": self.shard_id,
         }
+        sessions = self._load_stored_sessions([self.shard_id])
+        if (session := sessions.get(self.shard_id)) is not None:
+            ws_params.update(
+                sequence=session.sequence,
+                gateway=session.resume_url,
+                resume=True,
+                session=session.session_id,
+            )
+
         while not self.is_closed():
             try:
                 coro = DiscordWebSocket.from_client(self, format_gateway=True, **ws_params)
@@ -817,6 +1162,11 @@ class Client:
 
         self._closed = True
 
+        # queued handlers are dropped so they don't outlive the client, while
+        # the close handlers still get to run
+        if self._event_executor is not None:
+            self._event_executor.clear()
+
         self.dispatch("close")
 
         for voice in self.voice_clients:
@@ -824,12 +1174,58 @@ class Client:
             with contextlib.suppress(Exception):
                 await voice.disconnect(force=True)
 
+        self._stop_gateway_stats()
         if self.ws is not None and self.ws.open:  # pyright: ignore
-            await self.ws.close(code=1000)
+            code = 4000 if self._store_sessions([self.ws]) else 1000
+            await self.ws.close(code=code)
 
         await self.http.close()
         self._ready.clear()
 
+    def _load_stored_sessions(
+        self, shard_ids: Iterable[Optional[int]]
+    ) -> Dict[Optional[int], ShardSession]:
+        store = self._session_store
+        if store is None:
+            return {}
+
+        sessions: Dict[Optional[int], ShardSession] = {}
+        for shard_id in shard_ids:
+            session = store.load_session(shard_id)
+            # a session is only resumed once, a crash afterwards shouldn't try it again
+            store.delete_session(shard_id)
+            if session is not None:
+                sessions[shard_id] = session
+
+        if not sessions:
+            return sessions
+
+        _log.info("Resuming %s stored gateway sessions.", len(sessions))
+        if self._cache_snapshot and (snapshot := store.load_snapshot()) is not None:
+            count = _restore_snapshot(self._connection, snapshot)
+            _log.debug("Restored %s guilds from the cache snapshot.", count)
+
+        self._connection._restored_sessions.update(sessions)
+        return sessions
+
+    def _store_sessions(self, websockets: Iterable[DiscordWebSocket]) -> bool:
+        store = self._session_store
+        if store is None:
+            return False
+
+        stored = False
+        for ws in websockets:
+            if ws.session_id is None:
+                continue
+
+            store.save_session(ws.shard_id, ShardSession(ws.session_id, ws.sequence, ws.resume_url))
+            stored = True
+
+        if stored and self._cache_snapshot:
+            store.save_snapshot(_create_snapshot(self._connection))
+
+        return stored
+
     async def clear(self) -> None:
         """Clears the internal state of the bot.
 
@@ -1177,6 +1573,9 @@ class Client:
         *,
         check: Optional[Callable[..., bool]] = None,
         timeout: Optional[float] = None,
+        message_id: Optional[int] = None,
+        channel_id: Optional[int] = None,
+        user_id: Optional[int] = None,
     ) -> Any:
         """|coro|
 
@@ -1245,11 +1644,33 @@ class Client:
         timeout: Optional[:class:`float`]
             The number of seconds to wait before timing out and raising
             :exc:`asyncio.TimeoutError`.
+        message_id: Optional[:class:`int`]
+            Only wait for events about the message with this ID. Unlike a ``check``
+            comparing IDs, the ``check`` of keyed waits is only called for events
+            with a matching ID, which keeps dispatching fast when many waits are pending.
+
+            Keys are supported for the ``message``, ``message_edit``, ``message_delete``,
+            ``reaction_add``, ``reaction_remove``, ``raw_reaction_add``, ``raw_reaction_remove``,
+            ``typing`` and ``interaction`` events.
+
+            .. versionadded:: 3.2
+        channel_id: Optional[:class:`int`]
+            Only wait for events happening in the channel with this ID.
+            See ``message_id`` for the supported events.
+
+            .. versionadded:: 3.2
+        user_id: Optional[:class:`int`]
+            Only wait for events caused by the user with this ID.
+            See ``message_id`` for the supported events.
+
+            .. versionadded:: 3.2
 
         Raises
         ------
         asyncio.TimeoutError
             If a timeout is provided and it was reached.
+        ValueError
+            A key was given for an event that does not support them.
 
         Returns
         -------
@@ -1268,6 +1689,38 @@ class Client:
             check = _check
 
         ev = event.lower()
+        keys = (message_id, channel_id, user_id)
+        if any(key is not None for key in keys):
+            try:
+                get_keys = _WAIT_FOR_KEYS[ev]
+            except KeyError:
+                raise ValueError(
+                    f"wait_for does not support keys for the {event!r} event"
+                ) from None
+
+            if sum(key is not None for key in keys) > 1:
+                # only indexed by the first key, the others are checked along with the predicate
+                inner_check = check
+
+                def check(*args) -> bool:
+                    matches = all(
+                        key is None or key == found
+                        for key, found in zip(keys, get_keys(*args), strict=True)
+                    )
+                    return matches and inner_check(*args)
+
+            key = next(
+                (name, value)
+                for name, value in zip(_WAIT_FOR_KEY_NAMES, keys, strict=True)
+                if value is not None
+            )
+            self._keyed_listeners.setdefault(ev, {}).setdefault(key, []).append((future, check))
+            # waits that time out would otherwise stay around until an event with the key comes
+            future.add_done_callback(
+                lambda f: f.cancelled() and self._discard_keyed_listener(ev, key, f)
+            )
+            return asyncio.wait_for(future, timeout)
+
         try:
             listeners = self._listeners[ev]
         except KeyError:
@@ -1305,10 +1758,11 @@ class Client:
             raise TypeError("event registered must be a coroutine function")
 
         setattr(self, coro.__name__, coro)
+        self._dispatch_table.pop(coro.__name__.removeprefix("on_"), None)
         _log.debug("%s has successfully been registered as an event", coro.__name__)
         return coro
 
-    def add_listener(self, func: CoroFunc, name: str = MISSING) -> None:
+    def add_listener(self, func: CoroFunc, name: str = MISSING, *, inline: bool = False) -> None:
         """The non decorator alternative to :meth:`.listen`.
 
         .. versionadded:: 3.0
@@ -1319,6 +1773,14 @@ class Client:
             The function to call.
         name: :class:`str`
             The name of the event to listen for. Defaults to ``func.__name__``.
+        inline: :class:`bool`
+            Whether ``func`` is a regular function to call directly while the event
+            is dispatched, instead of a coroutine running in a task of its own.
+            Inline listeners must be quick and must not block, as they hold up the
+            processing of every following gateway event. Errors are still passed to
+            :meth:`on_error`.
+
+            .. versionadded:: 3.2
 
         Example
         -------
@@ -1334,6 +1796,14 @@ class Client:
         """
         name = func.__name__ if name is MISSING else name
 
+        if inline:
+            if asyncio.iscoroutinefunction(func) or not callable(func):
+                raise TypeError("Inline listeners must be regular functions")
+
+            self._inline_events.setdefault(name, []).append(func)
+            self._dispatch_table.clear()
+            return
+
         if not asyncio.iscoroutinefunction(func):
             raise TypeError("Listeners must be coroutines")
 
@@ -1341,6 +1811,7 @@ class Client:
             self.extra_events[name].append(func)
         else:
             self.extra_events[name] = [func]
+        self._dispatch_table.clear()
 
     def remove_listener(self, func: CoroFunc, name: str = MISSING) -> None:
         """Removes a listener from the pool of listeners.
@@ -1362,7 +1833,12 @@ class Client:
             with contextlib.suppress(ValueError):
                 self.extra_events[name].remove(func)
 
-    def listen(self, name: str = MISSING) -> Callable[[Coro], Coro]:
+        if name in self._inline_events:
+            with contextlib.suppress(ValueError):
+                self._inline_events[name].remove(func)
+        self._dispatch_table.clear()
+
+    def listen(self, name: str = MISSING, *, inline: bool = False) -> Callable[[Coro], Coro]:
         """A decorator that registers another function as an external
         event listener. Basically this allows you to listen to multiple
         events from different places e.g. such as :func:`.on_ready`
@@ -1388,14 +1864,23 @@ class Client:
 
         Would print one and two in an unspecified order.
 
+        Regular functions can be listened to with ``inline=True``, see :meth:`add_listener`. ::
+
+            @client.listen('on_member_join', inline=True)
+            def count_join(member):
+                joins[member.guild.id] += 1
+
+        .. versionchanged:: 3.2
+            Added the ``inline`` parameter.
+
         Raises
         ------
         TypeError
-            The function being listened to is not a coroutine.
+            The function being listened to is not a coroutine, or is one while ``inline`` is ``True``.
         """
 
         def decorator(func: Coro) -> Coro:
-            self.add_listener(func, name)
+            self.add_listener(func, name, inline=inline)
             return func
 
         return decorator
@@ -1460,6 +1945,30 @@ class Client:
 
     # Guild stuff
 
+    @overload
+    def fetch_guilds(
+        self,
+        *,
+        limit: Optional[int] = ...,
+        with_counts: bool = ...,
+        before: Optional[SnowflakeTime] = ...,
+        after: Optional[SnowflakeTime] = ...,
+        prefetch: int = ...,
+        raw: Literal[False] = ...,
+    ) -> AsyncIterator[Guild]: ...
+
+    @overload
+    def fetch_guilds(
+        self,
+        *,
+        limit: Optional[int] = ...,
+        with_counts: bool = ...,
+        before: Optional[SnowflakeTime] = ...,
+        after: Optional[SnowflakeTime] = ...,
+        prefetch: int = ...,
+        raw: Literal[True],
+    ) -> AsyncIterator[GuildPayload]: ...
+
     def fetch_guilds(
         self,
         *,
@@ -1467,7 +1976,9 @@ class Client:
         with_counts: bool = False,
         before: Optional[SnowflakeTime] = None,
         after: Optional[SnowflakeTime] = None,
-    ) -> AsyncIterator[Guild]:
+        prefetch: int = 0,
+        raw: bool = False,
+    ) -> Union[AsyncIterator[Guild], AsyncIterator[GuildPayload]]:
         """|asynciter|
 
         Returns an async iterator that enables receiving your guilds.
@@ -1514,6 +2025,17 @@ class Client:
             Retrieve guilds after this date or object.
             If a datetime is provided, it is recommended to use a UTC aware datetime.
             If the datetime is naive, it is assumed to be local time.
+        prefetch: :class:`int`
+            The number of pages to request ahead of the guilds being consumed, so that
+            fetching the next page overlaps with processing the current one.
+            Defaults to ``0``, which only requests a page once the previous one was consumed.
+
+            .. versionadded:: 3.2
+        raw: :class:`bool`
+            Whether to yield the raw guild payloads as :class:`dict` instead of
+            building :class:`.Guild` objects. Defaults to ``False``.
+
+            .. versionadded:: 3.2
 
         Raises
         ------
@@ -1526,7 +2048,13 @@ class Client:
             The guild with the guild data parsed.
         """
         return guild_iterator(
-            self, limit=limit, before=before, after=after, with_counts=with_counts
+            self,
+            limit=limit,
+            before=before,
+            after=after,
+            with_counts=with_counts,
+            prefetch=prefetch,
+            raw=raw,
         )
 
     async def fetch_template(self, code: Union[Template, str]) -> Template:
@@ -2393,6 +2921,9 @@ class Client:
         update_known: bool = True,
         register_new: bool = True,
         ignore_forbidden: bool = True,
+        max_concurrency: int = 5,
+        bulk_overwrite: bool = False,
+        cache_path: Optional[Union[str, os.PathLike[str]]] = None,
     ) -> None:
         """|coro|
 
@@ -2431,6 +2962,25 @@ class Client:
             If this command should suppress a :class:`errors.Forbidden` exception when the bot encounters a guild
             where it doesn't have permissions to view application commands.
             Defaults to ``True``
+        max_concurrency: :class:`int`
+            The maximum number of guilds (counting global commands as one) fetched and synced at the same time.
+            Defaults to ``5``
+
+            .. versionadded:: 3.2
+        bulk_overwrite: :class:`bool`
+            If the commands of each guild should be replaced with a single bulk overwrite request instead of comparing
+            them with what Discord has, see :meth:`bulk_overwrite_application_commands`. This ignores ``data``,
+            ``associate_known``, ``delete_unknown``, ``update_known`` and ``register_new``.
+            Defaults to ``False``
+
+            .. versionadded:: 3.2
+        cache_path: Optional[Union[:class:`str`, :class:`os.PathLike`]]
+            Path to a JSON file storing a hash of the commands last synced to every guild, along with their IDs.
+            Guilds whose local commands hash the same as last time are associated from the file without any request.
+            Only complete syncs, where commands are deleted, updated and registered as needed, are stored.
+            Changes made to the commands on Discord by other means are not detected. Defaults to ``None``
+
+            .. versionadded:: 3.2
         """
         # All this does is passthrough to connection state. All documentation updates should also be updated
         # there, and vice versa.
@@ -2442,6 +2992,35 @@ class Client:
             update_known=update_known,
             register_new=register_new,
             ignore_forbidden=ignore_forbidden,
+            max_concurrency=max_concurrency,
+            bulk_overwrite=bulk_overwrite,
+            cache_path=cache_path,
+        )
+
+    async def bulk_overwrite_application_commands(
+        self, guild_id: Optional[int] = None, *, use_rollout: bool = True
+    ) -> None:
+        """|coro|
+        Replaces every application command Discord has for the given guild ID, or the global commands if ``None``,
+        with the locally added ones in a single request, then associates the local commands with the response.
+
+        Commands on Discord that aren't added locally are deleted. Commands that keep their name and type keep their
+        ID.
+
+        .. versionadded:: 3.2
+
+        Parameters
+        ----------
+        guild_id: Optional[:class:`int`]
+            ID of the guild to overwrite the application commands of. If set to ``None``, global commands are
+            overwritten instead. Defaults to ``None``.
+        use_rollout: :class:`bool`
+            If the rollout guild IDs of commands should be used. Defaults to ``True``.
+        """
+        # All this does is passthrough to connection state. All documentation updates should also be updated
+        # there, and vice versa.
+        await self._connection.bulk_overwrite_application_commands(
+            guild_id, use_rollout=use_rollout
         )
 
     async def sync_application_commands(
@@ -0,0 +1,517 @@
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import functools
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Dict, List, Optional, Set, Tuple
+
+from .backoff import ExponentialBackoff
+from .client import Client
+from .http import HTTPClient
+from .shard import AutoShardedClient, SessionStartLimits
+from .utils import MISSING
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+    from multiprocessing.process import BaseProcess
+
+    from .activity import BaseActivity
+    from .enums import Status
+
+__all__ = ("ShardCluster",)
+
+_log = logging.getLogger(__name__)
+
+
+class ClusterOp:
+    # worker -> coordinator
+    identify = "identify"
+    stats = "stats"
+    # coordinator -> worker
+    identify_ack = "identify_ack"
+    presence = "presence"
+    close = "close"
+
+
+def _task_done(tasks: Set[asyncio.Task[Any]], task: asyncio.Task[Any]) -> None:
+    tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        _log.error("Cluster task %s failed.", task.get_name(), exc_info=task.exception())
+
+
+def _spawn(tasks: Set[asyncio.Task[Any]], coro: Coroutine[Any, Any, Any], name: str) -> None:
+    # the tasks are kept referenced until they finish so they can't be garbage collected
+    task = asyncio.create_task(coro, name=name)
+    tasks.add(task)
+    task.add_done_callback(functools.partial(_task_done, tasks))
+
+
+def _start_reader(
+    conn: Connection, loop: asyncio.AbstractEventLoop, callback: Callable[[Any], None], name: str
+) -> threading.Thread:
+    # Connection.recv blocks, so it runs on its own thread and hands
+    # every message back to the event loop.
+    def reader() -> None:
+        while True:
+            try:
+                message = conn.recv()
+            except (EOFError, OSError):
+                message = None
+
+            try:
+                loop.call_soon_threadsafe(callback, message)
+            except RuntimeError:
+                # the loop is closed
+                return
+
+            if message is None:
+                return
+
+    thread = threading.Thread(target=reader, name=name, daemon=True)
+    thread.start()
+    return thread
+
+
+class _WorkerLink:
+    """The worker side of a :class:`ShardCluster`, attached to the worker's client."""
+
+    def __init__(
+        self, client: AutoShardedClient, conn: Connection, *, stats_interval: float
+    ) -> None:
+        self.client: AutoShardedClient = client
+        self.conn: Connection = conn
+        self.stats_interval: float = stats_interval
+        self._identify_waiters: Dict[int, asyncio.Future[None]] = {}
+        self._stats_task: Optional[asyncio.Task[None]] = None
+        self._tasks: Set[asyncio.Task[Any]] = set()
+
+    def install(self) -> None:
+        client = self.client
+        loop = asyncio.get_running_loop()
+        # IDENTIFYs are paced by the coordinator instead of each worker
+        client._hooks["before_identify"] = self.before_identify
+        _start_reader(self.conn, loop, self.handle, "nextcord-cluster-reader")
+        self._stats_task = loop.create_task(self.send_stats())
+
+    def send(self, *message: Any) -> None:
+        with contextlib.suppress(OSError):
+            self.conn.send(message)
+
+    async def before_identify(self, shard_id: Optional[int], *, initial: bool = False) -> None:
+        # shard_id is always set on an AutoShardedClient
+        shard_id = shard_id or 0
+        future = self._identify_waiters[shard_id] = asyncio.get_running_loop().create_future()
+        self.send(ClusterOp.identify, shard_id)
+        try:
+            await future
+        finally:
+            self._identify_waiters.pop(shard_id, None)
+
+        # only call the user hook if it was overridden, the default one
+        # would sleep on top of the coordinator's pacing
+        hook = self.client.before_identify_hook
+        if getattr(hook, "__func__", None) is not Client.before_identify_hook:
+            await hook(shard_id, initial=initial)
+
+    async def send_stats(self) -> None:
+        while True:
+            client = self.client
+            self.send(ClusterOp.stats, client.latencies, client.is_ws_ratelimited())
+            await asyncio.sleep(self.stats_interval)
+
+    def handle(self, message: Optional[Tuple[Any, ...]]) -> None:
+        if message is None:
+            # the coordinator went away
+            if not self.client.is_closed():
+                _spawn(self._tasks, self.client.close(), "nextcord-cluster: close")
+            return
+
+        op = message[0]
+        if op == ClusterOp.identify_ack:
+            future = self._identify_waiters.get(message[1])
+            if future is not None and not future.done():
+                future.set_result(None)
+        elif op == ClusterOp.presence:
+            _, activity, status, shard_id = message
+            _spawn(
+                self._tasks,
+                self.client.change_presence(activity=activity, status=status, shard_id=shard_id),
+                "nextcord-cluster: presence",
+            )
+        elif op == ClusterOp.close:
+            _spawn(self._tasks, self.client.close(), "nextcord-cluster: close")
+
+    def close(self) -> None:
+        if self._stats_task is not None:
+            self._stats_task.cancel()
+        with contextlib.suppress(OSError):
+            self.conn.close()
+
+
+async def _run_worker(
+    client_factory: Callable[..., AutoShardedClient],
+    token: str,
+    shard_ids: List[int],
+    shard_count: int,
+    conn: Connection,
+    stats_interval: float,
+) -> None:
+    client = client_factory(shard_ids=shard_ids, shard_count=shard_count)
+    if not isinstance(client, AutoShardedClient):
+        raise TypeError(
+            f"client_factory must return an AutoShardedClient, not {client.__class__.__name__}"
+        )
+
+    link = _WorkerLink(client, conn, stats_interval=stats_interval)
+    link.install()
+    try:
+        await client.start(token)
+    finally:
+        if not client.is_closed():
+            await client.close()
+        link.close()
+
+
+def _worker_main(
+    client_factory: Callable[..., AutoShardedClient],
+    token: str,
+    shard_ids: List[int],
+    shard_count: int,
+    conn: Connection,
+    stats_interval: float,
+) -> None:
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(
+            _run_worker(client_factory, token, shard_ids, shard_count, conn, stats_interval)
+        )
+
+
+class _ClusterWorker:
+    def __init__(self, worker_id: int, shard_ids: List[int]) -> None:
+        self.id: int = worker_id
+        self.shard_ids: List[int] = shard_ids
+        self.process: Optional[BaseProcess] = None
+        self.conn: Optional[Connection] = None
+        self.latencies: List[Tuple[int, float]] = []
+        self.ratelimited: bool = False
+        self.backoff: ExponentialBackoff = ExponentialBackoff()
+
+    def send(self, *message: Any) -> None:
+        if self.conn is None:
+            return
+        with contextlib.suppress(OSError):
+            self.conn.send(message)
+
+
+class ShardCluster:
+    """Runs the shards of a bot across multiple worker processes.
+
+    Each worker process runs its own :class:`AutoShardedClient` created by
+    ``client_factory`` with a contiguous range of ``shard_ids``, while this class
+    acts as the coordinator: it serializes IDENTIFYs across every worker
+    according to the bot's session start limits, aggregates the shard latencies
+    and rate limit state reported by the workers and routes presence changes to them.
+
+    Workers are started with the ``spawn`` start method, so ``client_factory``
+    has to be picklable, such as a function defined at the top level of a module.
+    It is called in the worker process with the ``shard_ids`` and ``shard_count``
+    keyword arguments and must return an :class:`AutoShardedClient`. Workers that
+    exit unexpectedly are restarted with an exponential backoff.
+
+    Example: ::
+
+        def create_bot(**kwargs):
+            bot = commands.AutoShardedBot(**kwargs)
+            bot.load_extension("cogs.moderation")
+            return bot
+
+        if __name__ == "__main__":
+            nextcord.ShardCluster(create_bot, processes=4).run(token)
+
+    .. versionadded:: 3.2
+
+    Parameters
+    ----------
+    client_factory: Callable[..., :class:`AutoShardedClient`]
+        Creates the client of a worker process.
+    processes: :class:`int`
+        The number of worker processes to run. Defaults to the number of CPUs.
+    shard_count: Optional[:class:`int`]
+        The total number of shards. If not given, the number recommended by the
+        Bot Gateway endpoint is used.
+    shard_ids: Optional[List[:class:`int`]]
+        The shard IDs to run across the workers. Defaults to every shard.
+    stats_interval: :class:`float`
+        How often, in seconds, workers report their latencies and rate limit state.
+        Defaults to ``5``.
+
+    Attributes
+    ----------
+    shard_count: Optional[:class:`int`]
+        The total number of shards. This is ``None`` until the cluster is started
+        if it was not passed.
+    shard_ids: Optional[List[:class:`int`]]
+        The shard IDs run across the workers.
+    """
+
+    def __init__(
+        self,
+        client_factory: Callable[..., AutoShardedClient],
+        *,
+        processes: int = MISSING,
+        shard_count: Optional[int] = None,
+        shard_ids: Optional[List[int]] = None,
+        stats_interval: float = 5.0,
+    ) -> None:
+        if processes is MISSING:
+            processes = os.cpu_count() or 1
+        if processes <= 0:
+            raise ValueError("processes must be greater than 0")
+        if shard_ids is not None and shard_count is None:
+            raise ValueError("When passing manual shard_ids, you must provide a shard_count.")
+
+        self.client_factory: Callable[..., AutoShardedClient] = client_factory
+        self.processes: int = processes
+        self.shard_count: Optional[int] = shard_count
+        self.shard_ids: Optional[List[int]] = shard_ids
+        self.stats_interval: float = stats_interval
+
+        self.http: HTTPClient = MISSING
+        self._token: Optional[str] = None
+        self._workers: List[_ClusterWorker] = []
+        self._closed: bool = False
+        self._session_start_limits: Optional[SessionStartLimits] = None
+        self._session_start_reset: float = 0.0
+        self._session_start_lock: asyncio.Lock = MISSING
+        self._identify_locks: Dict[int, asyncio.Lock] = {}
+        self._next_identify: Dict[int, float] = {}
+        self._tasks: Set[asyncio.Task[Any]] = set()
+
+    @property
+    def latency(self) -> float:
+        """:class:`float`: The average latency of every shard in the cluster, in seconds.
+
+        Returns ``nan`` if no worker has reported its latencies yet.
+        """
+        latencies = self.latencies
+        if not latencies:
+            return float("nan")
+        return sum(latency for _, latency in latencies) / len(latencies)
+
+    @property
+    def latencies(self) -> List[Tuple[int, float]]:
+        """List[Tuple[:class:`int`, :class:`float`]]: The latencies of every shard in the cluster.
+
+        This returns a list of ``(shard_id, latency)`` tuples, as last reported by the workers.
+        """
+        return sorted(latency for worker in self._workers for latency in worker.latencies)
+
+    @property
+    def session_start_limits(self) -> Optional[SessionStartLimits]:
+        """Optional[:class:`SessionStartLimits`]: The session start limits of the bot.
+
+        This is ``None`` until the cluster is started.
+        """
+        return self._session_start_limits
+
+    def is_ws_ratelimited(self) -> bool:
+        """:class:`bool`: Whether any shard in the cluster is rate limited,
+        as last reported by the workers.
+        """
+        return any(worker.ratelimited for worker in self._workers)
+
+    def is_closed(self) -> bool:
+        """:class:`bool`: Indicates if the cluster has been closed."""
+        return self._closed
+
+    async def change_presence(
+        self,
+        *,
+        activity: Optional[BaseActivity] = None,
+        status: Optional[Status] = None,
+        shard_id: Optional[int] = None,
+    ) -> None:
+        """|coro|
+
+        Changes the presence of the shards in the cluster.
+
+        This works like :meth:`AutoShardedClient.change_presence`, forwarding the
+        change to the worker running ``shard_id`` or to every worker if it is ``None``.
+        """
+        for worker in self._workers:
+            if shard_id is None or shard_id in worker.shard_ids:
+                worker.send(ClusterOp.presence, activity, status, shard_id)
+
+    async def start(self, token: str) -> None:
+        """|coro|
+
+        Starts the worker processes and coordinates them until every worker
+        has exited or :meth:`close` is called.
+        """
+        self._token = token = token.strip()
+        self._session_start_lock = asyncio.Lock()
+        self.http = HTTPClient(dispatch=lambda *_args: None)
+        await self.http.static_login(f"Bot {token}")
+
+        shard_count, _, session_start_limit = await self.http.get_bot_gateway()
+        self._update_session_start_limits(session_start_limit)
+        if self.shard_count is None:
+            self.shard_count = shard_count
+
+        shard_ids = self.shard_ids or list(range(self.shard_count))
+        processes = min(self.processes, len(shard_ids))
+        size, extra = divmod(len(shard_ids), processes)
+        start = 0
+        for worker_id in range(processes):
+            end = start + size + (worker_id < extra)
+            self._workers.append(_ClusterWorker(worker_id, list(shard_ids[start:end])))
+            start = end
+
+        _log.info(
+            "Launching %s shards across %s worker processes.", len(shard_ids), len(self._workers)
+        )
+        try:
+            await asyncio.gather(*(self._supervise(worker) for worker in self._workers))
+        finally:
+            await self.close()
+
+    def run(self, token: str) -> None:
+        """A blocking call that starts the cluster and runs it until it is closed."""
+
+        with contextlib.suppress(KeyboardInterrupt):
+            asyncio.run(self.start(token))
+
+    async def close(self) -> None:
+        """|coro|
+
+        Closes every worker and the coordinator.
+        """
+        if self._closed:
+            return
+
+        self._closed = True
+        for worker in self._workers:
+            worker.send(ClusterOp.close)
+
+        loop = asyncio.get_running_loop()
+        for worker in self._workers:
+            process = worker.process
+            if process is None:
+                continue
+
+            await loop.run_in_executor(None, process.join, 30.0)
+            if process.is_alive():
+                _log.warning("Worker %s did not close in time, terminating it.", worker.id)
+                process.terminate()
+
+        if self.http is not MISSING:
+            await self.http.close()
+
+    async def _supervise(self, worker: _ClusterWorker) -> None:
+        loop = asyncio.get_running_loop()
+        ctx = multiprocessing.get_context("spawn")
+        while not self._closed:
+            conn, child_conn = ctx.Pipe()
+            process = ctx.Process(
+                target=_worker_main,
+                args=(
+                    self.client_factory,
+                    self._token,
+                    worker.shard_ids,
+                    self.shard_count,
+                    child_conn,
+                    self.stats_interval,
+                ),
+                name=f"nextcord-cluster-worker-{worker.id}",
+            )
+            process.start()
+            child_conn.close()
+            worker.process, worker.conn = process, conn
+            _start_reader(
+                conn,
+                loop,
+                lambda message, conn=conn: self._handle(worker, conn, message),
+                f"nextcord-cluster-reader-{worker.id}",
+            )
+            _log.info("Started worker %s for shard IDs %s.", worker.id, worker.shard_ids)
+
+            await loop.run_in_executor(None, process.join)
+            conn.close()
+            worker.latencies = []
+            worker.ratelimited = False
+            if self._closed:
+                return
+
+            if process.exitcode == 0:
+                _log.info("Worker %s has exited.", worker.id)
+                return
+
+            retry = worker.backoff.delay()
+            _log.error(
+                "Worker %s exited with code %s, restarting it in %.2fs.",
+                worker.id,
+                process.exitcode,
+                retry,
+            )
+            await asyncio.sleep(retry)
+
+    def _handle(
+        self, worker: _ClusterWorker, conn: Connection, message: Optional[Tuple[Any, ...]]
+    ) -> None:
+        if message is None or worker.conn is not conn:
+            return
+
+        op = message[0]
+        if op == ClusterOp.identify:
+            _spawn(
+                self._tasks,
+                self._grant_identify(worker, message[1]),
+                f"nextcord-cluster: identify shard {message[1]}",
+            )
+        elif op == ClusterOp.stats:
+            _, worker.latencies, worker.ratelimited = message
+
+    async def _grant_identify(self, worker: _ClusterWorker, shard_id: int) -> None:
+        # shards sharing a rate limit key have to IDENTIFY 5 seconds apart
+        limits: SessionStartLimits = self._session_start_limits  # type: ignore
+        key = shard_id % limits.max_concurrency
+        lock = self._identify_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            delay = self._next_identify.get(key, 0.0) - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            await self._consume_session_start()
+            self._next_identify[key] = time.monotonic() + 5.0
+
+        worker.send(ClusterOp.identify_ack, shard_id)
+
+    def _update_session_start_limits(self, data: Any) -> None:
+        self._session_start_limits = limits = SessionStartLimits(data)
+        self._session_start_reset = time.monotonic() + limits.reset_after
+
+    async def _consume_session_start(self) -> None:
+        async with self._session_start_lock:
+            limits: SessionStartLimits = self._session_start_limits  # type: ignore
+            while limits.remaining <= 0:
+                delay = self._session_start_reset - time.monotonic()
+                if delay > 0:
+                    _log.warning(
+                        "Session start limit of %s has been exhausted, waiting %.2fs for it to reset.",
+                        limits.total,
+                        delay,
+                    )
+                    await asyncio.sleep(delay)
+
+                _, _, data = await self.http.get_bot_gateway()
+                self._update_session_start_limits(data)
+                limits = self._session_start_limits  # type: ignore
+
+            limits.remaining -= 1
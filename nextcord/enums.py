@@ -53,6 +53,8 @@ __all__ = (
     "IntegrationType",
     "InteractionContextType",
     "MessageReferenceType",
+    "RequestPriority",
+    "OverflowPolicy",
 )
 
 
@@ -2093,6 +2095,43 @@ class MessageReferenceType(IntEnum):
     """The reference is used to point to a message."""
 
 
+class RequestPriority(IntEnum):
+    """Represents how urgent an HTTP request is when the global rate limit is saturated.
+
+    Waiting requests are admitted with weighted fair queuing, more urgent priorities receiving a larger
+    share of the global rate limit without starving less urgent ones.
+
+    .. versionadded:: 3.2
+    """
+
+    interaction = 0
+    """Interaction responses and followups, which Discord only accepts for a limited time.
+    This is the default for interaction routes."""
+    moderation = 1
+    """Moderation actions such as kicks, bans, timeouts and message deletions.
+    This is the default for those routes."""
+    default = 2
+    """The default priority of every other request."""
+    bulk = 3
+    """Large background jobs, such as mass role assignments."""
+
+
+class OverflowPolicy(StrEnum):
+    """Represents what an :class:`EventExecutor` does with an event handler
+    when the queue of its event is full.
+
+    .. versionadded:: 3.2
+    """
+
+    wait = "wait"
+    """Queue the handler anyway, and stop reading from the gateway until the queue
+    has room again."""
+    drop_oldest = "drop_oldest"
+    """Drop the handler that has been queued the longest to make room."""
+    drop_newest = "drop_newest"
+    """Drop the new handler."""
+
+
 T = TypeVar("T")
 
 
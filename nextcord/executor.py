@@ -0,0 +1,238 @@
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import asyncio
+import functools
+from collections import deque
+from typing import Any, Coroutine, Deque, Dict, Optional, Set
+
+from .enums import OverflowPolicy
+
+__all__ = (
+    "EventExecutor",
+    "EventExecutorStats",
+)
+
+
+class EventExecutorStats:
+    """Statistics about the event handlers of an :class:`EventExecutor`.
+
+    .. versionadded:: 3.2
+
+    Attributes
+    ----------
+    running: :class:`int`
+        The amount of event handlers currently running.
+    completed: :class:`int`
+        The amount of event handlers that finished running.
+    dropped: Dict[:class:`str`, :class:`int`]
+        The amount of event handlers dropped because the queue of their event was full,
+        by event name.
+    """
+
+    __slots__ = ("running", "completed", "dropped", "_queues")
+
+    def __init__(self, queues: Dict[str, Deque[Coroutine[Any, Any, Any]]]) -> None:
+        self.running: int = 0
+        self.completed: int = 0
+        self.dropped: Dict[str, int] = {}
+        self._queues: Dict[str, Deque[Coroutine[Any, Any, Any]]] = queues
+
+    @property
+    def queue_depths(self) -> Dict[str, int]:
+        """Dict[:class:`str`, :class:`int`]: The amount of event handlers waiting to run, by event name."""
+        return {event: len(queue) for event, queue in self._queues.items()}
+
+    @property
+    def queued(self) -> int:
+        """:class:`int`: The amount of event handlers waiting to run."""
+        return sum(len(queue) for queue in self._queues.values())
+
+    @property
+    def total_dropped(self) -> int:
+        """:class:`int`: The amount of event handlers dropped for every event."""
+        return sum(self.dropped.values())
+
+    def __repr__(self) -> str:
+        return (
+            f"<EventExecutorStats running={self.running} queued={self.queued} "
+            f"completed={self.completed} dropped={self.total_dropped}>"
+        )
+
+
+class EventExecutor:
+    """Limits how many event handlers run at once, passed through the ``event_executor``
+    parameter of :class:`Client`.
+
+    By default, every event handler runs in a task of its own as soon as its event is
+    received. Through an executor, handlers over the concurrency limits wait in a queue
+    per event instead, which are run in turn as running handlers finish.
+
+    Event names are given without the ``on_`` prefix, such as ``message`` or ``member_join``.
+    Errors raised by the handlers are still passed to :meth:`Client.on_error`.
+
+    .. versionadded:: 3.2
+
+    Parameters
+    ----------
+    max_concurrency: Optional[:class:`int`]
+        The maximum amount of event handlers running at once. ``None`` for no limit.
+        Defaults to ``1000``.
+    event_concurrency: Optional[Dict[:class:`str`, :class:`int`]]
+        The maximum amount of handlers of the given events running at once, on top of
+        ``max_concurrency``.
+    max_queue_size: :class:`int`
+        The maximum amount of handlers waiting to run for every event. Defaults to ``10000``.
+    overflow_policy: :class:`OverflowPolicy`
+        What to do with a handler when the queue of its event is full.
+        Defaults to :attr:`OverflowPolicy.wait`, which stops reading from the gateway
+        until there is room again.
+
+        .. warning::
+
+            Heartbeat acknowledgements aren't read either while waiting, so handlers
+            that don't make room in time cause the gateway connection to be restarted.
+
+    Attributes
+    ----------
+    stats: :class:`EventExecutorStats`
+        The statistics about the handlers of this executor.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: Optional[int] = 1000,
+        event_concurrency: Optional[Dict[str, int]] = None,
+        max_queue_size: int = 10000,
+        overflow_policy: OverflowPolicy = OverflowPolicy.wait,
+    ) -> None:
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size must be at least 1")
+
+        self.max_concurrency: Optional[int] = max_concurrency
+        self.event_concurrency: Dict[str, int] = event_concurrency or {}
+        self.max_queue_size: int = max_queue_size
+        self.overflow_policy: OverflowPolicy = overflow_policy
+        self._queues: Dict[str, Deque[Coroutine[Any, Any, Any]]] = {}
+        self._running: Dict[str, int] = {}
+        # events whose queue is full, only tracked when waiting for room
+        self._full: Set[str] = set()
+        self._room: Optional[asyncio.Event] = None
+        self.stats: EventExecutorStats = EventExecutorStats(self._queues)
+
+    def _can_run(self, event: str) -> bool:
+        if self.max_concurrency is not None and self.stats.running >= self.max_concurrency:
+            return False
+
+        limit = self.event_concurrency.get(event)
+        return limit is None or self._running.get(event, 0) < limit
+
+    def _start(self, event: str, coro: Coroutine[Any, Any, Any]) -> asyncio.Task:
+        self.stats.running += 1
+        self._running[event] = self._running.get(event, 0) + 1
+        task = asyncio.create_task(coro, name=f"nextcord: on_{event}")
+        task.add_done_callback(functools.partial(self._finished, event))
+        return task
+
+    def _finished(self, event: str, _task: asyncio.Task) -> None:
+        self.stats.running -= 1
+        self.stats.completed += 1
+        self._running[event] -= 1
+        if not self._running[event]:
+            del self._running[event]
+        self._start_queued()
+
+    def _start_queued(self) -> None:
+        # queued handlers are started one event at a time in turn, so a flood
+        # of one event doesn't hold back the others
+        started = True
+        while started:
+            started = False
+            for event in list(self._queues):
+                if self.max_concurrency is not None and self.stats.running >= self.max_concurrency:
+                    return
+                if not self._can_run(event):
+                    continue
+
+                queue = self._queues[event]
+                coro = queue.popleft()
+                if not queue:
+                    del self._queues[event]
+                self._update_room(event, queue)
+                self._start(event, coro)
+                started = True
+
+    def _update_room(self, event: str, queue: Deque[Coroutine[Any, Any, Any]]) -> None:
+        if self.overflow_policy is not OverflowPolicy.wait:
+            return
+
+        if len(queue) >= self.max_queue_size:
+            self._full.add(event)
+            if self._room is not None:
+                self._room.clear()
+        else:
+            self._full.discard(event)
+            if not self._full and self._room is not None:
+                self._room.set()
+
+    def _drop(self, event: str, coro: Coroutine[Any, Any, Any]) -> None:
+        coro.close()
+        self.stats.dropped[event] = self.stats.dropped.get(event, 0) + 1
+
+    def submit(self, event: str, coro: Coroutine[Any, Any, Any]) -> Optional[asyncio.Task]:
+        """Runs or queues an event handler coroutine.
+
+        Parameters
+        ----------
+        event: :class:`str`
+            The name of the event, with or without the ``on_`` prefix.
+        coro: :ref:`coroutine <coroutine>`
+            The coroutine running the handler.
+
+        Returns
+        -------
+        Optional[:class:`asyncio.Task`]
+            The task running the handler, or ``None`` if it was queued or dropped.
+        """
+        event = event.removeprefix("on_")
+        if event not in self._queues and self._can_run(event):
+            return self._start(event, coro)
+
+        queue = self._queues.setdefault(event, deque())
+        if len(queue) >= self.max_queue_size:
+            if self.overflow_policy is OverflowPolicy.drop_newest:
+                self._drop(event, coro)
+                return None
+            if self.overflow_policy is OverflowPolicy.drop_oldest:
+                self._drop(event, queue.popleft())
+
+        queue.append(coro)
+        self._update_room(event, queue)
+        return None
+
+    def is_full(self) -> bool:
+        """:class:`bool`: Whether the queue of an event is full while using :attr:`OverflowPolicy.wait`."""
+        return bool(self._full)
+
+    async def wait_for_room(self) -> None:
+        """|coro|
+
+        Waits until no event queue is full anymore.
+        """
+        while self._full:
+            if self._room is None:
+                self._room = asyncio.Event()
+            self._room.clear()
+            await self._room.wait()
+
+    def clear(self) -> None:
+        """Drops every queued event handler without counting them as dropped."""
+        for queue in self._queues.values():
+            for coro in queue:
+                coro.close()
+        self._queues.clear()
+        self._full.clear()
+        if self._room is not None:
+            self._room.set()
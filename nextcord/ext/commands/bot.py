@@ -23,6 +23,7 @@ from typing import (
     Iterable,
     Iterator,
     List,
+    Literal,
     Mapping,
     Optional,
     Sequence,
@@ -46,10 +47,13 @@ if TYPE_CHECKING:
     import aiohttp
 
     from nextcord.activity import BaseActivity
+    from nextcord.cache import CacheStoreFactory
     from nextcord.enums import Status
+    from nextcord.executor import EventExecutor
     from nextcord.flags import MemberCacheFlags
     from nextcord.mentions import AllowedMentions
     from nextcord.message import Message
+    from nextcord.session import SessionStore
 
     from ._types import Check, CoroFunc
 
@@ -142,6 +146,8 @@ _NonCallablePrefix = Union[str, Sequence[str]]
 
 class BotBase(GroupMixin):
     extra_events: Dict[str, List[CoroFunc]]
+    _inline_events: Dict[str, List[Callable[..., Any]]]
+    _dispatch_table: Dict[str, Any]
 
     def __init__(
         self,
@@ -476,8 +482,8 @@ class BotBase(GroupMixin):
     # listener registration
 
     @nextcord.utils.copy_doc(nextcord.Client.add_listener)
-    def add_listener(self, func: CoroFunc, name: str = MISSING) -> None:
-        super().add_listener(func, name)  # type: ignore
+    def add_listener(self, func: CoroFunc, name: str = MISSING, *, inline: bool = False) -> None:
+        super().add_listener(func, name, inline=inline)  # type: ignore
 
     @nextcord.utils.copy_doc(nextcord.Client.remove_listener)
     def remove_listener(self, func: CoroFunc, name: str = MISSING) -> None:
@@ -612,7 +618,7 @@ class BotBase(GroupMixin):
                 self.remove_command(cmd.name)
 
         # remove all the listeners from the module
-        for event_list in self.extra_events.copy().values():
+        for event_list in (*self.extra_events.values(), *self._inline_events.values()):
             remove = []
             for index, event in enumerate(event_list):
                 if _is_submodule(name, event.__module__):
@@ -620,6 +626,7 @@ class BotBase(GroupMixin):
 
             for index in reversed(remove):
                 del event_list[index]
+        self._dispatch_table.clear()
 
     def _call_module_finalizers(self, lib: types.ModuleType, key: str) -> None:
         try:
@@ -1438,7 +1445,7 @@ class Bot(BotBase, nextcord.Client):
         .. versionadded:: 1.7
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         command_prefix: Union[
             _NonCallablePrefix,
@@ -1475,6 +1482,17 @@ class Bot(BotBase, nextcord.Client):
         rollout_update_known: bool = True,
         rollout_all_guilds: bool = False,
         default_guild_ids: Optional[List[int]] = None,
+        cache_stores: Optional[Dict[str, CacheStoreFactory]] = None,
+        gateway_compression: Literal["zlib-stream", "zstd-stream"] = "zlib-stream",
+        skip_unused_events: bool = False,
+        coalesce_get_requests: bool = False,
+        get_cache_ttls: Optional[Dict[str, float]] = None,
+        session_store: Optional[SessionStore] = None,
+        cache_snapshot: bool = False,
+        shared_heartbeat: bool = False,
+        event_executor: Optional[EventExecutor] = None,
+        gateway_stats: bool = False,
+        gateway_stats_interval: Optional[float] = None,
         owner_id: Optional[int] = None,
         owner_ids: Optional[Iterable[int]] = None,
         strip_after_prefix: bool = False,
@@ -1507,6 +1525,17 @@ class Bot(BotBase, nextcord.Client):
             rollout_update_known=rollout_update_known,
             rollout_all_guilds=rollout_all_guilds,
             default_guild_ids=default_guild_ids,
+            cache_stores=cache_stores,
+            gateway_compression=gateway_compression,
+            skip_unused_events=skip_unused_events,
+            coalesce_get_requests=coalesce_get_requests,
+            get_cache_ttls=get_cache_ttls,
+            session_store=session_store,
+            cache_snapshot=cache_snapshot,
+            shared_heartbeat=shared_heartbeat,
+            event_executor=event_executor,
+            gateway_stats=gateway_stats,
+            gateway_stats_interval=gateway_stats_interval,
         )
 
         BotBase.__init__(
@@ -1526,7 +1555,7 @@ class AutoShardedBot(BotBase, nextcord.AutoShardedClient):
     :class:`nextcord.AutoShardedClient` instead.
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         command_prefix: Union[
             _NonCallablePrefix,
@@ -1564,6 +1593,17 @@ class AutoShardedBot(BotBase, nextcord.AutoShardedClient):
         rollout_update_known: bool = True,
         rollout_all_guilds: bool = False,
         default_guild_ids: Optional[List[int]] = None,
+        cache_stores: Optional[Dict[str, CacheStoreFactory]] = None,
+        gateway_compression: Literal["zlib-stream", "zstd-stream"] = "zlib-stream",
+        skip_unused_events: bool = False,
+        coalesce_get_requests: bool = False,
+        get_cache_ttls: Optional[Dict[str, float]] = None,
+        session_store: Optional[SessionStore] = None,
+        cache_snapshot: bool = False,
+        shared_heartbeat: bool = False,
+        event_executor: Optional[EventExecutor] = None,
+        gateway_stats: bool = False,
+        gateway_stats_interval: Optional[float] = None,
         owner_id: Optional[int] = None,
         owner_ids: Optional[Iterable[int]] = None,
         strip_after_prefix: bool = False,
@@ -1597,6 +1637,17 @@ class AutoShardedBot(BotBase, nextcord.AutoShardedClient):
             rollout_update_known=rollout_update_known,
             rollout_all_guilds=rollout_all_guilds,
             default_guild_ids=default_guild_ids,
+            cache_stores=cache_stores,
+            gateway_compression=gateway_compression,
+            skip_unused_events=skip_unused_events,
+            coalesce_get_requests=coalesce_get_requests,
+            get_cache_ttls=get_cache_ttls,
+            session_store=session_store,
+            cache_snapshot=cache_snapshot,
+            shared_heartbeat=shared_heartbeat,
+            event_executor=event_executor,
+            gateway_stats=gateway_stats,
+            gateway_stats_interval=gateway_stats_interval,
         )
 
         BotBase.__init__(
@@ -75,6 +75,16 @@ def _get_from_guilds(bot, getter, argument):
     return result
 
 
+def _get_user_named(bot, name: str, discriminator: Optional[str] = None):
+    # looks the username up in the name index of the guilds first, which avoids
+    # scanning every cached user for members of any guild
+    for guild in bot.guilds:
+        for member in guild._members_indexed_as(name):
+            if member.name == name and discriminator in (None, member.discriminator):
+                return member._user
+    return None
+
+
 _utils_get = nextcord.utils.get
 T = TypeVar("T")
 T_co = TypeVar("T_co", covariant=True)
@@ -299,12 +309,16 @@ class UserConverter(IDConverter[nextcord.User]):
             predicate: Callable[[User], bool] = (
                 lambda u: u.name == name and u.discriminator == discrim
             )
-            result = nextcord.utils.find(predicate, state._users.values())
+            result = _get_user_named(ctx.bot, name, discrim) or nextcord.utils.find(
+                predicate, state._users.values()
+            )
             if result is not None:
                 return result
 
         predicate = lambda u: u.name == arg
-        result = nextcord.utils.find(predicate, state._users.values())
+        result = _get_user_named(ctx.bot, arg) or nextcord.utils.find(
+            predicate, state._users.values()
+        )
 
         if result is None:
             raise UserNotFound(argument)
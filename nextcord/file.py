@@ -4,10 +4,58 @@ from __future__ import annotations
 
 import io
 import os
-from typing import TYPE_CHECKING, Optional, Union
+import tempfile
+from typing import TYPE_CHECKING, AsyncIterable, Optional, Union
 
 __all__ = ("File",)
 
+_SPOOL_MAX_SIZE = 8 * 1024 * 1024
+"""Amount of bytes a spooled download keeps in memory before rolling over to a temporary file."""
+
+
+async def _spool(chunks: AsyncIterable[bytes]) -> tempfile.SpooledTemporaryFile[bytes]:
+    # Kept in memory while small, written to disk once it grows past _SPOOL_MAX_SIZE.
+    fp = tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE)  # noqa: SIM115
+    try:
+        async for chunk in chunks:
+            fp.write(chunk)
+    except BaseException:
+        fp.close()
+        raise
+
+    fp.seek(0)
+    return fp
+
+
+async def _write_chunks(
+    chunks: AsyncIterable[bytes],
+    fp: Union[str, bytes, os.PathLike, io.BufferedIOBase],
+    *,
+    seek_begin: bool,
+) -> int:
+    written = 0
+    if isinstance(fp, io.BufferedIOBase):
+        async for chunk in chunks:
+            written += fp.write(chunk)
+        if seek_begin:
+            fp.seek(0)
+        return written
+
+    # the response status is only checked once the first chunk is requested,
+    # so an existing file isn't truncated when the download fails right away
+    iterator = chunks.__aiter__()
+    try:
+        first = await iterator.__anext__()
+    except StopAsyncIteration:
+        first = b""
+
+    with open(fp, "wb") as f:  # noqa: ASYNC230
+        written += f.write(first)
+        async for chunk in iterator:
+            written += f.write(chunk)
+
+    return written
+
 
 class File:
     r"""A parameter object used for :meth:`abc.Messageable.send`
@@ -27,10 +75,13 @@ class File:
     Parameters
     ----------
 
-    fp: Union[str, bytes, os.PathLike, io.BufferedIOBase]
-        A file-like object opened in binary mode and read mode
-        or a filename representing a file in the hard drive to
-        open.
+    fp: Union[str, bytes, os.PathLike, io.BufferedIOBase, AsyncIterable[:class:`bytes`]]
+        A file-like object opened in binary mode and read mode,
+        a filename representing a file in the hard drive to
+        open or an async iterable of :class:`bytes` chunks.
+
+        Files and file-like objects are read in chunks while uploading,
+        so they are never fully loaded into memory.
 
         .. note::
 
@@ -38,6 +89,15 @@ class File:
             modes 'rb' should be used.
 
             To pass binary data, consider usage of ``io.BytesIO``.
+
+        .. note::
+
+            An async iterable can only be consumed once, so the request
+            cannot be retried after a rate limit or server error. It is not
+            supported by :class:`SyncWebhook` either.
+
+        .. versionchanged:: 3.2
+            Async iterables of :class:`bytes` are now accepted.
     filename: Optional[:class:`str`]
         The filename to display when uploading to Discord.
         If this is not given then it defaults to ``fp.name`` or if ``fp`` is
@@ -59,11 +119,12 @@ class File:
 
     Attributes
     ----------
-    fp: Union[:class:`io.BufferedReader`, :class:`io.BufferedIOBase`]
+    fp: Union[:class:`io.BufferedReader`, :class:`io.BufferedIOBase`, AsyncIterable[:class:`bytes`]]
         A file-like object opened in binary mode and read mode.
         This will be a :class:`io.BufferedIOBase` if an
-        object of type :class:`io.IOBase` was passed, or a
-        :class:`io.BufferedReader` if a filename was passed.
+        object of type :class:`io.IOBase` was passed, a
+        :class:`io.BufferedReader` if a filename was passed, or
+        the async iterable that was passed.
     filename: Optional[:class:`str`]
         The filename to display when uploading to Discord.
     description: Optional[:class:`str`]
@@ -93,7 +154,7 @@ class File:
     )
 
     if TYPE_CHECKING:
-        fp: Union[io.BufferedReader, io.BufferedIOBase]
+        fp: Union[io.BufferedReader, io.BufferedIOBase, AsyncIterable[bytes]]
         filename: Optional[str]
         description: Optional[str]
         spoiler: bool
@@ -101,32 +162,39 @@ class File:
 
     def __init__(
         self,
-        fp: Union[str, bytes, os.PathLike, io.BufferedIOBase],
+        fp: Union[str, bytes, os.PathLike, io.BufferedIOBase, AsyncIterable[bytes]],
         filename: Optional[str] = None,
         *,
         description: Optional[str] = None,
         spoiler: bool = False,
         force_close: Optional[bool] = None,
     ) -> None:
-        if isinstance(fp, io.IOBase):
-            if not (fp.seekable() and fp.readable()):
-                raise ValueError(f"File buffer {fp!r} must be seekable and readable")
+        self.force_close = force_close
+
+        if isinstance(fp, AsyncIterable):
+            # aiohttp streams these as they are, there's nothing to seek or close.
             self.fp = fp
-            self._original_pos = fp.tell()
+            self._original_pos = -1
             self._owner = False
+            self._closer = lambda: None
         else:
-            self.fp = open(fp, "rb")  # noqa: SIM115
-            self._original_pos = 0
-            self._owner = True
-
-        self.force_close = force_close
+            if isinstance(fp, io.IOBase):
+                if not (fp.seekable() and fp.readable()):
+                    raise ValueError(f"File buffer {fp!r} must be seekable and readable")
+                self.fp = fp
+                self._original_pos = fp.tell()
+                self._owner = False
+            else:
+                self.fp = open(fp, "rb")  # noqa: SIM115
+                self._original_pos = 0
+                self._owner = True
 
-        # aiohttp only uses two methods from IOBase
-        # read and close, since I want to control when the files
-        # close, I need to stub it so it doesn't close unless
-        # I tell it to
-        self._closer = self.fp.close
-        self.fp.close = lambda: None
+            # aiohttp only uses two methods from IOBase
+            # read and close, since I want to control when the files
+            # close, I need to stub it so it doesn't close unless
+            # I tell it to
+            self._closer = self.fp.close
+            self.fp.close = lambda: None
 
         if filename is None:
             if isinstance(fp, str):
@@ -165,9 +233,15 @@ class File:
         # unnecessary seek since it's the first request
         # done.
         if seek:
+            if isinstance(self.fp, AsyncIterable):
+                raise ValueError("File streams from an async iterable and cannot be sent again")
+
             self.fp.seek(self._original_pos)
 
     def close(self) -> None:
+        if isinstance(self.fp, AsyncIterable):
+            return
+
         self.fp.close = self._closer
         if self._owner or self.force_close:
             self._closer()
@@ -4,6 +4,9 @@ from __future__ import annotations
 
 import asyncio
 import concurrent.futures
+import contextlib
+import heapq
+import itertools
 import logging
 import struct
 import sys
@@ -12,7 +15,20 @@ import time
 import traceback
 import zlib
 from collections import deque, namedtuple
-from typing import TYPE_CHECKING, Awaitable, Callable, Dict, List, Optional, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
 import aiohttp
 
@@ -21,10 +37,24 @@ from .activity import BaseActivity
 from .enums import SpeakingState
 from .errors import ConnectionClosed, InvalidArgument
 
+try:
+    # Python 3.14+
+    from compression import zstd as _zstd  # type: ignore
+except ModuleNotFoundError:
+    _zstd = None
+
+try:
+    import zstandard as _zstandard  # type: ignore
+except ModuleNotFoundError:
+    _zstandard = None
+
+HAS_ZSTD = _zstd is not None or _zstandard is not None
+
 if TYPE_CHECKING:
-    from typing import Any, Protocol
+    from typing import Protocol
 
     from .client import Client
+    from .executor import EventExecutor
     from .state import ConnectionState
     from .types.activity import Activity
     from .voice_client import VoiceClient
@@ -39,6 +69,9 @@ __all__ = (
     "DiscordWebSocket",
     "KeepAliveHandler",
     "VoiceKeepAliveHandler",
+    "ScheduledKeepAlive",
+    "HeartbeatScheduler",
+    "GatewayStats",
     "DiscordVoiceWebSocket",
     "ReconnectWebSocket",
 )
@@ -59,6 +92,140 @@ class WebSocketClosure(Exception):
 
 EventListener = namedtuple("EventListener", "predicate event result future")  # type: ignore
 
+_ZLIB_SUFFIX = b"\x00\x00\xff\xff"
+
+
+class ZlibStreamInflater:
+    """Inflates a ``zlib-stream`` gateway connection.
+
+    Complete messages are inflated straight from the received frame, only
+    messages split over multiple frames are collected in a reused buffer first.
+    """
+
+    __slots__ = ("_zlib", "_buffer")
+
+    def __init__(self) -> None:
+        self._zlib = zlib.decompressobj()
+        self._buffer: bytearray = bytearray()
+
+    def feed(self, data: bytes) -> Optional[bytes]:
+        buffer = self._buffer
+        if not data.endswith(_ZLIB_SUFFIX):
+            buffer.extend(data)
+            return None
+
+        if not buffer:
+            return self._zlib.decompress(data)
+
+        buffer.extend(data)
+        try:
+            return self._zlib.decompress(buffer)
+        finally:
+            del buffer[:]
+
+
+class ZstdStreamInflater:
+    """Decompresses a ``zstd-stream`` gateway connection.
+
+    This requires Python 3.14+ or the ``zstandard`` package.
+    """
+
+    __slots__ = ("_decompress",)
+
+    def __init__(self) -> None:
+        if _zstd is not None:
+            self._decompress: Callable[[bytes], bytes] = _zstd.ZstdDecompressor().decompress
+        elif _zstandard is not None:
+            self._decompress = _zstandard.ZstdDecompressor().decompressobj().decompress
+        else:
+            raise RuntimeError("zstd-stream compression requires Python 3.14+ or zstandard")
+
+    def feed(self, data: bytes) -> Optional[bytes]:
+        return self._decompress(data) or None
+
+
+GATEWAY_INFLATERS: Dict[str, Callable[[], Union[ZlibStreamInflater, ZstdStreamInflater]]] = {
+    "zlib-stream": ZlibStreamInflater,
+    "zstd-stream": ZstdStreamInflater,
+}
+
+
+class GatewayStats:
+    """Counters about the traffic of the gateway connection of one shard,
+    kept across reconnects while ``gateway_stats`` is enabled on the :class:`Client`."""
+
+    __slots__ = (
+        "frames_received",
+        "bytes_received",
+        "bytes_decompressed",
+        "decompress_time",
+        "decode_time",
+        "events",
+        "parse_time",
+        "payloads_sent",
+        "bytes_sent",
+        "ratelimit_wait",
+    )
+
+    def __init__(self) -> None:
+        self.frames_received: int = 0
+        self.bytes_received: int = 0
+        self.bytes_decompressed: int = 0
+        self.decompress_time: float = 0.0
+        self.decode_time: float = 0.0
+        self.events: Dict[str, int] = {}
+        self.parse_time: Dict[str, float] = {}
+        self.payloads_sent: int = 0
+        self.bytes_sent: int = 0
+        self.ratelimit_wait: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "frames_received": self.frames_received,
+            "bytes_received": self.bytes_received,
+            "bytes_decompressed": self.bytes_decompressed,
+            "decompress_time": self.decompress_time,
+            "decode_time": self.decode_time,
+            "events": self.events.copy(),
+            "parse_time": self.parse_time.copy(),
+            "payloads_sent": self.payloads_sent,
+            "bytes_sent": self.bytes_sent,
+            "ratelimit_wait": self.ratelimit_wait,
+        }
+
+    def _record_sent(self, data: Union[str, bytes]) -> None:
+        self.payloads_sent += 1
+        self.bytes_sent += _byte_length(data)
+
+    def _record_received(self, data: Union[str, bytes]) -> None:
+        self.frames_received += 1
+        self.bytes_received += _byte_length(data)
+
+    def _record_decompress(self, started: float) -> float:
+        finished = time.perf_counter()
+        self.decompress_time += finished - started
+        return finished
+
+    def _record_decode(self, data: Union[str, bytes], started: float) -> None:
+        self.bytes_decompressed += _byte_length(data)
+        self.decode_time += time.perf_counter() - started
+
+    def _record_event(self, event: str) -> None:
+        self.events[event] = self.events.get(event, 0) + 1
+
+    def _record_parse(
+        self, event: str, parser: Callable[[Dict[str, Any]], None], data: Dict[str, Any]
+    ) -> None:
+        started = time.perf_counter()
+        parser(data)
+        elapsed = time.perf_counter() - started
+        self.parse_time[event] = self.parse_time.get(event, 0.0) + elapsed
+
+
+def _byte_length(data: Union[str, bytes]) -> int:
+    # uncompressed frames arrive as text, counted in UTF-8 bytes like the compressed ones
+    return len(data) if type(data) is bytes else len(data.encode())
+
 
 class GatewayRatelimiter:
     def __init__(self, count: int = 110, per: float = 60.0) -> None:
@@ -69,6 +236,7 @@ class GatewayRatelimiter:
         self.per = per
         self.lock = asyncio.Lock()
         self.shard_id: Optional[int] = None
+        self.stats: Optional[GatewayStats] = None
 
     def is_ratelimited(self) -> bool:
         current = time.time()
@@ -103,6 +271,8 @@ class GatewayRatelimiter:
                     self.shard_id,
                     delta,
                 )
+                if self.stats is not None:
+                    self.stats.ratelimit_wait += delta
                 await asyncio.sleep(delta)
 
 
@@ -208,6 +378,214 @@ class VoiceKeepAliveHandler(KeepAliveHandler):
         self.recent_ack_latencies.append(self.latency)
 
 
+class ScheduledKeepAlive:
+    """Keeps a gateway websocket alive through a :class:`HeartbeatScheduler`
+    shared by every shard, rather than through a thread of its own.
+
+    It has the same interface as :class:`KeepAliveHandler`.
+    """
+
+    def __init__(
+        self,
+        *,
+        ws: DiscordWebSocket,
+        interval: float,
+        shard_id: Optional[int] = None,
+        scheduler: HeartbeatScheduler,
+    ) -> None:
+        self.ws: DiscordWebSocket = ws
+        self.interval: float = interval
+        self.shard_id: Optional[int] = shard_id
+        self.scheduler: HeartbeatScheduler = scheduler
+        self.msg: str = "Keeping shard ID %s websocket alive with sequence %s."
+        self.behind_msg: str = "Can't keep up, shard ID %s websocket is %.1fs behind."
+        self._last_ack: float = time.perf_counter()
+        self._last_send: float = time.perf_counter()
+        self._last_recv: float = time.perf_counter()
+        self.latency: float = float("inf")
+        self.heartbeat_timeout: float = ws._max_heartbeat_timeout
+        # when the next heartbeat is due, and when the one being sent was started
+        self._due: float = self._last_send + interval
+        self._sending_since: Optional[float] = None
+
+    def start(self) -> None:
+        self.scheduler.add(self)
+
+    def stop(self) -> None:
+        self.scheduler.remove(self)
+
+    def get_payload(self) -> Dict[str, Any]:
+        return {"op": self.ws.HEARTBEAT, "d": self.ws.sequence}
+
+    def tick(self) -> None:
+        self._last_recv = time.perf_counter()
+
+    def ack(self) -> None:
+        ack_time = time.perf_counter()
+        self._last_ack = ack_time
+        self.latency = ack_time - self._last_send
+        if self.latency > 10:
+            _log.warning(self.behind_msg, self.shard_id, self.latency)
+
+
+class HeartbeatScheduler:
+    """Sends the heartbeats of every shard from a single task on the event loop.
+
+    A single watchdog thread reports heartbeats that are overdue or stuck sending
+    for more than 10 seconds, along with what the event loop is blocked on, like
+    :class:`KeepAliveHandler` does for its own shard.
+    """
+
+    block_msg: str = "Heartbeats of shard IDs %s blocked for more than %s seconds."
+
+    def __init__(self) -> None:
+        self._handlers: Dict[ScheduledKeepAlive, None] = {}
+        self._queue: List[Tuple[float, int, ScheduledKeepAlive]] = []
+        self._counter = itertools.count()
+        self._lock: threading.Lock = threading.Lock()
+        self._task: Optional[asyncio.Task[None]] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        # sends and closes in flight, referenced until they finish
+        self._tasks: Set[asyncio.Task[None]] = set()
+        self._watchdog: Optional[threading.Thread] = None
+        self._loop_thread_id: int = threading.get_ident()
+
+    @property
+    def latencies(self) -> Dict[Optional[int], float]:
+        """Dict[Optional[:class:`int`], :class:`float`]: The latency of every scheduled shard."""
+        return {handler.shard_id: handler.latency for handler in self._handlers}
+
+    def add(self, handler: ScheduledKeepAlive) -> None:
+        handler._due = time.perf_counter() + handler.interval
+        with self._lock:
+            self._handlers[handler] = None
+            if self._watchdog is None:
+                self._watchdog = threading.Thread(
+                    target=self._watch, name="nextcord: heartbeat watchdog", daemon=True
+                )
+                self._watchdog.start()
+
+        heapq.heappush(self._queue, (handler._due, next(self._counter), handler))
+        self._loop_thread_id = threading.get_ident()
+        if self._task is None:
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run(), name="nextcord: heartbeat scheduler")
+        elif self._wakeup is not None:
+            self._wakeup.set()
+
+    def remove(self, handler: ScheduledKeepAlive) -> None:
+        # the queue entry is dropped once it comes up
+        with self._lock:
+            self._handlers.pop(handler, None)
+
+    async def _run(self) -> None:
+        queue = self._queue
+        try:
+            while self._handlers:
+                while queue and queue[0][2] not in self._handlers:
+                    heapq.heappop(queue)
+                if not queue:
+                    break
+
+                due, _, handler = queue[0]
+                delay = due - time.perf_counter()
+                if delay > 0:
+                    self._wakeup.clear()  # type: ignore
+                    with contextlib.suppress(asyncio.TimeoutError):
+                        await asyncio.wait_for(self._wakeup.wait(), timeout=delay)  # type: ignore
+                    continue
+
+                heapq.heappop(queue)
+                if self._beat(handler):
+                    handler._due = due + handler.interval
+                    heapq.heappush(queue, (handler._due, next(self._counter), handler))
+        finally:
+            self._task = None
+
+    def _beat(self, handler: ScheduledKeepAlive) -> bool:
+        ws = handler.ws
+        if handler._last_recv + handler.heartbeat_timeout < time.perf_counter():
+            _log.warning(
+                "Shard ID %s has stopped responding to the gateway. Closing and restarting.",
+                handler.shard_id,
+            )
+            handler.stop()
+            self._spawn(self._close(ws))
+            return False
+
+        if handler._sending_since is not None:
+            # the previous heartbeat is still being sent, the watchdog reports it
+            return True
+
+        data = handler.get_payload()
+        _log.debug(handler.msg, handler.shard_id, data["d"])
+        handler._sending_since = time.perf_counter()
+        self._spawn(self._send(handler, data))
+        return True
+
+    def _spawn(self, coro: Coroutine[Any, Any, None]) -> None:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, handler: ScheduledKeepAlive, data: Dict[str, Any]) -> None:
+        try:
+            await handler.ws.send_heartbeat(data)
+        except Exception:
+            _log.exception(
+                "Failed to send the heartbeat of shard ID %s, stopping its heartbeats.",
+                handler.shard_id,
+            )
+            handler.stop()
+        else:
+            handler._last_send = time.perf_counter()
+        finally:
+            handler._sending_since = None
+
+    async def _close(self, ws: DiscordWebSocket) -> None:
+        try:
+            await ws.close(4000)
+        except Exception:
+            _log.exception("An error occurred while stopping the gateway. Ignoring.")
+
+    def _watch(self) -> None:
+        stop = threading.Event()
+        reported = 0
+        while not stop.wait(1):
+            with self._lock:
+                if not self._handlers:
+                    self._watchdog = None
+                    return
+                handlers = list(self._handlers)
+
+            now = time.perf_counter()
+            blocked: Dict[Optional[int], float] = {}
+            for handler in handlers:
+                since = handler._sending_since
+                if since is None and handler._due <= now:
+                    # the heartbeat is due but the loop didn't get to send it
+                    since = handler._due
+                if since is not None and now - since >= 10:
+                    blocked[handler.shard_id] = now - since
+
+            # reported every 10 seconds for as long as the heartbeats stay blocked
+            total = int(max(blocked.values(), default=0) // 10 * 10)
+            if total <= reported:
+                reported = min(reported, total)
+                continue
+
+            reported = total
+            shard_ids = ", ".join(str(shard_id) for shard_id in blocked)
+            try:
+                frame = sys._current_frames()[self._loop_thread_id]
+            except KeyError:
+                msg = self.block_msg
+            else:
+                stack = "".join(traceback.format_stack(frame))
+                msg = f"{self.block_msg}\nLoop thread traceback (most recent call last):\n{stack}"
+            _log.warning(msg, shard_ids, total)
+
+
 class DiscordClientWebSocketResponse(aiohttp.ClientWebSocketResponse):
     async def close(self, *, code: int = 4000, message: bytes = b"") -> bool:
         return await super().close(code=code, message=message)
@@ -288,19 +666,22 @@ class DiscordWebSocket:
         # an empty dispatcher to prevent crashes
         self._dispatch: VariadicArgNone = lambda *_args: None
         # generic event listeners
-        self._dispatch_listeners: List[EventListener] = []
+        self._dispatch_listeners: Dict[str, List[EventListener]] = {}
         # the keep alive
-        self._keep_alive: Optional[KeepAliveHandler] = None
+        self._keep_alive: Optional[Union[KeepAliveHandler, ScheduledKeepAlive]] = None
+        self._heartbeat_scheduler: Optional[HeartbeatScheduler] = None
+        self._event_executor: Optional[EventExecutor] = None
+        self._stats: Optional[GatewayStats] = None
         self.thread_id: int = threading.get_ident()
 
         # ws related stuff
         self.session_id: Optional[str] = None
         self.resume_url: Optional[str] = None
         self.sequence: Optional[int] = None
-        self._zlib = zlib.decompressobj()
-        self._buffer: bytearray = bytearray()
+        self._inflater: Union[ZlibStreamInflater, ZstdStreamInflater] = ZlibStreamInflater()
         self._close_code: Optional[int] = None
         self._rate_limiter: GatewayRatelimiter = GatewayRatelimiter()
+        self._skippable_events: Dict[str, Any] = {}
 
     @property
     def open(self) -> bool:
@@ -310,6 +691,8 @@ class DiscordWebSocket:
         return self._rate_limiter.is_ratelimited()
 
     def debug_log_receive(self, data: Any, /) -> None:
+        if type(data) is bytes:
+            data = data.decode("utf-8")
         self._dispatch("socket_raw_receive", data)
 
     def log_receive(self, _, /) -> None:
@@ -332,18 +715,21 @@ class DiscordWebSocket:
 
         This is for internal use only.
         """
+        compress = client._gateway_compression
         if not gateway:
-            gateway = await client.http.get_gateway()
+            gateway = await client.http.get_gateway(compress=compress)
         elif format_gateway:
-            gateway = client.http.format_websocket_url(gateway)
+            gateway = client.http.format_websocket_url(gateway, compress=compress)
 
         socket = await client.http.ws_connect(gateway)
         ws = cls(socket, loop=client.loop)
+        ws._inflater = GATEWAY_INFLATERS[compress]()
 
         # dynamically add attributes needed
         ws.token = client._token  # type: ignore
         ws._connection = client._connection
         ws._discord_parsers = client._connection.parsers
+        ws._skippable_events = client._connection._skippable_events
         ws._dispatch = client.dispatch
         ws.gateway = gateway
         ws.call_hooks = client._connection.call_hooks
@@ -354,6 +740,13 @@ class DiscordWebSocket:
         ws.session_id = session
         ws.sequence = sequence
         ws._max_heartbeat_timeout = client._connection.heartbeat_timeout
+        ws._heartbeat_scheduler = client._heartbeat_scheduler
+        ws._event_executor = client._event_executor
+        if client._gateway_stats is not None:
+            ws._stats = ws._rate_limiter.stats = client._gateway_stats.setdefault(
+                shard_id, GatewayStats()
+            )
+            client._start_gateway_stats()
 
         if client._enable_debug_events:
             ws.send = ws.debug_send
@@ -397,7 +790,7 @@ class DiscordWebSocket:
 
         future = self.loop.create_future()
         entry = EventListener(event=event, predicate=predicate, result=result, future=future)
-        self._dispatch_listeners.append(entry)
+        self._dispatch_listeners.setdefault(event, []).append(entry)
         return future
 
     async def identify(self) -> None:
@@ -445,22 +838,33 @@ class DiscordWebSocket:
         _log.info("Shard ID %s has sent the RESUME payload.", self.shard_id)
 
     async def received_message(self, msg: Union[str, bytes], /) -> None:
-        if type(msg) is bytes:
-            self._buffer.extend(msg)
+        stats = self._stats
+        if stats is not None:
+            stats._record_received(msg)
+            started = time.perf_counter()
 
-            if len(msg) < 4 or msg[-4:] != b"\x00\x00\xff\xff":
+        if type(msg) is bytes:
+            # both json and orjson parse UTF-8 bytes directly
+            msg = self._inflater.feed(msg)  # type: ignore
+            if stats is not None:
+                started = stats._record_decompress(started)
+            if msg is None:
                 return
-            msg = self._zlib.decompress(self._buffer)
-            msg = msg.decode("utf-8")
-            self._buffer = bytearray()
 
         self.log_receive(msg)
         message: Dict[str, Any] = utils.from_json(msg)
+        if stats is not None:
+            stats._record_decode(msg, started)
 
-        _log.debug("For Shard ID %s: WebSocket Event: %s", self.shard_id, msg)
+        if _log.isEnabledFor(logging.DEBUG):
+            if type(msg) is bytes:
+                msg = msg.decode("utf-8")
+            _log.debug("For Shard ID %s: WebSocket Event: %s", self.shard_id, msg)
         event = message.get("t")
         if event:
             self._dispatch("socket_event_type", event)
+            if stats is not None:
+                stats._record_event(event)
 
         op: int = message["op"]
         data: Dict[str, Any] = message["d"]
@@ -493,9 +897,17 @@ class DiscordWebSocket:
 
             if op == self.HELLO:
                 interval = data["heartbeat_interval"] / 1000.0
-                self._keep_alive = KeepAliveHandler(
-                    ws=self, interval=interval, shard_id=self.shard_id
-                )
+                if self._heartbeat_scheduler is not None:
+                    self._keep_alive = ScheduledKeepAlive(
+                        ws=self,
+                        interval=interval,
+                        shard_id=self.shard_id,
+                        scheduler=self._heartbeat_scheduler,
+                    )
+                else:
+                    self._keep_alive = KeepAliveHandler(
+                        ws=self, interval=interval, shard_id=self.shard_id
+                    )
                 # send a heartbeat immediately
                 await self.send_as_json(self._keep_alive.get_payload())
                 self._keep_alive.start()
@@ -542,19 +954,31 @@ class DiscordWebSocket:
                 ", ".join(trace),
             )
 
-        try:
-            func = self._discord_parsers[event]
-        except KeyError:
-            _log.debug("Unknown event %s.", event)
+        if event in self._skippable_events and self._connection._is_event_unused(event):
+            self._connection._parse_unused(event, data)
         else:
-            func(data)
+            try:
+                func = self._discord_parsers[event]
+            except KeyError:
+                _log.debug("Unknown event %s.", event)
+            else:
+                if stats is None:
+                    func(data)
+                else:
+                    stats._record_parse(event, func, data)
+
+        executor = self._event_executor
+        if executor is not None and executor.is_full():
+            # stop reading from the gateway until the queued event handlers make room
+            await executor.wait_for_room()
+
+        # remove the dispatched listeners, only those waiting for this event are checked
+        listeners = self._dispatch_listeners.get(event)
+        if not listeners:
+            return
 
-        # remove the dispatched listeners
         removed = []
-        for index, entry in enumerate(self._dispatch_listeners):
-            if entry.event != event:
-                continue
-
+        for index, entry in enumerate(listeners):
             future = entry.future
             if future.cancelled():
                 removed.append(index)
@@ -572,7 +996,9 @@ class DiscordWebSocket:
                     removed.append(index)
 
         for index in reversed(removed):
-            del self._dispatch_listeners[index]
+            del listeners[index]
+        if not listeners:
+            del self._dispatch_listeners[event]
 
     @property
     def latency(self) -> float:
@@ -630,10 +1056,14 @@ class DiscordWebSocket:
     async def debug_send(self, data: Any, /) -> None:
         await self._rate_limiter.block()
         self._dispatch("socket_raw_send", data)
+        if self._stats is not None:
+            self._stats._record_sent(data)
         await self.socket.send_str(data)
 
     async def send(self, data: Any, /) -> None:
         await self._rate_limiter.block()
+        if self._stats is not None:
+            self._stats._record_sent(data)
         await self.socket.send_str(data)
 
     async def send_as_json(self, data: Any) -> None:
@@ -645,8 +1075,11 @@ class DiscordWebSocket:
 
     async def send_heartbeat(self, data: Any) -> None:
         # This bypasses the rate limit handling code since it has a higher priority
+        payload = utils.to_json(data)
+        if self._stats is not None:
+            self._stats._record_sent(payload)
         try:
-            await self.socket.send_str(utils.to_json(data))
+            await self.socket.send_str(payload)
         except RuntimeError as exc:
             if not self._can_handle_close():
                 raise ConnectionClosed(self.socket, shard_id=self.shard_id) from exc
@@ -956,6 +1389,7 @@ class DiscordVoiceWebSocket:
     async def load_secret_key(self, data: Dict[str, Any]) -> None:
         _log.info("received secret key for voice connection")
         self.secret_key = self._connection.secret_key = data["secret_key"]
+        self._connection._update_encryption()
         # Send a speak command with the "not speaking" state.
         # This also tells Discord our SSRC value, which Discord requires
         # before sending any voice data (and is the real reason why we
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import bisect
 import copy
 import unicodedata
 import warnings
@@ -14,6 +15,7 @@ from typing import (
     ClassVar,
     Dict,
     List,
+    Literal,
     NamedTuple,
     Optional,
     Sequence,
@@ -83,6 +85,7 @@ if TYPE_CHECKING:
     from .application_command import BaseApplicationCommand
     from .audit_logs import AuditLogEntry
     from .auto_moderation import AutoModerationAction
+    from .cache import CacheStore
     from .channel import ForumTag
     from .enums import ForumLayoutType, SortOrderType
     from .file import File
@@ -90,6 +93,7 @@ if TYPE_CHECKING:
     from .permissions import Permissions
     from .state import ConnectionState
     from .template import Template
+    from .types.audit_log import AuditLogEntry as AuditLogEntryPayload
     from .types.auto_moderation import AutoModerationRuleCreate
     from .types.channel import GuildChannel as GuildChannelPayload
     from .types.guild import (
@@ -101,6 +105,7 @@ if TYPE_CHECKING:
     )
     from .types.integration import IntegrationType
     from .types.interactions import ApplicationCommand as ApplicationCommandPayload
+    from .types.member import MemberWithUser as MemberWithUserPayload
     from .types.scheduled_events import ScheduledEvent as ScheduledEventPayload
     from .types.snowflake import SnowflakeList
     from .types.sticker import CreateGuildSticker
@@ -122,6 +127,30 @@ class _GuildLimit(NamedTuple):
     filesize: int
 
 
+_CHANNEL_VIEW_TYPES: Tuple[type, ...] = (
+    TextChannel,
+    VoiceChannel,
+    StageChannel,
+    CategoryChannel,
+    ForumChannel,
+)
+
+
+def _channel_position_key(channel: GuildChannel) -> Tuple[int, int]:
+    return channel.position, channel.id
+
+
+def _category_child_key(channel: GuildChannel) -> Tuple[int, int, int]:
+    return channel._sorting_bucket, channel.position, channel.id
+
+
+def _remove_identical(channels: List[GuildChannel], channel: GuildChannel) -> None:
+    for index, other in enumerate(channels):
+        if other is channel:
+            del channels[index]
+            return
+
+
 class Guild(Hashable):
     """Represents a Discord guild.
 
@@ -285,7 +314,12 @@ class Guild(Hashable):
         "nsfw_level",
         "_application_commands",
         "_members",
+        "_member_names",
+        "_member_name_keys",
+        "_member_indexed_names",
         "_channels",
+        "_channel_views",
+        "_category_children",
         "_icon",
         "_banner",
         "_state",
@@ -307,6 +341,7 @@ class Guild(Hashable):
         "_premium_progress_bar_enabled",
         "_safety_alerts_channel_id",
         "max_stage_video_channel_users",
+        "_permissions_epoch",
     )
 
     _PREMIUM_GUILD_LIMITS: ClassVar[Dict[Optional[int], _GuildLimit]] = {
@@ -318,66 +353,189 @@ class Guild(Hashable):
     }
 
     def __init__(self, *, data: GuildPayload, state: ConnectionState) -> None:
-        self._channels: Dict[int, GuildChannel] = {}
-        self._members: Dict[int, Member] = {}
+        # bumped whenever roles, the owner or channel overwrites change, which
+        # invalidates the role and permission caches of every member
+        self._permissions_epoch: int = 0
+        self._channels: CacheStore[int, GuildChannel] = state._create_store(
+            "channels", self._channel_evicted
+        )
+        # position sorted channels of each type, and the children of every category
+        # (``None`` for channels without one) in the UI order
+        self._channel_views: Dict[type, List[GuildChannel]] = {
+            cls: [] for cls in _CHANNEL_VIEW_TYPES
+        }
+        self._category_children: Dict[Optional[int], List[GuildChannel]] = {}
+        self._members: CacheStore[int, Member] = state._create_store(
+            "members", self._member_evicted
+        )
+        # casefolded username, global name and nickname -> IDs of the members using it,
+        # with the keys also kept sorted for prefix searches
+        self._member_names: Dict[str, Dict[int, None]] = {}
+        self._member_name_keys: List[str] = []
+        self._member_indexed_names: Dict[int, Tuple[str, ...]] = {}
         self._scheduled_events: Dict[int, ScheduledEvent] = {}
         self._voice_states: Dict[int, VoiceState] = {}
-        self._threads: Dict[int, Thread] = {}
+        self._threads: CacheStore[int, Thread] = state._create_store(
+            "threads", self._thread_evicted
+        )
         self._application_commands: Dict[int, BaseApplicationCommand] = {}
         self._state: ConnectionState = state
         self._from_data(data)
 
     def _add_channel(self, channel: GuildChannel, /) -> None:
+        previous = self._channels.get(channel.id)
+        if previous is not None:
+            self._unsort_channel(previous)
+
         self._channels[channel.id] = channel
+        self._sort_channel(channel)
+        self._state._index_channel(channel.id, self.id)
 
     def _remove_channel(self, channel: Snowflake, /) -> None:
-        self._channels.pop(channel.id, None)
+        removed = self._channels.pop(channel.id, None)
+        if removed is not None:
+            self._unsort_channel(removed)
+        self._state._unindex_channel(channel.id)
+
+    def _channel_evicted(self, channel_id: int, channel: GuildChannel) -> None:
+        self._unsort_channel(channel)
+        self._state._unindex_channel(channel_id)
+
+    def _sort_channel(self, channel: GuildChannel, /) -> None:
+        for cls, view in self._channel_views.items():
+            if isinstance(channel, cls):
+                bisect.insort(view, channel, key=_channel_position_key)
+
+        if not isinstance(channel, CategoryChannel):
+            children = self._category_children.setdefault(channel.category_id, [])
+            bisect.insort(children, channel, key=_category_child_key)
+
+    def _unsort_channel(self, channel: GuildChannel, /) -> None:
+        # a channel is re-sorted by removing it before it is updated, so it is
+        # looked up by identity rather than by its (possibly changed) position
+        for cls, view in self._channel_views.items():
+            if isinstance(channel, cls):
+                _remove_identical(view, channel)
+
+        if not isinstance(channel, CategoryChannel):
+            children = self._category_children.get(channel.category_id)
+            if children is not None:
+                _remove_identical(children, channel)
+                if not children:
+                    del self._category_children[channel.category_id]
 
     def _voice_state_for(self, user_id: int, /) -> Optional[VoiceState]:
         return self._voice_states.get(user_id)
 
     def _add_member(self, member: Member, /) -> None:
         self._members[member.id] = member
+        self._index_member(member)
+
+    def _index_member(self, member: Member, /) -> None:
+        names = tuple(
+            {name.casefold() for name in (member.name, member.global_name, member.nick) if name}
+        )
+        previous = self._member_indexed_names.get(member.id)
+        if previous is not None and set(previous) == set(names):
+            return
+
+        self._unindex_member(member.id)
+        self._member_indexed_names[member.id] = names
+        self._state._index_member_guild(member.id, self.id)
+        for name in names:
+            ids = self._member_names.get(name)
+            if ids is None:
+                self._member_names[name] = ids = {}
+                bisect.insort(self._member_name_keys, name)
+            ids[member.id] = None
+
+    def _unindex_member(self, member_id: int, /) -> None:
+        names = self._member_indexed_names.pop(member_id, None)
+        if names is None:
+            return
+
+        self._state._unindex_member_guild(member_id, self.id)
+        for name in names:
+            ids = self._member_names.get(name)
+            if ids is None:
+                continue
+
+            ids.pop(member_id, None)
+            if not ids:
+                del self._member_names[name]
+                index = bisect.bisect_left(self._member_name_keys, name)
+                if index < len(self._member_name_keys) and self._member_name_keys[index] == name:
+                    del self._member_name_keys[index]
+
+    def _members_indexed_as(self, name: str, /) -> List[Member]:
+        # the member store may evict members without going through _remove_member,
+        # so IDs that are no longer cached are dropped here
+        result = []
+        for member_id in list(self._member_names.get(name.casefold(), ())):
+            member = self._members.get(member_id)
+            if member is None:
+                self._unindex_member(member_id)
+            else:
+                result.append(member)
+        return result
 
     def _store_thread(self, payload: ThreadPayload, /) -> Thread:
         thread = Thread(guild=self, state=self._state, data=payload)
-        self._threads[thread.id] = thread
+        self._add_thread(thread)
         return thread
 
     def _remove_member(self, member: Snowflake, /) -> None:
         self._members.pop(member.id, None)
+        self._unindex_member(member.id)
+
+    def _member_evicted(self, member_id: int, _member: Member) -> None:
+        self._unindex_member(member_id)
 
     def _add_thread(self, thread: Thread, /) -> None:
         self._threads[thread.id] = thread
+        self._state._index_channel(thread.id, self.id)
 
     def _remove_thread(self, thread: Snowflake, /) -> None:
         self._threads.pop(thread.id, None)
+        self._state._unindex_channel(thread.id)
+
+    def _thread_evicted(self, thread_id: int, _thread: Thread) -> None:
+        self._state._unindex_channel(thread_id)
 
     def _clear_threads(self) -> None:
+        unindex = self._state._unindex_channel
+        for k in self._threads:
+            unindex(k)
         self._threads.clear()
 
     def _remove_threads_by_channel(self, channel_id: int) -> None:
         to_remove = [k for k, t in self._threads.items() if t.parent_id == channel_id]
+        unindex = self._state._unindex_channel
         for k in to_remove:
             del self._threads[k]
+            unindex(k)
 
     def _filter_threads(self, channel_ids: Set[int]) -> Dict[int, Thread]:
         to_remove: Dict[int, Thread] = {
             k: t for k, t in self._threads.items() if t.parent_id in channel_ids
         }
+        unindex = self._state._unindex_channel
         for k in to_remove:
             del self._threads[k]
+            unindex(k)
         return to_remove
 
     def _add_scheduled_event(self, event: ScheduledEvent) -> None:
         self._scheduled_events[event.id] = event
+        self._state._index_scheduled_event(event.id, self.id)
 
     def _remove_scheduled_event(self, event: int) -> None:
         self._scheduled_events.pop(event, None)
+        self._state._unindex_scheduled_event(event)
 
     def _store_scheduled_event(self, payload: ScheduledEventPayload) -> ScheduledEvent:
         event = ScheduledEvent(guild=self, state=self._state, data=payload)
-        self._scheduled_events[event.id] = event
+        self._add_scheduled_event(event)
         return event
 
     def __str__(self) -> str:
@@ -420,6 +578,9 @@ class Guild(Hashable):
 
         return member, before, after
 
+    def _invalidate_permissions(self) -> None:
+        self._permissions_epoch += 1
+
     def _add_role(self, role: Role, /) -> None:
         # roles get added to the bottom (position 1, pos 0 is @everyone)
         # so since self.roles has the @everyone role, we can't increment
@@ -430,10 +591,12 @@ class Guild(Hashable):
             r.position += not r.is_default()
 
         self._roles[role.id] = role
+        self._invalidate_permissions()
 
     def _remove_role(self, role_id: int, /) -> Role:
         # this raises KeyError if it fails..
         role = self._roles.pop(role_id)
+        self._invalidate_permissions()
 
         # since it didn't, we can change the positions now
         # basically the same as above except we only decrement
@@ -467,6 +630,7 @@ class Guild(Hashable):
         self.unavailable: bool = guild.get("unavailable", False)
         self.id: int = int(guild["id"])
         self._roles: Dict[int, Role] = {}
+        self._invalidate_permissions()
         state = self._state  # speed up attribute access
         for r in guild.get("roles", []):
             role = Role(guild=self, data=r, state=state)
@@ -599,9 +763,7 @@ class Guild(Hashable):
 
         This is sorted by the position and are in UI order from top to bottom.
         """
-        r = [ch for ch in self._channels.values() if isinstance(ch, VoiceChannel)]
-        r.sort(key=lambda c: (c.position, c.id))
-        return r
+        return list(self._channel_views[VoiceChannel])  # type: ignore
 
     @property
     def stage_channels(self) -> List[StageChannel]:
@@ -611,9 +773,7 @@ class Guild(Hashable):
 
         This is sorted by the position and are in UI order from top to bottom.
         """
-        r = [ch for ch in self._channels.values() if isinstance(ch, StageChannel)]
-        r.sort(key=lambda c: (c.position, c.id))
-        return r
+        return list(self._channel_views[StageChannel])  # type: ignore
 
     @property
     def me(self) -> Member:
@@ -635,9 +795,7 @@ class Guild(Hashable):
 
         This is sorted by the position and are in UI order from top to bottom.
         """
-        r = [ch for ch in self._channels.values() if isinstance(ch, TextChannel)]
-        r.sort(key=lambda c: (c.position, c.id))
-        return r
+        return list(self._channel_views[TextChannel])  # type: ignore
 
     @property
     def categories(self) -> List[CategoryChannel]:
@@ -645,9 +803,7 @@ class Guild(Hashable):
 
         This is sorted by the position and are in UI order from top to bottom.
         """
-        r = [ch for ch in self._channels.values() if isinstance(ch, CategoryChannel)]
-        r.sort(key=lambda c: (c.position, c.id))
-        return r
+        return list(self._channel_views[CategoryChannel])  # type: ignore
 
     @property
     def forum_channels(self) -> List[ForumChannel]:
@@ -655,9 +811,7 @@ class Guild(Hashable):
 
         This is sorted by the position and are in UI order from top to bottom.
         """
-        r = [ch for ch in self._channels.values() if isinstance(ch, ForumChannel)]
-        r.sort(key=lambda c: (c.position, c.id))
-        return r
+        return list(self._channel_views[ForumChannel])  # type: ignore
 
     @property
     def scheduled_events(self) -> List[ScheduledEvent]:
@@ -688,26 +842,17 @@ class Guild(Hashable):
         List[Tuple[Optional[:class:`CategoryChannel`], List[:class:`abc.GuildChannel`]]]:
             The categories and their associated channels.
         """
-        grouped: Dict[Optional[int], List[GuildChannel]] = {}
-        for channel in self._channels.values():
-            if isinstance(channel, CategoryChannel):
-                grouped.setdefault(channel.id, [])
-                continue
-
-            try:
-                grouped[channel.category_id].append(channel)
-            except KeyError:
-                grouped[channel.category_id] = [channel]
-
-        def key(t: ByCategoryItem) -> Tuple[Tuple[int, int], List[GuildChannel]]:
-            k, v = t
-            return ((k.position, k.id) if k else (-1, -1), v)
-
-        _get = self._channels.get
-        as_list: List[ByCategoryItem] = [(_get(k), v) for k, v in grouped.items()]  # type: ignore
-        as_list.sort(key=key)
-        for _, channels in as_list:
-            channels.sort(key=lambda c: (c._sorting_bucket, c.position, c.id))
+        children = self._category_children
+        # channels without a category, or whose category isn't cached, come first
+        as_list: List[ByCategoryItem] = [
+            (None, list(channels))
+            for category_id, channels in children.items()
+            if category_id is None or category_id not in self._channels
+        ]
+        as_list.extend(
+            (category, list(children.get(category.id, ())))  # type: ignore
+            for category in self._channel_views[CategoryChannel]
+        )
         return as_list
 
     def _resolve_channel(self, id: Optional[int], /) -> Optional[Union[GuildChannel, Thread]]:
@@ -1080,24 +1225,63 @@ class Guild(Hashable):
             then ``None`` is returned.
         """
 
-        result = None
-        members = self.members
         if len(name) > 5 and name[-5] == "#":
             # The 5 length is checking to see if #0000 is in the string,
             # as a#0000 has a length of 6, the minimum for a potential
             # discriminator lookup.
-            potential_discriminator = name[-4:]
+            username, potential_discriminator = name[:-5], name[-4:]
 
             # do the actual lookup and return if found
             # if it isn't found then we'll do a full name lookup below.
-            result = utils.get(members, name=name[:-5], discriminator=potential_discriminator)
-            if result is not None:
-                return result
+            for member in self._members_indexed_as(username):
+                if member.name == username and member.discriminator == potential_discriminator:
+                    return member
+
+        for member in self._members_indexed_as(name):
+            if name in {member.nick, member.name}:
+                return member
+
+        return None
+
+    def search_members_named(self, prefix: str, /, *, limit: Optional[int] = 25) -> List[Member]:
+        """Returns the cached members whose username, global name or nickname
+        starts with the prefix provided, ignoring case.
+
+        This uses an index kept up to date from the gateway events, so it
+        is suitable for autocomplete callbacks in large guilds.
+
+        .. versionadded:: 3.2
+
+        Parameters
+        ----------
+        prefix: :class:`str`
+            The prefix to look up. An empty prefix matches every member.
+        limit: Optional[:class:`int`]
+            The maximum amount of members to return. ``None`` returns every match.
+            Defaults to ``25``, the maximum amount of autocomplete choices.
+
+        Returns
+        -------
+        List[:class:`Member`]
+            The members matching the prefix, sorted by the matching name.
+        """
 
-        def pred(m: Member) -> bool:
-            return name in {m.nick, m.name}
+        prefix = prefix.casefold()
+        keys = self._member_name_keys
+        found: Dict[int, Member] = {}
+        index = bisect.bisect_left(keys, prefix)
+        while index < len(keys) and keys[index].startswith(prefix):
+            key = keys[index]
+            for member in self._members_indexed_as(key):
+                found.setdefault(member.id, member)
+                if limit is not None and len(found) >= limit:
+                    return list(found.values())
 
-        return utils.find(pred, members)
+            # the key is gone if it only referenced evicted members
+            if index < len(keys) and keys[index] == key:
+                index += 1
+
+        return list(found.values())
 
     def _create_channel(
         self,
@@ -1258,7 +1442,7 @@ class Guild(Hashable):
         # payload *should* contain all text channel info
 
         # temporarily add to the cache
-        self._channels[channel.id] = channel
+        self._add_channel(channel)
         return channel
 
     async def create_voice_channel(
@@ -1351,7 +1535,7 @@ class Guild(Hashable):
         # payload *should* contain all voice channel info
 
         # temporarily add to the cache
-        self._channels[channel.id] = channel
+        self._add_channel(channel)
         return channel
 
     async def create_stage_channel(
@@ -1464,7 +1648,7 @@ class Guild(Hashable):
         # payload *should* contain all stage channel info
 
         # temporarily add to the cache
-        self._channels[channel.id] = channel
+        self._add_channel(channel)
         return channel
 
     async def create_category(
@@ -1509,7 +1693,7 @@ class Guild(Hashable):
         # payload *should* contain all category channel info
 
         # temporarily add to the cache
-        self._channels[channel.id] = channel
+        self._add_channel(channel)
         return channel
 
     async def create_forum_channel(
@@ -1638,7 +1822,7 @@ class Guild(Hashable):
         # payload *should* contain all forum channel info
 
         # temporarily add to the cache
-        self._channels[channel.id] = channel
+        self._add_channel(channel)
         return channel
 
     create_category_channel = create_category
@@ -1995,9 +2179,34 @@ class Guild(Hashable):
         return threads
 
     # TODO: Remove Optional typing here when async iterators are refactored
+    @overload
     def fetch_members(
-        self, *, limit: Optional[int] = 1000, after: Optional[SnowflakeTime] = None
-    ) -> AsyncIterator[Member]:
+        self,
+        *,
+        limit: Optional[int] = ...,
+        after: Optional[SnowflakeTime] = ...,
+        prefetch: int = ...,
+        raw: Literal[False] = ...,
+    ) -> AsyncIterator[Member]: ...
+
+    @overload
+    def fetch_members(
+        self,
+        *,
+        limit: Optional[int] = ...,
+        after: Optional[SnowflakeTime] = ...,
+        prefetch: int = ...,
+        raw: Literal[True],
+    ) -> AsyncIterator[MemberWithUserPayload]: ...
+
+    def fetch_members(
+        self,
+        *,
+        limit: Optional[int] = 1000,
+        after: Optional[SnowflakeTime] = None,
+        prefetch: int = 0,
+        raw: bool = False,
+    ) -> Union[AsyncIterator[Member], AsyncIterator[MemberWithUserPayload]]:
         """|asynciter|
 
         Returns an async iterator that enables receiving the guild's members. In order to use this,
@@ -2020,6 +2229,17 @@ class Guild(Hashable):
             Retrieve members after this date or object.
             If a datetime is provided, it is recommended to use a UTC aware datetime.
             If the datetime is naive, it is assumed to be local time.
+        prefetch: :class:`int`
+            The number of pages to request ahead of the members being consumed, so that
+            fetching the next page overlaps with processing the current one.
+            Defaults to ``0``, which only requests a page once the previous one was consumed.
+
+            .. versionadded:: 3.2
+        raw: :class:`bool`
+            Whether to yield the raw member payloads as :class:`dict` instead of
+            building :class:`.Member` objects. Defaults to ``False``.
+
+            .. versionadded:: 3.2
 
         Raises
         ------
@@ -2045,7 +2265,7 @@ class Guild(Hashable):
         if not self._state._intents.members:
             raise ClientException("Intents.members must be enabled to use this.")
 
-        return member_iterator(self, limit=limit, after=after)
+        return member_iterator(self, limit=limit, after=after, prefetch=prefetch, raw=raw)
 
     async def fetch_member(self, member_id: int, /) -> Member:
         """|coro|
@@ -2154,13 +2374,37 @@ class Guild(Hashable):
         channel: GuildChannel = factory(guild=self, state=self._state, data=data)  # type: ignore
         return channel
 
+    @overload
+    def bans(
+        self,
+        *,
+        limit: Optional[int] = ...,
+        before: Optional[Snowflake] = ...,
+        after: Optional[Snowflake] = ...,
+        prefetch: int = ...,
+        raw: Literal[False] = ...,
+    ) -> AsyncIterator[BanEntry]: ...
+
+    @overload
+    def bans(
+        self,
+        *,
+        limit: Optional[int] = ...,
+        before: Optional[Snowflake] = ...,
+        after: Optional[Snowflake] = ...,
+        prefetch: int = ...,
+        raw: Literal[True],
+    ) -> AsyncIterator[BanPayload]: ...
+
     def bans(
         self,
         *,
         limit: Optional[int] = 1000,
         before: Optional[Snowflake] = None,
         after: Optional[Snowflake] = None,
-    ) -> AsyncIterator[BanEntry]:
+        prefetch: int = 0,
+        raw: bool = False,
+    ) -> Union[AsyncIterator[BanEntry], AsyncIterator[BanPayload]]:
         """|asynciter|
 
         Returns an async iterator that enables receiving the destination's bans.
@@ -2193,6 +2437,17 @@ class Guild(Hashable):
             Retrieve bans before this user.
         after: Optional[:class:`~nextcord.abc.Snowflake`]
             Retrieve bans after this user.
+        prefetch: :class:`int`
+            The number of pages to request ahead of the bans being consumed, so that
+            fetching the next page overlaps with processing the current one.
+            Defaults to ``0``, which only requests a page once the previous one was consumed.
+
+            .. versionadded:: 3.2
+        raw: :class:`bool`
+            Whether to yield the raw ban payloads as :class:`dict` instead of
+            building :class:`BanEntry` objects. Defaults to ``False``.
+
+            .. versionadded:: 3.2
 
         Raises
         ------
@@ -2207,7 +2462,9 @@ class Guild(Hashable):
             The ban with the ban data parsed.
         """
 
-        return ban_iterator(self, limit=limit, before=before, after=after)
+        return ban_iterator(
+            self, limit=limit, before=before, after=after, prefetch=prefetch, raw=raw
+        )
 
     async def prune_members(
         self,
@@ -2794,6 +3051,7 @@ class Guild(Hashable):
             self._roles: Dict[int, Role] = {}
             for role in roles:
                 self._roles[role.id] = role
+            self._invalidate_permissions()
 
         return roles
 
@@ -3206,6 +3464,34 @@ class Guild(Hashable):
         return Invite(state=self._state, data=payload, guild=self, channel=channel)
 
     # TODO: use MISSING when async iterators get refactored
+    @overload
+    def audit_logs(
+        self,
+        *,
+        limit: Optional[int] = ...,
+        before: Optional[SnowflakeTime] = ...,
+        after: Optional[SnowflakeTime] = ...,
+        oldest_first: Optional[bool] = ...,
+        user: Optional[Snowflake] = ...,
+        action: Optional[AuditLogAction] = ...,
+        prefetch: int = ...,
+        raw: Literal[False] = ...,
+    ) -> AsyncIterator[AuditLogEntry]: ...
+
+    @overload
+    def audit_logs(
+        self,
+        *,
+        limit: Optional[int] = ...,
+        before: Optional[SnowflakeTime] = ...,
+        after: Optional[SnowflakeTime] = ...,
+        oldest_first: Optional[bool] = ...,
+        user: Optional[Snowflake] = ...,
+        action: Optional[AuditLogAction] = ...,
+        prefetch: int = ...,
+        raw: Literal[True],
+    ) -> AsyncIterator[AuditLogEntryPayload]: ...
+
     def audit_logs(
         self,
         *,
@@ -3215,7 +3501,9 @@ class Guild(Hashable):
         oldest_first: Optional[bool] = None,
         user: Optional[Snowflake] = None,
         action: Optional[AuditLogAction] = None,
-    ) -> AsyncIterator[AuditLogEntry]:
+        prefetch: int = 0,
+        raw: bool = False,
+    ) -> Union[AsyncIterator[AuditLogEntry], AsyncIterator[AuditLogEntryPayload]]:
         """|asynciter|
 
         Returns an async iterator that enables receiving the guild's audit logs.
@@ -3259,6 +3547,17 @@ class Guild(Hashable):
             The moderator to filter entries from.
         action: Optional[:class:`AuditLogAction`]
             The action to filter with.
+        prefetch: :class:`int`
+            The number of pages to request ahead of the entries being consumed, so that
+            fetching the next page overlaps with processing the current one.
+            Defaults to ``0``, which only requests a page once the previous one was consumed.
+
+            .. versionadded:: 3.2
+        raw: :class:`bool`
+            Whether to yield the raw entry payloads as :class:`dict` instead of
+            building :class:`AuditLogEntry` objects. Defaults to ``False``.
+
+            .. versionadded:: 3.2
 
         Raises
         ------
@@ -3282,6 +3581,8 @@ class Guild(Hashable):
             oldest_first=oldest_first,
             user_id=user_id,
             action_type=action,
+            prefetch=prefetch,
+            raw=raw,
         )
 
     async def widget(self) -> Widget:
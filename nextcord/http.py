@@ -3,17 +3,24 @@
 from __future__ import annotations
 
 import asyncio
+import copy
+import heapq
 import logging
 import sys
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
 from datetime import datetime, timedelta, timezone
 from types import TracebackType
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncIterator,
     ClassVar,
     Coroutine,
     Dict,
     Iterable,
+    Iterator,
     List,
     Literal,
     Optional,
@@ -29,6 +36,7 @@ from urllib.parse import quote as _uriquote
 import aiohttp
 
 from . import __version__, utils
+from .enums import RequestPriority
 from .errors import (
     DiscordException,
     DiscordServerError,
@@ -57,6 +65,7 @@ if TYPE_CHECKING:
         components,
         embed,
         emoji,
+        gateway,
         guild,
         integration,
         interactions,
@@ -85,7 +94,9 @@ if TYPE_CHECKING:
 
 __all__ = (
     "HTTPClient",
+    "RequestQueueStats",
     "Route",
+    "RouteCacheStats",
 )
 
 
@@ -115,6 +126,112 @@ def _get_logging_auth(auth: Optional[str]) -> str:
     return f"{auth[:12]}[redacted]"
 
 
+_request_priority: ContextVar[Optional[RequestPriority]] = ContextVar(
+    "_request_priority", default=None
+)
+
+_MODERATION_ROUTES = frozenset(
+    {
+        ("DELETE", "/guilds/{guild_id}/members/{user_id}"),
+        ("PATCH", "/guilds/{guild_id}/members/{user_id}"),
+        ("PUT", "/guilds/{guild_id}/bans/{user_id}"),
+        ("DELETE", "/guilds/{guild_id}/bans/{user_id}"),
+        ("POST", "/guilds/{guild_id}/bulk-ban"),
+        ("DELETE", "/channels/{channel_id}/messages/{message_id}"),
+        ("POST", "/channels/{channel_id}/messages/bulk-delete"),
+    }
+)
+
+
+def _get_route_priority(route: Route) -> RequestPriority:
+    if route.path.startswith("/interactions/") or "{interaction_token}" in route.path:
+        return RequestPriority.interaction
+
+    if (route.method, route.path) in _MODERATION_ROUTES:
+        return RequestPriority.moderation
+
+    return RequestPriority.default
+
+
+class RequestQueueStats:
+    """Statistics about the requests of one :class:`RequestPriority` waiting on the global rate limit.
+
+    .. versionadded:: 3.2
+
+    Attributes
+    ----------
+    queued: :class:`int`
+        The amount of requests currently waiting for the global rate limit.
+    completed: :class:`int`
+        The amount of requests that acquired the global rate limit, including those that did not have to wait.
+    total_wait: :class:`float`
+        The total time in seconds that requests waited for the global rate limit.
+    max_wait: :class:`float`
+        The longest time in seconds that a request waited for the global rate limit.
+    """
+
+    __slots__ = ("queued", "completed", "total_wait", "max_wait")
+
+    def __init__(self) -> None:
+        self.queued: int = 0
+        self.completed: int = 0
+        self.total_wait: float = 0.0
+        self.max_wait: float = 0.0
+
+    @property
+    def average_wait(self) -> float:
+        """:class:`float`: The average time in seconds that a request waited for the global rate limit."""
+        if not self.completed:
+            return 0.0
+
+        return self.total_wait / self.completed
+
+    def _record(self, waited: float) -> None:
+        self.completed += 1
+        self.total_wait += waited
+        self.max_wait = max(waited, self.max_wait)
+
+    def _copy(self) -> RequestQueueStats:
+        copy = RequestQueueStats()
+        copy.queued = self.queued
+        copy.completed = self.completed
+        copy.total_wait = self.total_wait
+        copy.max_wait = self.max_wait
+        return copy
+
+    def __repr__(self) -> str:
+        return (
+            f"<RequestQueueStats queued={self.queued} completed={self.completed} "
+            f"average_wait={self.average_wait:.3f} max_wait={self.max_wait:.3f}>"
+        )
+
+
+class RouteCacheStats:
+    """Statistics about the coalesced and cached ``GET`` requests of one route.
+
+    .. versionadded:: 3.2
+
+    Attributes
+    ----------
+    hits: :class:`int`
+        The amount of requests answered from the response cache.
+    coalesced: :class:`int`
+        The amount of requests that shared an identical request already in flight.
+    misses: :class:`int`
+        The amount of requests that were sent to Discord.
+    """
+
+    __slots__ = ("hits", "coalesced", "misses")
+
+    def __init__(self) -> None:
+        self.hits: int = 0
+        self.coalesced: int = 0
+        self.misses: int = 0
+
+    def __repr__(self) -> str:
+        return f"<RouteCacheStats hits={self.hits} coalesced={self.coalesced} misses={self.misses}>"
+
+
 class Route:
     BASE: ClassVar[str] = f"https://discord.com/api/v{_API_VERSION}"
 
@@ -415,19 +532,101 @@ class GlobalRateLimit(RateLimit):
     """
     Represents the global rate limit, and thus has to have slightly modified behavior.
 
+    Requests that have to wait are admitted with weighted fair queuing by their :class:`RequestPriority`,
+    so urgent requests are not stuck behind a large backlog of less urgent ones.
+
     Still not thread safe.
     """
 
+    _priority_weights: ClassVar[Dict[RequestPriority, int]] = {
+        RequestPriority.interaction: 8,
+        RequestPriority.moderation: 4,
+        RequestPriority.default: 2,
+        RequestPriority.bulk: 1,
+    }
+    """The share of the rate limit each priority gets while requests of several priorities are waiting."""
+
     def __init__(self, time_offset: float = 0.0, *args, **kwargs) -> None:
         super().__init__(time_offset=time_offset, use_reset_timestamp=False)
+        self._waiters: List[Tuple[float, int, RequestPriority, asyncio.Future[None]]] = []
+        """Heap of (virtual finish time, sequence, priority, future) for requests waiting to acquire."""
+        self._waiter_count: int = 0
+        self._virtual_time: float = 0.0
+        self._last_finish: Dict[RequestPriority, float] = {}
+        self.stats: Dict[RequestPriority, RequestQueueStats] = {
+            priority: RequestQueueStats() for priority in RequestPriority
+        }
+        """Queue statistics per request priority."""
+
+    @property
+    def locked(self) -> bool:
+        # Pending waiters are served before new requests, keeping the order fair.
+        return self.remaining <= 0 or bool(self._waiters)
+
+    @asynccontextmanager
+    async def prioritized(self, priority: RequestPriority) -> AsyncIterator[None]:
+        """Acquires the rate limit with the given priority for the duration of the context."""
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+    async def acquire(self, priority: RequestPriority = RequestPriority.default) -> bool:
+        stats = self.stats[priority]
+        if self.remaining > 0 and not self._waiters:
+            self.remaining -= 1
+            stats._record(0.0)
+        else:
+            weight = self._priority_weights[priority]
+            finish = max(self._virtual_time, self._last_finish.get(priority, 0.0)) + 1 / weight
+            self._last_finish[priority] = finish
+            future = asyncio.get_running_loop().create_future()
+            self._waiter_count += 1
+            entry = (finish, self._waiter_count, priority, future)
+            heapq.heappush(self._waiters, entry)
+            stats.queued += 1
+            _log.debug("Bucket %s: Queued a request with priority %s.", self.bucket, priority.name)
+            if not self.resetting:
+                self.start_reset_task()
+
+            start = time.perf_counter()
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future.cancelled():
+                    self._waiters.remove(entry)
+                    heapq.heapify(self._waiters)
+                else:
+                    # The slot was handed to us right before cancellation, give it to someone else.
+                    self.remaining += 1
+                    self._wake_waiters()
+                raise
+            finally:
+                stats.queued -= 1
+
+            stats._record(time.perf_counter() - start)
 
-    async def acquire(self) -> bool:
-        ret = await super().acquire()
         # As updates are little weird, it's best to start the reset task as soon as the first request has acquired.
         if not self.resetting:
             self.start_reset_task()
 
-        return ret
+        return True
+
+    def _wake_waiters(self) -> None:
+        waiters = self._waiters
+        while waiters and self.remaining > 0:
+            finish, _, _, future = heapq.heappop(waiters)
+            self._virtual_time = finish
+            self.remaining -= 1
+            future.set_result(None)
+
+        if not waiters:
+            self._last_finish.clear()
+
+    async def reset_remaining(self, time: float) -> None:
+        await super().reset_remaining(time)
+        self._wake_waiters()
 
     async def update(self, response: aiohttp.ClientResponse) -> None:
         if (
@@ -514,6 +713,16 @@ class HTTPClient:
     ratelimit_shed_threshold: :class:`int`
         Minimum time in seconds after a rate limit has been reset before shedding it. The higher the number, the longer
         an unused rate limit will be kept. Should be greater or equal to 0.
+    coalesce_get_requests: :class:`bool`
+        Whether identical ``GET`` requests (same route, query parameters and authorization) made while one is
+        already in flight should share its response instead of being sent again.
+
+        .. versionadded:: 3.2
+    get_cache_ttls: Optional[:class:`dict`[:class:`str`, :class:`float`]]
+        A mapping of route paths, such as ``"/channels/{channel_id}/messages/{message_id}"``, to the amount of seconds
+        successful ``GET`` responses of that route are cached for. Requests to these routes are also coalesced.
+
+        .. versionadded:: 3.2
     """
 
     def __init__(
@@ -529,6 +738,8 @@ class HTTPClient:
         dispatch: DispatchProtocol,
         ratelimit_shed_timer: Optional[int] = 300,
         ratelimit_shed_threshold: int = 600,
+        coalesce_get_requests: bool = False,
+        get_cache_ttls: Optional[Dict[str, float]] = None,
     ) -> None:
         self.__session: aiohttp.ClientSession = MISSING  # filled in static_login
         self._connector = connector
@@ -544,6 +755,17 @@ class HTTPClient:
         self._ratelimit_shed_timer = ratelimit_shed_timer
         self._ratelimit_shed_threshold = ratelimit_shed_threshold
         self._ratelimit_shed_task: Optional[asyncio.Task[None]] = None
+        self._coalesce_get_requests: bool = coalesce_get_requests
+        self._get_cache_ttls: Dict[str, float] = get_cache_ttls or {}
+        self._get_requests_in_flight: Dict[Tuple[Any, ...], asyncio.Task[Any]] = {}
+        """{(url, query parameters, auth string): Task} of coalesced GET requests being sent."""
+        self._get_cache: Dict[Tuple[Any, ...], Tuple[float, Any]] = {}
+        """{(url, query parameters, auth string): (expiry, response)} of cached GET responses."""
+        self._get_cache_expiries: List[Tuple[float, int, Tuple[Any, ...]]] = []
+        """Heap of (expiry, insertion count, key) of the cached GET responses, to evict expired ones."""
+        self._get_cache_inserted: int = 0
+        self.route_cache_stats: Dict[str, RouteCacheStats] = {}
+        """Coalescing and response cache statistics per route path."""
 
         # to mitigate breaking changes
         self._user_agent: str = _USER_AGENT
@@ -604,6 +826,40 @@ class HTTPClient:
     def set_default_auth(self, auth: Optional[str]) -> None:
         self._default_auth = auth
 
+    @staticmethod
+    @contextmanager
+    def request_priority(priority: RequestPriority) -> Iterator[None]:
+        """Sets the priority of requests made within this context, including in tasks created within it.
+
+        .. versionadded:: 3.2
+        """
+        token = _request_priority.set(priority)
+        try:
+            yield
+        finally:
+            _request_priority.reset(token)
+
+    def get_request_queue_stats(
+        self, auth: Optional[str] = MISSING
+    ) -> Dict[RequestPriority, RequestQueueStats]:
+        """Returns a snapshot of the global rate limit queue statistics per priority for the given
+        authorization.
+
+        .. versionadded:: 3.2
+
+        Parameters
+        ----------
+        auth: Optional[:class:`str`]
+            Authorization string to get the statistics of. If left unset, the default auth will be used.
+        """
+        if auth is MISSING:
+            auth = self._default_auth
+
+        if (global_rate_limit := self._global_rate_limits.get(auth)) is None:
+            return {priority: RequestQueueStats() for priority in RequestPriority}
+
+        return {priority: stats._copy() for priority, stats in global_rate_limit.stats.items()}
+
     def _make_headers(
         self,
         original_headers: dict[str, str],
@@ -719,6 +975,7 @@ class HTTPClient:
         form: Optional[Iterable[Dict[str, Any]]] = None,
         auth: Optional[str] = MISSING,
         retry_request: bool = True,
+        priority: Optional[RequestPriority] = None,
         **kwargs: Any,
     ) -> Any:
         """|coro|
@@ -743,6 +1000,11 @@ class HTTPClient:
             or 429s. (ratelimit issues)
             If `False`, the request will raise an exception immediately if a 500 or 429 error is encountered or if the
             internally tracked rate limits are locked.
+        priority: Optional[:class:`RequestPriority`]
+            The priority to wait for the global rate limit with. If ``None``, the priority set with
+            :meth:`request_priority` is used, falling back to the default priority of the route.
+
+            .. versionadded:: 3.2
         kwargs
             This is purposefully undocumented. Behavior of extra kwargs may change in a breaking way at any point, and
             extra kwargs may not be allowed in the future.
@@ -766,6 +1028,119 @@ class HTTPClient:
 
         auth = headers.get("Authorization")
 
+        if priority is None:
+            priority = _request_priority.get()
+            if priority is None:
+                priority = _get_route_priority(route)
+
+        if route.method == "GET" and not files and not form:
+            ttl = self._get_cache_ttls.get(route.path)
+            if ttl is not None or self._coalesce_get_requests:
+                return await self._coalesced_get(
+                    route,
+                    ttl=ttl,
+                    headers=headers,
+                    auth=auth,
+                    retry_request=retry_request,
+                    priority=priority,
+                    **kwargs,
+                )
+
+        return await self._send_request(
+            route,
+            headers=headers,
+            auth=auth,
+            files=files,
+            form=form,
+            retry_request=retry_request,
+            priority=priority,
+            **kwargs,
+        )
+
+    async def _coalesced_get(
+        self,
+        route: Route,
+        *,
+        ttl: Optional[float],
+        headers: Dict[str, str],
+        auth: Optional[str],
+        retry_request: bool,
+        priority: RequestPriority,
+        **kwargs: Any,
+    ) -> Any:
+        params = kwargs.get("params")
+        key = (
+            route.url,
+            tuple(sorted(params.items())) if params else None,
+            auth,
+        )
+        if (stats := self.route_cache_stats.get(route.path)) is None:
+            stats = self.route_cache_stats[route.path] = RouteCacheStats()
+
+        if (cached := self._get_cache.get(key)) is not None:
+            if cached[0] > time.monotonic():
+                stats.hits += 1
+                return copy.deepcopy(cached[1])
+
+            del self._get_cache[key]
+
+        if (task := self._get_requests_in_flight.get(key)) is not None:
+            stats.coalesced += 1
+            # Every caller gets its own copy, the response may be mutated by models.
+            return copy.deepcopy(await asyncio.shield(task))
+
+        stats.misses += 1
+        task = asyncio.create_task(
+            self._send_request(
+                route,
+                headers=headers,
+                auth=auth,
+                files=None,
+                form=None,
+                retry_request=retry_request,
+                priority=priority,
+                **kwargs,
+            )
+        )
+        self._get_requests_in_flight[key] = task
+
+        def done(task: asyncio.Task[Any]) -> None:
+            del self._get_requests_in_flight[key]
+            if ttl is not None and not task.cancelled() and task.exception() is None:
+                self._cache_get_response(key, ttl, task.result())
+
+        task.add_done_callback(done)
+        return copy.deepcopy(await asyncio.shield(task))
+
+    def _cache_get_response(self, key: Tuple[Any, ...], ttl: float, response: Any) -> None:
+        now = time.monotonic()
+        expiries = self._get_cache_expiries
+        # responses that expired are evicted as new ones come in, so responses of
+        # routes with an ID in their path don't pile up until they are looked up again
+        while expiries and expiries[0][0] <= now:
+            expiry, _, expired_key = heapq.heappop(expiries)
+            cached = self._get_cache.get(expired_key)
+            # the key may have been cached again since, with a later expiry
+            if cached is not None and cached[0] == expiry:
+                del self._get_cache[expired_key]
+
+        expiry = now + ttl
+        self._get_cache[key] = (expiry, response)
+        self._get_cache_inserted += 1
+        heapq.heappush(expiries, (expiry, self._get_cache_inserted, key))
+
+    async def _send_request(
+        self,
+        route: Route,
+        *,
+        headers: Dict[str, str],
+        auth: Optional[str],
+        files: Optional[Sequence[File]],
+        form: Optional[Iterable[Dict[str, Any]]],
+        retry_request: bool,
+        priority: RequestPriority,
+        **kwargs: Any,
+    ) -> Any:
         # If a global rate limit for this authorization doesn't exist yet, make it.
         if (global_rate_limit := self._global_rate_limits.get(auth)) is None:
             global_rate_limit = self._make_global_rate_limit(auth, self._max_global_requests)
@@ -809,7 +1184,7 @@ class HTTPClient:
         for retry_count in range(max_retry_count):  # To prevent infinite loops.
             should_retry = False
             try:
-                async with global_rate_limit, url_rate_limit:
+                async with global_rate_limit.prioritized(priority), url_rate_limit:
                     # This check is for asyncio.gather()'d requests where the rate limit can change.
                     if (
                         temp := self._get_url_rate_limit(route.method, route, auth)
@@ -1087,15 +1462,27 @@ class HTTPClient:
 
         return should_retry
 
+    @staticmethod
+    def _cdn_response_error(resp: aiohttp.ClientResponse) -> HTTPException:
+        if resp.status == 404:
+            return NotFound(resp, "asset not found")
+        if resp.status == 403:
+            return Forbidden(resp, "cannot retrieve asset")
+        return HTTPException(resp, "failed to get asset")
+
     async def get_from_cdn(self, url: str) -> bytes:
         async with self.__session.get(url) as resp:
             if resp.status == 200:
                 return await resp.read()
-            if resp.status == 404:
-                raise NotFound(resp, "asset not found")
-            if resp.status == 403:
-                raise Forbidden(resp, "cannot retrieve asset")
-            raise HTTPException(resp, "failed to get asset")
+            raise self._cdn_response_error(resp)
+
+    async def stream_from_cdn(self, url: str, *, chunk_size: int = 65536) -> AsyncIterator[bytes]:
+        async with self.__session.get(url) as resp:
+            if resp.status != 200:
+                raise self._cdn_response_error(resp)
+
+            async for chunk in resp.content.iter_chunked(chunk_size):
+                yield chunk
 
     # state management
 
@@ -1105,6 +1492,8 @@ class HTTPClient:
 
         self._url_rate_limits.clear()
         self._global_rate_limits.clear()
+        self._get_cache.clear()
+        self._get_cache_expiries.clear()
 
         if self._ratelimit_shed_task is not None and not self._ratelimit_shed_task.done():
             self._ratelimit_shed_task.cancel()
@@ -4478,18 +4867,28 @@ class HTTPClient:
         )
 
     @staticmethod
-    def format_websocket_url(url: str, encoding: str = "json", zlib: bool = True) -> str:
-        if zlib:
-            value = "{url}?encoding={encoding}&v={version}&compress=zlib-stream"
+    def format_websocket_url(
+        url: str,
+        encoding: str = "json",
+        zlib: bool = True,
+        *,
+        compress: Optional[str] = None,
+    ) -> str:
+        if compress is None and zlib:
+            compress = "zlib-stream"
+
+        if compress:
+            value = "{url}?encoding={encoding}&v={version}&compress={compress}"
         else:
             value = "{url}?encoding={encoding}&v={version}"
-        return value.format(url=url, encoding=encoding, version=_API_VERSION)
+        return value.format(url=url, encoding=encoding, version=_API_VERSION, compress=compress)
 
     async def get_gateway(
         self,
         *,
         encoding: str = "json",
         zlib: bool = True,
+        compress: Optional[str] = None,
         auth: Optional[str] = MISSING,
         retry_request: bool = True,
     ) -> str:
@@ -4502,18 +4901,19 @@ class HTTPClient:
         except HTTPException as exc:
             raise GatewayNotFound from exc
 
-        return self.format_websocket_url(data["url"], encoding, zlib)
+        return self.format_websocket_url(data["url"], encoding, zlib, compress=compress)
 
     async def get_bot_gateway(
         self,
         *,
         encoding: str = "json",
         zlib: bool = True,
+        compress: Optional[str] = None,
         auth: Optional[str] = MISSING,
         retry_request: bool = True,
-    ) -> Tuple[int, str]:
+    ) -> Tuple[int, str, gateway.SessionStartLimit]:
         try:
-            data = await self.request(
+            data: gateway.GatewayBot = await self.request(
                 Route("GET", "/gateway/bot"),
                 auth=auth,
                 retry_request=retry_request,
@@ -4521,7 +4921,11 @@ class HTTPClient:
         except HTTPException as exc:
             raise GatewayNotFound from exc
 
-        return data["shards"], self.format_websocket_url(data["url"], encoding, zlib)
+        return (
+            data["shards"],
+            self.format_websocket_url(data["url"], encoding, zlib, compress=compress),
+            data["session_start_limit"],
+        )
 
     def get_user(
         self,
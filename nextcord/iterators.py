@@ -3,8 +3,20 @@
 
 from __future__ import annotations
 
+import asyncio
 import datetime
-from typing import TYPE_CHECKING, Awaitable, Callable, List, Optional, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from .audit_logs import AuditLogEntry
 from .auto_moderation import AutoModerationRule
@@ -32,7 +44,7 @@ if TYPE_CHECKING:
     from .member import Member
     from .message import Message
     from .scheduled_events import ScheduledEvent
-    from .types.audit_log import AuditLog as AuditLogPayload
+    from .types.audit_log import AuditLog as AuditLogPayload, AuditLogEntry as AuditLogEntryPayload
     from .types.guild import Ban as BanPayload, Guild as GuildPayload
     from .types.member import MemberWithUser
     from .types.message import Message as MessagePayload
@@ -43,9 +55,51 @@ if TYPE_CHECKING:
     from .types.threads import Thread as ThreadPayload, ThreadPaginationPayload
 
 
+T = TypeVar("T")
+
 OLDEST_OBJECT = Object(id=0)
 
 
+async def _prefetch_pages(pages: AsyncIterator[T], prefetch: int) -> AsyncIterator[T]:
+    """Yields the pages of ``pages``, requesting up to ``prefetch`` pages ahead of the consumer.
+
+    With a ``prefetch`` of ``0`` pages are only requested once the previous one was consumed.
+    """
+    if prefetch <= 0:
+        async for page in pages:
+            yield page
+        return
+
+    # (page, None) for a page, (None, exception) if requesting a page failed
+    # and (None, None) once every page was requested
+    queue: asyncio.Queue[Tuple[Optional[T], Optional[BaseException]]] = asyncio.Queue(
+        maxsize=prefetch
+    )
+
+    async def producer() -> None:
+        try:
+            async for page in pages:
+                await queue.put((page, None))
+        except Exception as exc:
+            await queue.put((None, exc))
+        else:
+            await queue.put((None, None))
+        finally:
+            await pages.aclose()
+
+    task = asyncio.create_task(producer())
+    try:
+        while True:
+            page, exc = await queue.get()
+            if exc is not None:
+                raise exc
+            if page is None:
+                return
+            yield page
+    finally:
+        task.cancel()
+
+
 async def reaction_iterator(
     message: Message, emoji: str, limit: int = 100, after: Optional[Snowflake] = None
 ):
@@ -85,6 +139,8 @@ async def history_iterator(
     after: Optional[SnowflakeTime] = None,
     around: Optional[SnowflakeTime] = None,
     oldest_first: Optional[bool] = None,
+    prefetch: int = 0,
+    raw: bool = False,
 ):
     """Iterator for receiving a channel's message history.
 
@@ -122,6 +178,10 @@ async def history_iterator(
     oldest_first: Optional[:class:`bool`]
         If set to ``True``, return messages in oldest->newest order. Defaults to
         ``True`` if ``after`` is specified, otherwise ``False``.
+    prefetch: :class:`int`
+        The number of pages to request ahead of the ones being consumed.
+    raw: :class:`bool`
+        Whether to yield the message payloads instead of :class:`~nextcord.Message` objects.
     """
     if isinstance(before, datetime.datetime):
         before = Object(id=time_snowflake(before, high=False))
@@ -171,36 +231,41 @@ async def history_iterator(
 
         return retrieve > 0
 
-    while get_retrieve():
-        data: List[MessagePayload] = await state.http.logs_from(
-            channel.id,
-            retrieve,
-            before.id if before is not None and around is None else None,
-            after.id if after is not None and around is None else None,
-            around.id if around is not None else None,
-        )
+    async def pages() -> AsyncIterator[List[MessagePayload]]:
+        nonlocal limit, before, after, around
+        while get_retrieve():
+            data: List[MessagePayload] = await state.http.logs_from(
+                channel.id,
+                retrieve,
+                before.id if before is not None and around is None else None,
+                after.id if after is not None and around is None else None,
+                around.id if around is not None else None,
+            )
 
-        if data:
-            if limit is not None:
-                limit -= retrieve
+            if data:
+                if limit is not None:
+                    limit -= retrieve
 
-            if before is not None:
-                before = Object(id=int(data[-1]["id"]))
-            if after is not None:
-                after = Object(id=int(data[0]["id"]))
-            if around is not None:
-                around = None
+                if before is not None:
+                    before = Object(id=int(data[-1]["id"]))
+                if after is not None:
+                    after = Object(id=int(data[0]["id"]))
+                if around is not None:
+                    around = None
 
-        if len(data) < 100:
-            limit = 0
+            if len(data) < 100:
+                limit = 0
+
+            if checks:
+                data = list(filter(check, data))
+            if reverse:
+                data = list(reversed(data))
 
-        if checks:
-            data = list(filter(check, data))
-        if reverse:
-            data = list(reversed(data))
+            yield data
 
+    async for data in _prefetch_pages(pages(), prefetch):
         for item in data:
-            yield state.create_message(channel=channel, data=item)
+            yield item if raw else state.create_message(channel=channel, data=item)
 
 
 async def ban_iterator(
@@ -208,6 +273,8 @@ async def ban_iterator(
     limit: Optional[int] = None,
     before: Optional[Snowflake] = None,
     after: Optional[Snowflake] = None,
+    prefetch: int = 0,
+    raw: bool = False,
 ):
     """Iterator for receiving a guild's bans.
 
@@ -237,6 +304,10 @@ async def ban_iterator(
         Date or user id before which all bans must be.
     after: Optional[:class:`abc.Snowflake`]
         Date or user id after which all bans must be.
+    prefetch: :class:`int`
+        The number of pages to request ahead of the ones being consumed.
+    raw: :class:`bool`
+        Whether to yield the ban payloads instead of :class:`~nextcord.BanEntry` objects.
     """
     state = guild._state
     retrieve = 0
@@ -247,28 +318,37 @@ async def ban_iterator(
 
         return retrieve > 0
 
-    while get_retrieve():
-        data: List[BanPayload] = await state.http.get_bans(
-            guild.id,
-            retrieve,
-            before=before.id if before is not None else None,
-            after=after.id if after is not None else None,
-        )
+    async def pages() -> AsyncIterator[List[BanPayload]]:
+        nonlocal limit, before, after
+        while get_retrieve():
+            data: List[BanPayload] = await state.http.get_bans(
+                guild.id,
+                retrieve,
+                before=before.id if before is not None else None,
+                after=after.id if after is not None else None,
+            )
 
-        if data:
-            if limit:
-                limit -= len(data)
+            if data:
+                if limit:
+                    limit -= len(data)
 
-            if before is not None:
-                before = Object(id=int(data[0]["user"]["id"]))
-            if after is not None:
-                after = Object(id=int(data[-1]["user"]["id"]))
+                if before is not None:
+                    before = Object(id=int(data[0]["user"]["id"]))
+                if after is not None:
+                    after = Object(id=int(data[-1]["user"]["id"]))
 
-        if len(data) < 1000:
-            limit = 0
+            if len(data) < 1000:
+                limit = 0
 
+            yield data
+
+    async for data in _prefetch_pages(pages(), prefetch):
         for item in data:
-            yield BanEntry(user=state.create_user(item["user"]), reason=item["reason"])
+            yield (
+                item
+                if raw
+                else BanEntry(user=state.create_user(item["user"]), reason=item["reason"])
+            )
 
 
 async def audit_log_iterator(
@@ -279,6 +359,8 @@ async def audit_log_iterator(
     oldest_first: Optional[bool] = None,
     user_id: Optional[int] = None,
     action_type: Optional[AuditLogAction] = None,
+    prefetch: int = 0,
+    raw: bool = False,
 ):
     if isinstance(before, datetime.datetime):
         before = Object(id=time_snowflake(before, high=False))
@@ -296,28 +378,38 @@ async def audit_log_iterator(
 
         return retrieve > 0
 
-    while get_retrieve():
-        data: AuditLogPayload = await state.http.get_audit_logs(
-            guild.id,
-            limit=retrieve,
-            user_id=user_id,
-            action_type=action_type,
-            before=before.id if before is not None else None,
-            after=after.id if after is not None else None,
-        )
+    async def pages() -> AsyncIterator[Tuple[AuditLogPayload, List[AuditLogEntryPayload]]]:
+        nonlocal limit, before
+        while get_retrieve():
+            data: AuditLogPayload = await state.http.get_audit_logs(
+                guild.id,
+                limit=retrieve,
+                user_id=user_id,
+                action_type=action_type,
+                before=before.id if before is not None else None,
+                after=after.id if after is not None else None,
+            )
 
-        entries = data.get("audit_log_entries", [])
-        if data and entries:
-            if limit is not None:
-                limit -= retrieve
+            entries = data.get("audit_log_entries", [])
+            if data and entries:
+                if limit is not None:
+                    limit -= retrieve
+
+                before = Object(id=int(entries[-1]["id"]))
 
-            before = Object(id=int(entries[-1]["id"]))
+            if len(entries) < 100:
+                limit = 0
 
-        if len(entries) < 100:
-            limit = 0
+            if reverse:
+                entries = list(reversed(entries))
 
-        if reverse:
-            entries = list(reversed(entries))
+            yield data, entries
+
+    async for data, entries in _prefetch_pages(pages(), prefetch):
+        if raw:
+            for item in entries:
+                yield item
+            continue
 
         auto_moderation_rules = {
             int(rule["id"]): AutoModerationRule(data=rule, state=state)
@@ -340,6 +432,8 @@ async def guild_iterator(
     with_counts: bool = False,
     before: Optional[SnowflakeTime] = None,
     after: Optional[SnowflakeTime] = None,
+    prefetch: int = 0,
+    raw: bool = False,
 ):
     """Iterator for receiving the client's guilds.
 
@@ -377,6 +471,10 @@ async def guild_iterator(
         Object before which all guilds must be.
     after: Optional[Union[:class:`abc.Snowflake`, :class:`datetime.datetime`]]
         Object after which all guilds must be.
+    prefetch: :class:`int`
+        The number of pages to request ahead of the ones being consumed.
+    raw: :class:`bool`
+        Whether to yield the guild payloads instead of :class:`~nextcord.Guild` objects.
     """
     from .guild import Guild
 
@@ -404,39 +502,46 @@ async def guild_iterator(
 
         return retrieve > 0
 
-    while get_retrieve():
-        data: List[GuildPayload] = await state.http.get_guilds(
-            retrieve,
-            before=before.id if before is not None else None,
-            after=after.id if after is not None else None,
-            with_counts=with_counts,
-        )
+    async def pages() -> AsyncIterator[List[GuildPayload]]:
+        nonlocal limit, before, after
+        while get_retrieve():
+            data: List[GuildPayload] = await state.http.get_guilds(
+                retrieve,
+                before=before.id if before is not None else None,
+                after=after.id if after is not None else None,
+                with_counts=with_counts,
+            )
 
-        if data:
-            if limit is not None:
-                limit -= retrieve
+            if data:
+                if limit is not None:
+                    limit -= retrieve
 
-            if before is not None:
-                before = Object(id=int(data[0]["id"]))
-            if after is not None:
-                after = Object(id=int(data[-1]["id"]))
+                if before is not None:
+                    before = Object(id=int(data[0]["id"]))
+                if after is not None:
+                    after = Object(id=int(data[-1]["id"]))
+
+            if len(data) < 200:
+                limit = 0
 
-        if len(data) < 200:
-            limit = 0
+            if check is not None:
+                data = list(filter(check, data))
+            if reverse:
+                data = list(reversed(data))
 
-        if check is not None:
-            data = list(filter(check, data))
-        if reverse:
-            data = list(reversed(data))
+            yield data
 
+    async for data in _prefetch_pages(pages(), prefetch):
         for item in data:
-            yield Guild(state=state, data=item)
+            yield item if raw else Guild(state=state, data=item)
 
 
 async def member_iterator(
     guild: Guild,
     limit: Optional[int] = 1000,
     after: Optional[Union[Snowflake, datetime.datetime]] = None,
+    prefetch: int = 0,
+    raw: bool = False,
 ):
     from .member import Member
 
@@ -453,16 +558,21 @@ async def member_iterator(
 
         return retrieve > 0
 
-    while get_retrieve():
-        data: List[MemberWithUser] = await state.http.get_members(guild.id, retrieve, after.id)
+    async def pages() -> AsyncIterator[List[MemberWithUser]]:
+        nonlocal limit, after
+        while get_retrieve():
+            data: List[MemberWithUser] = await state.http.get_members(guild.id, retrieve, after.id)
+
+            if len(data) < 1000:
+                limit = 0
 
-        if len(data) < 1000:
-            limit = 0
+            after = Object(id=int(data[-1]["user"]["id"]))
 
-        after = Object(id=int(data[-1]["user"]["id"]))
+            yield data
 
+    async for data in _prefetch_pages(pages(), prefetch):
         for item in reversed(data):
-            yield Member(data=item, guild=guild, state=state)
+            yield item if raw else Member(data=item, guild=guild, state=state)
 
 
 async def archived_thread_iterator(
@@ -248,6 +248,10 @@ class Member(abc.Messageable, _UserTag):
         "_timeout",
         "_flags",
         "_banner",
+        "_cache_epoch",
+        "_cached_roles",
+        "_cached_guild_permissions",
+        "_cached_channel_permissions",
     )
 
     if TYPE_CHECKING:
@@ -289,6 +293,7 @@ class Member(abc.Messageable, _UserTag):
         )
         self._flags: int = data.get("flags", 0)
         self._banner: Optional[str] = data.get("banner")
+        self._invalidate_cache()
 
     def __str__(self) -> str:
         return str(self._user)
@@ -319,10 +324,16 @@ class Member(abc.Messageable, _UserTag):
         self.joined_at = utils.parse_time(data.get("joined_at"))
         self.premium_since = utils.parse_time(data.get("premium_since"))
         self._roles = utils.SnowflakeList(map(int, data["roles"]))
-        self.nick = data.get("nick", None)
+        nick = data.get("nick", None)
         self.pending = data.get("pending", False)
         self._timeout = utils.parse_time(data.get("communication_disabled_until"))
         self._flags = data.get("flags", 0)
+        self._invalidate_cache()
+        if nick != self.nick:
+            self.nick = nick
+            # without the members intent, messages are where nickname changes are seen
+            if self.guild._members.get(self.id) is self:
+                self.guild._index_member(self)
 
     @classmethod
     def _try_upgrade(
@@ -341,10 +352,12 @@ class Member(abc.Messageable, _UserTag):
     def _copy(cls, member: Self) -> Self:
         self = cls.__new__(cls)  # to bypass __init__
 
-        self._roles = utils.SnowflakeList(member._roles, is_sorted=True)
+        # the role list and client status are shared with the original, updates
+        # replace them rather than mutating them so this stays a valid snapshot
+        self._roles = member._roles
         self.joined_at = member.joined_at
         self.premium_since = member.premium_since
-        self._client_status = member._client_status.copy()
+        self._client_status = member._client_status
         self.guild = member.guild
         self.nick = member.nick
         self.pending = member.pending
@@ -354,6 +367,7 @@ class Member(abc.Messageable, _UserTag):
         self._timeout = member._timeout
         self._flags = member._flags
         self._banner = member._banner
+        self._invalidate_cache()
 
         # Reference will not be copied unless necessary by PRESENCE_UPDATE
         # See below
@@ -377,6 +391,42 @@ class Member(abc.Messageable, _UserTag):
         self._timeout = utils.parse_time(data.get("communication_disabled_until"))
         self._flags = data.get("flags", 0)
         self._banner = data.get("banner")
+        self._invalidate_cache()
+
+    def _invalidate_cache(self) -> None:
+        # an epoch that never matches the guild's forces the next lookup to recompute
+        self._cache_epoch: int = -1
+        self._cached_roles: Optional[List[Role]] = None
+        self._cached_guild_permissions: Optional[int] = None
+        self._cached_channel_permissions: Optional[Dict[int, int]] = None
+
+    def _validate_cache(self) -> None:
+        epoch = self.guild._permissions_epoch
+        if self._cache_epoch != epoch:
+            self._invalidate_cache()
+            self._cache_epoch = epoch
+
+    def _resolved_roles(self) -> List[Role]:
+        self._validate_cache()
+        roles = self._cached_roles
+        if roles is None:
+            roles = []
+            g = self.guild
+            for role_id in self._roles:
+                role = g.get_role(role_id)
+                if role:
+                    roles.append(role)
+            roles.append(g.default_role)
+            roles.sort()
+            self._cached_roles = roles
+        return roles
+
+    def _channel_permissions_cache(self) -> Dict[int, int]:
+        self._validate_cache()
+        cache = self._cached_channel_permissions
+        if cache is None:
+            cache = self._cached_channel_permissions = {}
+        return cache
 
     def _presence_update(
         self, data: PartialPresenceUpdate, user: UserPayload
@@ -426,7 +476,7 @@ class Member(abc.Messageable, _UserTag):
     @status.setter
     def status(self, value: Status) -> None:
         # internal use only
-        self._client_status[None] = str(value)
+        self._client_status = {**self._client_status, None: str(value)}
 
     @property
     def mobile_status(self) -> Status:
@@ -484,15 +534,7 @@ class Member(abc.Messageable, _UserTag):
 
         These roles are sorted by their position in the role hierarchy.
         """
-        result = []
-        g = self.guild
-        for role_id in self._roles:
-            role = g.get_role(role_id)
-            if role:
-                result.append(role)
-        result.append(g.default_role)
-        result.sort()
-        return result
+        return self._resolved_roles().copy()
 
     @property
     def mention(self) -> str:
@@ -617,11 +659,7 @@ class Member(abc.Messageable, _UserTag):
         This is useful for figuring where a member stands in the role
         hierarchy chain.
         """
-        guild = self.guild
-        if len(self._roles) == 0:
-            return guild.default_role
-
-        return max(guild.get_role(rid) or guild.default_role for rid in self._roles)
+        return self._resolved_roles()[-1]
 
     @property
     def guild_permissions(self) -> Permissions:
@@ -636,17 +674,21 @@ class Member(abc.Messageable, _UserTag):
         administrator implication.
         """
 
-        if self.guild.owner_id == self.id:
-            return Permissions.all()
+        self._validate_cache()
+        value = self._cached_guild_permissions
+        if value is None:
+            if self.guild.owner_id == self.id:
+                value = Permissions.all().value
+            else:
+                base = Permissions.none()
+                for r in self._resolved_roles():
+                    base.value |= r.permissions.value
 
-        base = Permissions.none()
-        for r in self.roles:
-            base.value |= r.permissions.value
+                value = Permissions.all().value if base.administrator else base.value
 
-        if base.administrator:
-            return Permissions.all()
+            self._cached_guild_permissions = value
 
-        return base
+        return Permissions(value)
 
     @property
     def voice(self) -> Optional[VoiceState]:
@@ -13,6 +13,7 @@ from os import PathLike
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncIterator,
     Callable,
     ClassVar,
     Dict,
@@ -30,7 +31,7 @@ from .embeds import Embed
 from .emoji import Emoji
 from .enums import ChannelType, IntegrationType, MessageReferenceType, MessageType, try_enum
 from .errors import HTTPException, InvalidArgument
-from .file import File
+from .file import File, _spool, _write_chunks
 from .flags import AttachmentFlags, MessageFlags
 from .guild import Guild
 from .member import Member
@@ -221,6 +222,9 @@ class Attachment(Hashable):
 
         Saves this attachment into a file-like object.
 
+        .. versionchanged:: 3.2
+            The attachment is now written in chunks while it is downloaded.
+
         Parameters
         ----------
         fp: Union[:class:`io.BufferedIOBase`, :class:`os.PathLike`, :class:`str`]
@@ -250,15 +254,7 @@ class Attachment(Hashable):
         :class:`int`
             The number of bytes written.
         """
-        data = await self.read(use_cached=use_cached)
-        if isinstance(fp, io.BufferedIOBase):
-            written = fp.write(data)
-            if seek_begin:
-                fp.seek(0)
-            return written
-
-        with open(fp, "wb") as f:  # noqa: ASYNC230
-            return f.write(data)
+        return await _write_chunks(self.stream(use_cached=use_cached), fp, seek_begin=seek_begin)
 
     async def read(self, *, use_cached: bool = False) -> bytes:
         """|coro|
@@ -294,6 +290,37 @@ class Attachment(Hashable):
         url = self.proxy_url if use_cached else self.url
         return await self._http.get_from_cdn(url)
 
+    def stream(self, *, use_cached: bool = False, chunk_size: int = 65536) -> AsyncIterator[bytes]:
+        """Returns an async iterator over the content of this attachment, downloading
+        it in chunks instead of loading it into memory at once.
+
+        .. versionadded:: 3.2
+
+        Parameters
+        ----------
+        use_cached: :class:`bool`
+            Whether to use :attr:`proxy_url` rather than :attr:`url` when downloading
+            the attachment. See :meth:`read` for more information.
+        chunk_size: :class:`int`
+            The maximum size of each chunk in bytes. Defaults to 64 KiB.
+
+        Raises
+        ------
+        HTTPException
+            Downloading the attachment failed.
+        Forbidden
+            You do not have permissions to access this attachment
+        NotFound
+            The attachment was deleted.
+
+        Yields
+        ------
+        :class:`bytes`
+            A chunk of the contents of the attachment.
+        """
+        url = self.proxy_url if use_cached else self.url
+        return self._http.stream_from_cdn(url, chunk_size=chunk_size)
+
     async def to_file(
         self,
         *,
@@ -310,6 +337,10 @@ class Attachment(Hashable):
 
         .. versionadded:: 1.3
 
+        .. versionchanged:: 3.2
+            The attachment is now downloaded in chunks into a temporary file
+            that only stays in memory while it is small.
+
         Parameters
         ----------
         filename: Optional[:class:`str`]
@@ -344,6 +375,10 @@ class Attachment(Hashable):
 
            .. versionadded:: 2.2
 
+            .. versionchanged:: 3.2
+                The downloaded file is always closed, as it may be backed by
+                a temporary file on disk.
+
         Raises
         ------
         HTTPException
@@ -359,15 +394,15 @@ class Attachment(Hashable):
             The attachment as a file suitable for sending.
         """
 
-        data = await self.read(use_cached=use_cached)
+        fp = await _spool(self.stream(use_cached=use_cached))
         file_filename = filename if filename is not MISSING else self.filename
         file_description = description if description is not MISSING else self.description
         return File(
-            io.BytesIO(data),
+            fp,
             filename=file_filename,
             description=file_description,
             spoiler=spoiler,
-            force_close=force_close,
+            force_close=True,
         )
 
     def to_dict(self) -> AttachmentPayload:
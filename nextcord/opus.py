@@ -339,6 +339,8 @@ class Encoder(_OpusStruct):
 
         self.application: int = application
         self._state: EncoderStruct = self._create_state()
+        # output buffer reused across encode calls, grown as needed
+        self._buffer: ctypes.Array[ctypes.c_char] = (ctypes.c_char * self.FRAME_SIZE)()
         self.set_bitrate(128)
         self.set_fec(True)
         self.set_expected_packet_loss_percent(0.15)
@@ -391,12 +393,13 @@ class Encoder(_OpusStruct):
         max_data_bytes = len(pcm)
         # bytes can be used to reference pointer
         pcm_ptr = ctypes.cast(pcm, c_int16_ptr)  # type: ignore
-        data = (ctypes.c_char * max_data_bytes)()
+        data = self._buffer
+        if len(data) < max_data_bytes:
+            data = self._buffer = (ctypes.c_char * max_data_bytes)()
 
         ret = _lib.opus_encode(self._state, pcm_ptr, frame_size, data, max_data_bytes)
 
-        # array can be initialized with bytes but mypy doesn't know
-        return array.array("b", data[:ret]).tobytes()
+        return ctypes.string_at(data, ret)
 
 
 class Decoder(_OpusStruct):
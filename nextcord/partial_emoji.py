@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import re
-from typing import TYPE_CHECKING, Any, Dict, Optional, Union
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Optional, Union
 
 from . import utils
 from .asset import Asset, AssetMixin
@@ -224,3 +224,9 @@ class PartialEmoji(_EmojiTag, AssetMixin):
             raise InvalidArgument("PartialEmoji is not a custom emoji")
 
         return await super().read()
+
+    def stream(self, *, chunk_size: int = 65536) -> AsyncIterator[bytes]:
+        if self.is_unicode_emoji():
+            raise InvalidArgument("PartialEmoji is not a custom emoji")
+
+        return super().stream(chunk_size=chunk_size)
@@ -13,7 +13,20 @@ import sys
 import threading
 import time
 import traceback
-from typing import IO, TYPE_CHECKING, Any, Callable, Generic, Optional, Tuple, TypeVar, Union
+from collections import deque
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Generic,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from .enums import SpeakingState
 from .errors import ClientException
@@ -38,6 +51,7 @@ __all__ = (
     "FFmpegPCMAudio",
     "FFmpegOpusAudio",
     "PCMVolumeTransformer",
+    "AudioScheduler",
 )
 
 CREATE_NO_WINDOW: int
@@ -798,3 +812,207 @@ class AudioPlayer(threading.Thread):
             )
         except Exception as e:
             _log.info("Speaking call in player failed: %s", e)
+
+
+class _ScheduledAudioPlayer(AudioPlayer):
+    """An :class:`AudioPlayer` driven by an :class:`AudioScheduler` instead of its own thread.
+
+    The thread this class inherits is never started, only the pause, resume,
+    stop and finalizer handling of :class:`AudioPlayer` is reused.
+    """
+
+    def __init__(
+        self, source: AudioSource, client: VoiceClient, *, scheduler: AudioScheduler, after=None
+    ) -> None:
+        super().__init__(source, client, after=after)
+        self.scheduler: AudioScheduler = scheduler
+
+    def start(self) -> None:
+        self._speak(True)
+        self.scheduler._add_player(self)
+
+    def _send_frame(self) -> bool:
+        """Sends the next frame of the source, returning ``False`` once the player is done."""
+        if self._end.is_set():
+            return False
+
+        # paused and disconnected players simply sit out the tick
+        if not self._resumed.is_set() or not self._connected.is_set():
+            return True
+
+        try:
+            data = self.source.read()
+            if not data:
+                self.stop()
+                return False
+
+            self.client.send_audio_packet(data, encode=not self.source.is_opus())
+        except Exception as exc:
+            self._current_error = exc
+            self.stop()
+            return False
+
+        return True
+
+    def _finish(self) -> None:
+        # the finalizer and source cleanup can block, so they get their own short-lived
+        # thread rather than stalling every other player on the scheduler
+        threading.Thread(target=self._finalize, name=f"{self.name}-after", daemon=True).start()
+
+    def _finalize(self) -> None:
+        try:
+            self._call_after()
+        finally:
+            self.source.cleanup()
+
+
+class _AudioSchedulerThread(threading.Thread):
+    def __init__(self, scheduler: AudioScheduler, index: int) -> None:
+        super().__init__(name=f"nextcord-audio-scheduler-{index}", daemon=True)
+        self.scheduler: AudioScheduler = scheduler
+        self.players: List[_ScheduledAudioPlayer] = []
+        self._lock: threading.Lock = threading.Lock()
+        self._wakeup: threading.Event = threading.Event()
+        self._closed: bool = False
+
+    def add(self, player: _ScheduledAudioPlayer) -> None:
+        with self._lock:
+            self.players.append(player)
+        self._wakeup.set()
+
+    def close(self) -> None:
+        self._closed = True
+        self._wakeup.set()
+
+    def run(self) -> None:
+        delay = AudioPlayer.DELAY
+        scheduler = self.scheduler
+        while True:
+            if not self.players:
+                if self._closed:
+                    return
+
+                # idle until a player is added
+                self._wakeup.wait()
+                self._wakeup.clear()
+                continue
+
+            ticks = 0
+            start = time.perf_counter()
+            while self.players:
+                with self._lock:
+                    players = tuple(self.players)
+
+                finished = [player for player in players if not player._send_frame()]
+                if finished:
+                    with self._lock:
+                        for player in finished:
+                            self.players.remove(player)
+                    for player in finished:
+                        player._finish()
+
+                ticks += 1
+                next_time = start + delay * ticks
+                remaining = next_time - time.perf_counter()
+                if remaining > 0:
+                    time.sleep(remaining)
+                else:
+                    scheduler._late_frames += 1
+
+                scheduler._jitter.append(abs(time.perf_counter() - next_time))
+
+
+class AudioScheduler:
+    """Plays audio for many voice connections from a fixed number of threads.
+
+    By default, every :meth:`VoiceClient.play` call starts a dedicated thread that
+    paces its own frames. A scheduler can be passed to :meth:`VoiceClient.play`
+    instead, in which case the connection is driven by one of the scheduler's
+    threads. Each thread sends one frame for every connection assigned to it on a
+    shared 20ms tick. :meth:`VoiceClient.pause`, :meth:`VoiceClient.resume`,
+    :meth:`VoiceClient.stop` and the ``after`` finalizer behave the same way for
+    both.
+
+    Since all sources on a thread are read in turn, a source that blocks while
+    reading delays every other connection on the same thread.
+
+    The scheduler's threads are started on first use and idle while nothing is playing.
+
+    .. versionadded:: 3.2
+
+    Parameters
+    ----------
+    threads: :class:`int`
+        The number of threads to spread voice connections across. Defaults to ``1``.
+    """
+
+    def __init__(self, threads: int = 1) -> None:
+        if threads < 1:
+            raise ValueError("threads must be at least 1")
+
+        self._thread_count: int = threads
+        self._threads: List[_AudioSchedulerThread] = []
+        self._lock: threading.Lock = threading.Lock()
+        self._late_frames: int = 0
+        self._jitter: Deque[float] = deque(maxlen=250)
+
+    def __repr__(self) -> str:
+        return f"<AudioScheduler threads={self._thread_count} players={self.player_count}>"
+
+    @property
+    def player_count(self) -> int:
+        """:class:`int`: The number of voice connections currently driven by this scheduler."""
+        return sum(len(thread.players) for thread in self._threads)
+
+    @property
+    def late_frames(self) -> int:
+        """:class:`int`: The number of ticks, across all threads, whose frames
+        took longer than a full tick to read and send.
+        """
+        return self._late_frames
+
+    @property
+    def average_jitter(self) -> float:
+        """:class:`float`: The average deviation, in seconds, of recent ticks
+        from their scheduled time.
+        """
+        jitter = self._jitter
+        if not jitter:
+            return 0.0
+
+        return sum(jitter) / len(jitter)
+
+    @property
+    def max_jitter(self) -> float:
+        """:class:`float`: The largest deviation, in seconds, of recent ticks
+        from their scheduled time.
+        """
+        return max(self._jitter, default=0.0)
+
+    def _add_player(self, player: _ScheduledAudioPlayer) -> None:
+        with self._lock:
+            if not self._threads:
+                for index in range(self._thread_count):
+                    thread = _AudioSchedulerThread(self, index)
+                    thread.start()
+                    self._threads.append(thread)
+
+            thread = min(self._threads, key=lambda t: len(t.players))
+            thread.add(player)
+
+    def close(self) -> None:
+        """Stops every player driven by this scheduler and shuts its threads down.
+
+        The ``after`` finalizers of the stopped players are still called.
+        The scheduler can still be used afterwards, new threads are started on demand.
+        """
+        with self._lock:
+            threads, self._threads = self._threads, []
+
+        for thread in threads:
+            with thread._lock:
+                players = tuple(thread.players)
+            # the stopped players are finalized by the thread on its next tick
+            for player in players:
+                player.stop()
+            thread.close()
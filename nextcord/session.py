@@ -0,0 +1,333 @@
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import contextlib
+import os
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Protocol,
+    Union,
+    runtime_checkable,
+)
+
+from . import utils
+from .flags import ApplicationFlags
+
+if TYPE_CHECKING:
+    from .abc import GuildChannel
+    from .guild import Guild
+    from .member import Member
+    from .role import Role
+    from .state import ConnectionState
+
+__all__ = (
+    "ShardSession",
+    "SessionStore",
+    "FileSessionStore",
+)
+
+_SNAPSHOT_VERSION = 1
+
+
+class ShardSession:
+    """The information needed to resume the gateway session of a shard.
+
+    .. versionadded:: 3.2
+
+    Attributes
+    ----------
+    session_id: :class:`str`
+        The ID of the gateway session.
+    sequence: Optional[:class:`int`]
+        The sequence number of the last event received.
+    resume_url: Optional[:class:`str`]
+        The gateway URL to resume the session with.
+    """
+
+    __slots__ = ("session_id", "sequence", "resume_url")
+
+    def __init__(self, session_id: str, sequence: Optional[int], resume_url: Optional[str]) -> None:
+        self.session_id: str = session_id
+        self.sequence: Optional[int] = sequence
+        self.resume_url: Optional[str] = resume_url
+
+    def __repr__(self) -> str:
+        return f"<ShardSession session_id={self.session_id!r} sequence={self.sequence}>"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "session_id": self.session_id,
+            "sequence": self.sequence,
+            "resume_url": self.resume_url,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> ShardSession:
+        return cls(data["session_id"], data.get("sequence"), data.get("resume_url"))
+
+
+@runtime_checkable
+class SessionStore(Protocol):
+    """A protocol describing where gateway sessions are kept between process restarts,
+    passed through the ``session_store`` parameter of :class:`Client`.
+
+    Sessions are saved when the client is closed, and loaded once when it connects
+    again so it can RESUME instead of IDENTIFY. Missing, expired or unknown sessions
+    should be reported as ``None``; if Discord refuses to resume a session, the
+    client identifies as usual.
+
+    .. versionadded:: 3.2
+    """
+
+    def load_session(self, shard_id: Optional[int]) -> Optional[ShardSession]:
+        """Returns the saved session of the shard, or ``None`` if there is none.
+        ``shard_id`` is ``None`` for clients that are not sharded."""
+        ...
+
+    def save_session(self, shard_id: Optional[int], session: ShardSession) -> None:
+        """Saves the session of the shard."""
+        ...
+
+    def delete_session(self, shard_id: Optional[int]) -> None:
+        """Deletes the saved session of the shard, if any."""
+        ...
+
+    def load_snapshot(self) -> Optional[Dict[str, Any]]:
+        """Returns the saved cache snapshot, or ``None`` if there is none."""
+        ...
+
+    def save_snapshot(self, snapshot: Dict[str, Any]) -> None:
+        """Saves a JSON serializable cache snapshot."""
+        ...
+
+
+class FileSessionStore:
+    """A :class:`SessionStore` keeping every session and the cache snapshot as JSON
+    files in a directory.
+
+    .. versionadded:: 3.2
+
+    Parameters
+    ----------
+    directory: Union[:class:`str`, :class:`os.PathLike`]
+        The directory to store the files in. It is created if needed.
+    max_age: :class:`float`
+        The amount of seconds a saved session and snapshot are considered
+        for resuming. Discord only keeps sessions alive for a short while after
+        a disconnect. Defaults to ``300``.
+    """
+
+    __slots__ = ("directory", "max_age")
+
+    def __init__(self, directory: Union[str, os.PathLike[str]], *, max_age: float = 300.0) -> None:
+        self.directory: str = os.fspath(directory)
+        self.max_age: float = max_age
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, f"{name}.json")
+
+    def _read(self, name: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(name), encoding="utf-8") as fp:
+                data = utils.from_json(fp.read())
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - data.get("saved_at", 0) > self.max_age:
+            return None
+
+        return data
+
+    def _write(self, name: str, data: Dict[str, Any]) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        data["saved_at"] = time.time()
+        path = self._path(name)
+        # written next to the target first so a crash never leaves a truncated file behind
+        with open(f"{path}.tmp", "w", encoding="utf-8") as fp:
+            fp.write(utils.to_json(data))
+        os.replace(f"{path}.tmp", path)
+
+    def load_session(self, shard_id: Optional[int]) -> Optional[ShardSession]:
+        data = self._read(f"session-{shard_id}")
+        return None if data is None else ShardSession.from_dict(data)
+
+    def save_session(self, shard_id: Optional[int], session: ShardSession) -> None:
+        self._write(f"session-{shard_id}", session.to_dict())
+
+    def delete_session(self, shard_id: Optional[int]) -> None:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self._path(f"session-{shard_id}"))
+
+    def load_snapshot(self) -> Optional[Dict[str, Any]]:
+        return self._read("snapshot")
+
+    def save_snapshot(self, snapshot: Dict[str, Any]) -> None:
+        self._write("snapshot", snapshot)
+
+
+# Cache snapshots are made of the same payloads Discord sends, so they are restored
+# by the regular model constructors.
+
+
+def _snowflake_str(value: Optional[int]) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+def _role_to_payload(role: Role) -> Dict[str, Any]:
+    data: Dict[str, Any] = {
+        "id": str(role.id),
+        "name": role.name,
+        "permissions": str(role._permissions),
+        "position": role.position,
+        "color": role._colour,
+        "hoist": role.hoist,
+        "managed": role.managed,
+        "mentionable": role.mentionable,
+        "icon": role._icon,
+        "flags": role._flags,
+    }
+    if role.tags is not None:
+        tags: Dict[str, Any] = {}
+        if role.tags.bot_id is not None:
+            tags["bot_id"] = str(role.tags.bot_id)
+        if role.tags.integration_id is not None:
+            tags["integration_id"] = str(role.tags.integration_id)
+        if role.tags.is_premium_subscriber():
+            tags["premium_subscriber"] = None
+        data["tags"] = tags
+
+    return data
+
+
+def _channel_to_payload(channel: GuildChannel) -> Dict[str, Any]:
+    data: Dict[str, Any] = {
+        "id": str(channel.id),
+        "type": channel.type.value,
+        "name": channel.name,
+        "position": channel.position,
+        "parent_id": None if channel.category_id is None else str(channel.category_id),
+        "permission_overwrites": [o._asdict() for o in channel._overwrites],
+    }
+    for key, attr in (
+        ("nsfw", "nsfw"),
+        ("topic", "topic"),
+        ("rate_limit_per_user", "slowmode_delay"),
+        ("default_auto_archive_duration", "default_auto_archive_duration"),
+        ("default_thread_slowmode_delay", "default_thread_slowmode_delay"),
+        ("bitrate", "bitrate"),
+        ("user_limit", "user_limit"),
+    ):
+        if hasattr(channel, attr):
+            data[key] = getattr(channel, attr)
+
+    if (flags := getattr(channel, "flags", None)) is not None:
+        data["flags"] = flags.value
+    if (last_message_id := getattr(channel, "last_message_id", None)) is not None:
+        data["last_message_id"] = str(last_message_id)
+    if (rtc_region := getattr(channel, "rtc_region", None)) is not None:
+        data["rtc_region"] = str(rtc_region)
+    if (video_quality_mode := getattr(channel, "video_quality_mode", None)) is not None:
+        data["video_quality_mode"] = video_quality_mode.value
+    if (tags := getattr(channel, "_available_tags", None)) is not None:
+        data["available_tags"] = [tag.payload for tag in tags.values()]
+    if (layout := getattr(channel, "default_forum_layout", None)) is not None:
+        data["default_forum_layout"] = layout.value
+    if (sort_order := getattr(channel, "default_sort_order", None)) is not None:
+        data["default_sort_order"] = sort_order.value
+    if (reaction := getattr(channel, "default_reaction", None)) is not None:
+        data["default_reaction_emoji"] = {
+            "emoji_id": None if reaction.id is None else str(reaction.id),
+            "emoji_name": reaction.name,
+        }
+
+    return data
+
+
+def _member_to_payload(member: Member) -> Dict[str, Any]:
+    return {
+        "user": member._user._to_minimal_user_json(),
+        "roles": [str(role_id) for role_id in member._roles],
+        "joined_at": None if member.joined_at is None else member.joined_at.isoformat(),
+        "premium_since": None if member.premium_since is None else member.premium_since.isoformat(),
+        "nick": member.nick,
+        "pending": member.pending,
+        "avatar": member._avatar,
+        "communication_disabled_until": (
+            None if member._timeout is None else member._timeout.isoformat()
+        ),
+        "flags": member._flags,
+    }
+
+
+def _guild_to_payload(guild: Guild) -> Dict[str, Any]:
+    data: Dict[str, Any] = {
+        "id": str(guild.id),
+        "name": guild.name,
+        "icon": guild._icon,
+        "banner": guild._banner,
+        "splash": guild._splash,
+        "discovery_splash": guild._discovery_splash,
+        "description": guild.description,
+        "owner_id": None if guild.owner_id is None else str(guild.owner_id),
+        "verification_level": guild.verification_level.value,
+        "default_message_notifications": guild.default_notifications.value,
+        "explicit_content_filter": guild.explicit_content_filter.value,
+        "afk_timeout": guild.afk_timeout,
+        "afk_channel_id": None if guild.afk_channel is None else str(guild.afk_channel.id),
+        "system_channel_id": _snowflake_str(guild._system_channel_id),
+        "system_channel_flags": guild._system_channel_flags,
+        "rules_channel_id": _snowflake_str(guild._rules_channel_id),
+        "public_updates_channel_id": _snowflake_str(guild._public_updates_channel_id),
+        "safety_alerts_channel_id": _snowflake_str(guild._safety_alerts_channel_id),
+        "features": list(guild.features),
+        "mfa_level": guild.mfa_level,
+        "nsfw_level": guild.nsfw_level.value,
+        "premium_tier": guild.premium_tier,
+        "premium_subscription_count": guild.premium_subscription_count,
+        "premium_progress_bar_enabled": guild._premium_progress_bar_enabled,
+        "preferred_locale": guild.preferred_locale,
+        "max_presences": guild.max_presences,
+        "max_members": guild.max_members,
+        "max_video_channel_users": guild.max_video_channel_users,
+        "roles": [_role_to_payload(role) for role in guild._roles.values()],
+        "channels": [_channel_to_payload(channel) for channel in guild._channels.values()],
+        "members": [],
+    }
+    if (member_count := getattr(guild, "_member_count", None)) is not None:
+        data["member_count"] = member_count
+    if (me := guild.me) is not None:
+        data["members"].append(_member_to_payload(me))
+
+    return data
+
+
+def _create_snapshot(state: ConnectionState) -> Dict[str, Any]:
+    return {
+        "version": _SNAPSHOT_VERSION,
+        "application_id": _snowflake_str(state.application_id),
+        "application_flags": getattr(state, "application_flags", ApplicationFlags()).value,
+        "guilds": [
+            _guild_to_payload(guild) for guild in state._guilds.values() if not guild.unavailable
+        ],
+    }
+
+
+def _restore_snapshot(state: ConnectionState, snapshot: Dict[str, Any]) -> int:
+    if snapshot.get("version") != _SNAPSHOT_VERSION:
+        return 0
+
+    if state.application_id is None and snapshot.get("application_id") is not None:
+        state.application_id = int(snapshot["application_id"])
+        state.application_flags = ApplicationFlags._from_value(snapshot.get("application_flags", 0))
+
+    guilds: List[Dict[str, Any]] = snapshot.get("guilds", [])
+    for data in guilds:
+        state._add_guild_from_data(data)  # type: ignore
+
+    return len(guilds)
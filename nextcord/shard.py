@@ -5,7 +5,8 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import logging
-from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple, Type
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Literal, Optional, Tuple, Type
 
 import aiohttp
 
@@ -28,13 +29,18 @@ if TYPE_CHECKING:
     from typing_extensions import Self
 
     from .activity import BaseActivity
+    from .cache import CacheStoreFactory
+    from .executor import EventExecutor
     from .flags import MemberCacheFlags
     from .gateway import DiscordWebSocket
     from .mentions import AllowedMentions
+    from .session import SessionStore, ShardSession
+    from .types.gateway import SessionStartLimit as SessionStartLimitPayload
 
 __all__ = (
     "AutoShardedClient",
     "ShardInfo",
+    "SessionStartLimits",
 )
 
 _log = logging.getLogger(__name__)
@@ -108,9 +114,9 @@ class Shard:
         if self._task is not None and not self._task.done():
             self._task.cancel()
 
-    async def close(self) -> None:
+    async def close(self, code: int = 1000) -> None:
         self._cancel_task()
-        await self.ws.close(code=1000)
+        await self.ws.close(code=code)
 
     async def disconnect(self) -> None:
         await self.close()
@@ -276,6 +282,50 @@ class ShardInfo:
         """
         return self._parent.ws.is_ratelimited()
 
+    def gateway_stats(self) -> Optional[Dict[str, Any]]:
+        """Returns a snapshot of the counters about the gateway traffic of this shard,
+        see :meth:`Client.gateway_stats`, or ``None`` if ``gateway_stats`` is not enabled.
+
+        .. versionadded:: 3.2
+        """
+        stats = self._parent.ws._stats
+        return None if stats is None else stats.to_dict()
+
+
+class SessionStartLimits:
+    """A class that holds info about the session start limits of the bot.
+
+    You can retrieve this object via :attr:`AutoShardedClient.session_start_limits`.
+
+    .. versionadded:: 3.2
+
+    Attributes
+    ----------
+    total: :class:`int`
+        The total number of session starts the bot is allowed per reset window.
+    remaining: :class:`int`
+        The remaining number of session starts in the current reset window.
+        This is decremented locally every time a shard IDENTIFYs.
+    reset_after: :class:`float`
+        The number of seconds after which the limit resets, relative to when it was fetched.
+    max_concurrency: :class:`int`
+        The number of IDENTIFY requests allowed per 5 seconds.
+    """
+
+    __slots__ = ("total", "remaining", "reset_after", "max_concurrency")
+
+    def __init__(self, data: SessionStartLimitPayload) -> None:
+        self.total: int = data["total"]
+        self.remaining: int = data["remaining"]
+        self.reset_after: float = data["reset_after"] / 1000
+        self.max_concurrency: int = data.get("max_concurrency") or 1
+
+    def __repr__(self) -> str:
+        return (
+            f"<SessionStartLimits total={self.total} remaining={self.remaining} "
+            f"reset_after={self.reset_after} max_concurrency={self.max_concurrency}>"
+        )
+
 
 class AutoShardedClient(Client):
     """A client similar to :class:`Client` except it handles the complications
@@ -298,6 +348,16 @@ class AutoShardedClient(Client):
     if this is used. By default, when omitted, the client will launch shards from
     0 to ``shard_count - 1``.
 
+    Shards are IDENTIFY'd concurrently in buckets of ``shard_id % max_concurrency``,
+    where ``max_concurrency`` is taken from the Bot Gateway endpoint. Shards within
+    a bucket are launched one after another, and :meth:`before_identify_hook` is
+    called with ``initial=True`` for the first shard of every bucket. The remaining
+    session start quota is tracked and, if it runs out, IDENTIFYs are held until
+    it resets.
+
+    .. versionchanged:: 3.2
+        Shards are now launched concurrently according to ``max_concurrency``.
+
     Attributes
     ----------
     shard_ids: Optional[List[:class:`int`]]
@@ -336,6 +396,17 @@ class AutoShardedClient(Client):
         rollout_update_known: bool = True,
         rollout_all_guilds: bool = False,
         default_guild_ids: Optional[List[int]] = None,
+        cache_stores: Optional[Dict[str, CacheStoreFactory]] = None,
+        gateway_compression: Literal["zlib-stream", "zstd-stream"] = "zlib-stream",
+        skip_unused_events: bool = False,
+        coalesce_get_requests: bool = False,
+        get_cache_ttls: Optional[Dict[str, float]] = None,
+        session_store: Optional[SessionStore] = None,
+        cache_snapshot: bool = False,
+        shared_heartbeat: bool = False,
+        event_executor: Optional[EventExecutor] = None,
+        gateway_stats: bool = False,
+        gateway_stats_interval: Optional[float] = None,
     ) -> None:
         self.shard_ids: Optional[List[int]] = shard_ids
         super().__init__(
@@ -364,6 +435,17 @@ class AutoShardedClient(Client):
             rollout_update_known=rollout_update_known,
             rollout_all_guilds=rollout_all_guilds,
             default_guild_ids=default_guild_ids,
+            cache_stores=cache_stores,
+            gateway_compression=gateway_compression,
+            skip_unused_events=skip_unused_events,
+            coalesce_get_requests=coalesce_get_requests,
+            get_cache_ttls=get_cache_ttls,
+            session_store=session_store,
+            cache_snapshot=cache_snapshot,
+            shared_heartbeat=shared_heartbeat,
+            event_executor=event_executor,
+            gateway_stats=gateway_stats,
+            gateway_stats_interval=gateway_stats_interval,
         )
 
         if self.shard_ids is not None:
@@ -381,6 +463,9 @@ class AutoShardedClient(Client):
         self._connection._get_websocket = self._get_websocket
         self._connection._get_client = lambda: self
         self.__queue = asyncio.PriorityQueue()
+        self._session_start_limits: Optional[SessionStartLimits] = None
+        self.__session_start_reset: float = 0.0
+        self.__session_start_lock: asyncio.Lock = asyncio.Lock()
 
     def _get_websocket(
         self, guild_id: Optional[int] = None, *, shard_id: Optional[int] = None
@@ -402,6 +487,8 @@ class AutoShardedClient(Client):
         intents: Intents,
         chunk_guilds_at_startup: bool,
         member_cache_flags: MemberCacheFlags,
+        cache_stores: Optional[Dict[str, CacheStoreFactory]],
+        skip_unused_events: bool,
     ) -> AutoShardedConnectionState:
         return AutoShardedConnectionState(
             dispatch=self.dispatch,
@@ -419,6 +506,8 @@ class AutoShardedClient(Client):
             intents=intents,
             chunk_guilds_at_startup=chunk_guilds_at_startup,
             member_cache_flags=member_cache_flags,
+            cache_stores=cache_stores,
+            skip_unused_events=skip_unused_events,
         )
 
     @property
@@ -450,6 +539,16 @@ class AutoShardedClient(Client):
         else:
             return ShardInfo(parent, self.shard_count)
 
+    @property
+    def session_start_limits(self) -> Optional[SessionStartLimits]:
+        """Optional[:class:`SessionStartLimits`]: The session start limits of the bot.
+
+        This is ``None`` until the shards have started launching.
+
+        .. versionadded:: 3.2
+        """
+        return self._session_start_limits
+
     @property
     def shards(self) -> Dict[int, ShardInfo]:
         """Mapping[int, :class:`ShardInfo`]: Returns a mapping of shard IDs to their respective info object."""
@@ -458,14 +557,33 @@ class AutoShardedClient(Client):
             for shard_id, parent in self.__shards.items()
         }
 
-    async def launch_shard(self, gateway: str, shard_id: int, *, initial: bool = False) -> None:
+    async def launch_shard(
+        self,
+        gateway: str,
+        shard_id: int,
+        *,
+        initial: bool = False,
+        session: Optional[ShardSession] = None,
+    ) -> None:
         try:
-            coro = DiscordWebSocket.from_client(
-                self, initial=initial, gateway=gateway, shard_id=shard_id
-            )
+            if session is not None:
+                coro = DiscordWebSocket.from_client(
+                    self,
+                    gateway=session.resume_url,
+                    shard_id=shard_id,
+                    session=session.session_id,
+                    sequence=session.sequence,
+                    resume=True,
+                    format_gateway=True,
+                )
+            else:
+                coro = DiscordWebSocket.from_client(
+                    self, initial=initial, gateway=gateway, shard_id=shard_id
+                )
             ws = await asyncio.wait_for(coro, timeout=180.0)
         except Exception:
             _log.exception("Failed to connect for shard_id: %s. Retrying...", shard_id)
+            self._connection._restored_sessions.discard(shard_id)
             await asyncio.sleep(5.0)
             return await self.launch_shard(gateway, shard_id)
 
@@ -474,23 +592,83 @@ class AutoShardedClient(Client):
         ret.launch()
         return None
 
+    async def launch_bucket(self, gateway: str, shard_ids: List[int]) -> None:
+        # shards sharing a rate limit key have to IDENTIFY one after another
+        for index, shard_id in enumerate(shard_ids):
+            await self.launch_shard(gateway, shard_id, initial=index == 0)
+
     async def launch_shards(self) -> None:
+        shard_count, gateway, session_start_limit = await self.http.get_bot_gateway(
+            compress=self._gateway_compression
+        )
+        self._update_session_start_limits(session_start_limit)
         if self.shard_count is None:
-            self.shard_count, gateway = await self.http.get_bot_gateway()
-        else:
-            gateway = await self.http.get_gateway()
+            self.shard_count = shard_count
 
         self._connection.shard_count = self.shard_count
 
         shard_ids = self.shard_ids or range(self.shard_count)
         self._connection.shard_ids = shard_ids
 
+        limits: SessionStartLimits = self._session_start_limits  # type: ignore
+        if limits.remaining < len(shard_ids):
+            _log.warning(
+                "Only %s of %s session starts remain, but %s shards are being launched. "
+                "Some shards will wait %.2fs for the limit to reset.",
+                limits.remaining,
+                limits.total,
+                len(shard_ids),
+                limits.reset_after,
+            )
+
+        # stored sessions are resumed right away, they don't count against the identify limits
+        sessions = self._load_stored_sessions(shard_ids)
+        buckets: Dict[int, List[int]] = {}
         for shard_id in shard_ids:
-            initial = shard_id == shard_ids[0]
-            await self.launch_shard(gateway, shard_id, initial=initial)
+            if shard_id not in sessions:
+                buckets.setdefault(shard_id % limits.max_concurrency, []).append(shard_id)
+
+        _log.debug("Launching %s shards in %s concurrent buckets.", len(shard_ids), len(buckets))
+        await asyncio.gather(
+            *(
+                self.launch_shard(gateway, shard_id, session=session)
+                for shard_id, session in sessions.items()
+            ),
+            *(self.launch_bucket(gateway, ids) for ids in buckets.values()),
+        )
 
         self._connection.shards_launched.set()
 
+    def _update_session_start_limits(self, data: SessionStartLimitPayload) -> None:
+        self._session_start_limits = limits = SessionStartLimits(data)
+        self.__session_start_reset = time.monotonic() + limits.reset_after
+
+    async def _consume_session_start(self) -> None:
+        if self._session_start_limits is None:
+            return
+
+        async with self.__session_start_lock:
+            while self._session_start_limits.remaining <= 0:
+                delay = self.__session_start_reset - time.monotonic()
+                if delay > 0:
+                    _log.warning(
+                        "Session start limit of %s has been exhausted, waiting %.2fs for it to reset.",
+                        self._session_start_limits.total,
+                        delay,
+                    )
+                    await asyncio.sleep(delay)
+
+                _, _, data = await self.http.get_bot_gateway()
+                self._update_session_start_limits(data)
+
+            self._session_start_limits.remaining -= 1
+
+    async def _call_before_identify_hook(
+        self, shard_id: Optional[int], *, initial: bool = False
+    ) -> None:
+        await self._consume_session_start()
+        await super()._call_before_identify_hook(shard_id, initial=initial)
+
     async def connect(self, *, reconnect: bool = True) -> None:
         self._reconnect = reconnect
         await self.launch_shards()
@@ -524,13 +702,18 @@ class AutoShardedClient(Client):
             return
 
         self._closed = True
+        if self._event_executor is not None:
+            self._event_executor.clear()
 
         for vc in self.voice_clients:
             with contextlib.suppress(Exception):
                 await vc.disconnect(force=True)
 
+        self._stop_gateway_stats()
+        code = 4000 if self._store_sessions(shard.ws for shard in self.__shards.values()) else 1000
         to_close = [
-            asyncio.ensure_future(shard.close(), loop=self.loop) for shard in self.__shards.values()
+            asyncio.ensure_future(shard.close(code), loop=self.loop)
+            for shard in self.__shards.values()
         ]
         if to_close:
             await asyncio.wait(to_close)
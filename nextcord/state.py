@@ -5,21 +5,25 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import copy
+import hashlib
 import inspect
 import itertools
+import json
 import logging
 import os
 import warnings
-from collections import OrderedDict, deque
+from collections import OrderedDict
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     Coroutine,
-    Deque,
     Dict,
+    Iterable,
+    Iterator,
     List,
     Optional,
+    Sequence,
     Set,
     Tuple,
     TypeVar,
@@ -31,6 +35,7 @@ from .activity import BaseActivity
 from .application_command import BaseApplicationCommand
 from .audit_logs import AuditLogEntry
 from .auto_moderation import AutoModerationActionExecution, AutoModerationRule
+from .cache import CACHE_ENTITIES, CacheStore
 from .channel import *
 from .channel import _channel_factory
 from .emoji import Emoji
@@ -60,6 +65,7 @@ if TYPE_CHECKING:
 
     from .abc import MessageableChannel, PrivateChannel
     from .application_command import SlashApplicationSubcommand
+    from .cache import CacheStoreFactory
     from .client import Client
     from .gateway import DiscordWebSocket
     from .guild import GuildChannel, VocalGuildChannel
@@ -133,6 +139,33 @@ class ChunkRequest:
 
 _log = logging.getLogger(__name__)
 
+# Gateway events whose parsers have no effect besides dispatching the listed
+# events, so they can be skipped entirely when nothing listens to any of them.
+_SKIPPABLE_EVENTS: Dict[str, Tuple[str, ...]] = {
+    "TYPING_START": ("raw_typing", "typing"),
+    "INVITE_CREATE": ("invite_create",),
+    "INVITE_DELETE": ("invite_delete",),
+    "GUILD_INTEGRATIONS_UPDATE": ("guild_integrations_update",),
+    "INTEGRATION_CREATE": ("integration_create",),
+    "INTEGRATION_UPDATE": ("integration_update",),
+    "INTEGRATION_DELETE": ("raw_integration_delete",),
+    "WEBHOOKS_UPDATE": ("webhooks_update",),
+    "AUTO_MODERATION_ACTION_EXECUTION": ("auto_moderation_action_execution",),
+    "GUILD_AUDIT_LOG_ENTRY_CREATE": ("guild_audit_log_entry_create",),
+}
+
+# These additionally update the message cache, so are only skippable without one.
+_SKIPPABLE_MESSAGE_EVENTS: Dict[str, Tuple[str, ...]] = {
+    "MESSAGE_CREATE": ("message",),
+    "MESSAGE_UPDATE": ("raw_message_edit", "message_edit"),
+    "MESSAGE_DELETE": ("raw_message_delete", "message_delete"),
+    "MESSAGE_DELETE_BULK": ("raw_bulk_message_delete", "bulk_message_delete"),
+    "MESSAGE_REACTION_ADD": ("raw_reaction_add", "reaction_add"),
+    "MESSAGE_REACTION_REMOVE": ("raw_reaction_remove", "reaction_remove"),
+    "MESSAGE_REACTION_REMOVE_ALL": ("raw_reaction_clear", "reaction_clear"),
+    "MESSAGE_REACTION_REMOVE_EMOJI": ("raw_reaction_clear_emoji", "reaction_clear_emoji"),
+}
+
 
 async def logging_coroutine(coroutine: Coroutine[Any, Any, T], *, info: str) -> Optional[T]:
     try:
@@ -141,6 +174,112 @@ async def logging_coroutine(coroutine: Coroutine[Any, Any, T], *, info: str) ->
         _log.exception("Exception occurred during %s", info)
 
 
+class MessageCache(Sequence[Message]):
+    """A bounded cache of messages, indexed by message ID.
+
+    Messages are evicted oldest first once ``maxlen`` is reached, like a
+    :class:`collections.deque`, while lookups and removals by ID are O(1).
+    Messages are additionally indexed by channel and guild so that every
+    message of a channel or guild can be dropped in O(k).
+    """
+
+    __slots__ = ("maxlen", "_messages", "_by_channel", "_by_guild", "_appended")
+
+    def __init__(self, maxlen: int) -> None:
+        self.maxlen: int = maxlen
+        self._messages: OrderedDict[int, Message] = OrderedDict()
+        # channel ID -> message ID -> position of the message in the cache
+        self._by_channel: Dict[int, Dict[int, int]] = {}
+        self._by_guild: Dict[int, Dict[int, None]] = {}
+        self._appended: int = 0
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def __iter__(self) -> Iterator[Message]:
+        return iter(self._messages.values())
+
+    def __reversed__(self) -> Iterator[Message]:
+        return reversed(self._messages.values())
+
+    def __contains__(self, item: Any) -> bool:
+        return self._messages.get(getattr(item, "id", None)) is item  # type: ignore
+
+    def __getitem__(self, idx: int) -> Message:  # pyright: ignore
+        if idx == -1 and self._messages:
+            return next(reversed(self._messages.values()))
+        return list(self._messages.values())[idx]
+
+    def get(self, message_id: Optional[int]) -> Optional[Message]:
+        return self._messages.get(message_id)  # type: ignore
+
+    def append(self, message: Message) -> None:
+        message_id = message.id
+        if message_id in self._messages:
+            self._discard(message_id)
+        elif len(self._messages) >= self.maxlen:
+            self._discard(next(iter(self._messages)))
+
+        self._messages[message_id] = message
+        self._by_channel.setdefault(message.channel.id, {})[message_id] = self._appended
+        self._appended += 1
+        guild = message.guild
+        if guild is not None:
+            self._by_guild.setdefault(guild.id, {})[message_id] = None
+
+    def _discard(self, message_id: int) -> Optional[Message]:
+        message = self._messages.pop(message_id, None)
+        if message is None:
+            return None
+
+        self._unindex(self._by_channel, message.channel.id, message_id)
+        guild = message.guild
+        if guild is not None:
+            self._unindex(self._by_guild, guild.id, message_id)
+        return message
+
+    @staticmethod
+    def _unindex(index: Dict[int, Dict[int, Any]], key: int, message_id: int) -> None:
+        ids = index.get(key)
+        if ids is None:
+            return
+
+        ids.pop(message_id, None)
+        if not ids:
+            del index[key]
+
+    def remove(self, message: Message) -> None:
+        if self._discard(message.id) is None:
+            raise ValueError("message not in cache")
+
+    def pop_many(self, channel_id: int, message_ids: Iterable[int]) -> List[Message]:
+        """Removes and returns the cached messages of a channel with the given IDs, in cache order."""
+        positions = self._by_channel.get(channel_id)
+        if not positions:
+            return []
+
+        # only the given IDs are looked up, then sorted back into cache order
+        found = sorted(
+            (positions[message_id], message_id)
+            for message_id in message_ids
+            if message_id in positions
+        )
+        return [self._discard(message_id) for _, message_id in found]  # type: ignore
+
+    def remove_channel(self, channel_id: int) -> None:
+        for message_id in list(self._by_channel.get(channel_id, ())):
+            self._discard(message_id)
+
+    def remove_guild(self, guild_id: int) -> None:
+        for message_id in list(self._by_guild.get(guild_id, ())):
+            self._discard(message_id)
+
+    def clear(self) -> None:
+        self._messages.clear()
+        self._by_channel.clear()
+        self._by_guild.clear()
+
+
 class ConnectionState:
     if TYPE_CHECKING:
         _get_websocket: Callable[..., DiscordWebSocket]
@@ -165,6 +304,8 @@ class ConnectionState:
         intents: Intents = Intents.default(),
         chunk_guilds_at_startup: bool = MISSING,
         member_cache_flags: MemberCacheFlags = MISSING,
+        cache_stores: Optional[Dict[str, CacheStoreFactory]] = None,
+        skip_unused_events: bool = False,
     ) -> None:
         self.loop: asyncio.AbstractEventLoop = loop
         self.http: HTTPClient = http
@@ -172,11 +313,27 @@ class ConnectionState:
         if self.max_messages is not None and self.max_messages <= 0:
             self.max_messages = 1000
 
+        cache_stores = cache_stores or {}
+        for entity in cache_stores:
+            if entity not in CACHE_ENTITIES:
+                raise ValueError(
+                    f"Unknown cache entity {entity!r}, expected one of {', '.join(CACHE_ENTITIES)}"
+                )
+        self._cache_stores: Dict[str, CacheStoreFactory] = cache_stores
+
+        self._skippable_events: Dict[str, Tuple[str, ...]] = {}
+        if skip_unused_events:
+            self._skippable_events.update(_SKIPPABLE_EVENTS)
+            if self.max_messages is None:
+                self._skippable_events.update(_SKIPPABLE_MESSAGE_EVENTS)
+
         self.dispatch: Callable = dispatch
         self.handlers: Dict[str, Callable] = handlers
         self.hooks: Dict[str, Callable] = hooks
         self.shard_count: Optional[int] = None
         self._ready_task: Optional[asyncio.Task] = None
+        self._restored_sessions: Set[Optional[int]] = set()
+        """Shard IDs whose stored gateway session is being resumed, ``None`` when not sharded."""
         self.application_id: Optional[int] = application_id
         self.heartbeat_timeout: float = heartbeat_timeout
         self.guild_ready_timeout: float = guild_ready_timeout
@@ -266,10 +423,16 @@ class ConnectionState:
         # references now using a regular dictionary with eviction being done
         # using __del__. Testing this for memory leaks led to no discernible leaks,
         # though more testing will have to be done.
-        self._users: Dict[int, User] = {}
-        self._emojis: Dict[int, Emoji] = {}
-        self._stickers: Dict[int, GuildSticker] = {}
-        self._guilds: Dict[int, Guild] = {}
+        self._users: CacheStore[int, User] = self._create_store("users")
+        self._emojis: CacheStore[int, Emoji] = self._create_store("emojis")
+        self._stickers: CacheStore[int, GuildSticker] = self._create_store("stickers")
+        self._guilds: CacheStore[int, Guild] = self._create_store("guilds", self._guild_evicted)
+        # channel, thread and scheduled event ids mapped to the id of their guild,
+        # so they can be looked up without going through every guild
+        self._channel_guild_ids: Dict[int, int] = {}
+        self._scheduled_event_guild_ids: Dict[int, int] = {}
+        # user ids mapped to the ids of the guilds whose member name index has them
+        self._member_guild_ids: Dict[int, Dict[int, None]] = {}
         # TODO: Why aren't the above and stuff below application_commands declared in __init__?
         self._application_commands = set()
         # Thought about making these two weakref.WeakValueDictionary's, but the bot could theoretically be holding on
@@ -288,9 +451,42 @@ class ConnectionState:
         # extra dict to look up private channels by user id
         self._private_channels_by_user: Dict[int, DMChannel] = {}
         if self.max_messages is not None:
-            self._messages: Optional[Deque[Message]] = deque(maxlen=self.max_messages)
+            self._messages: Optional[MessageCache] = MessageCache(self.max_messages)
         else:
-            self._messages: Optional[Deque[Message]] = None
+            self._messages: Optional[MessageCache] = None
+
+    def _is_event_unused(self, event: str) -> bool:
+        has_listeners = self._get_client()._has_listeners
+        return not any(has_listeners(name) for name in self._skippable_events[event])
+
+    def _has_listeners(self, event: str) -> bool:
+        client = self._get_client()
+        # a dispatch override may want to see every event, listened to or not
+        if not type(client).dispatch.__module__.startswith("nextcord."):
+            return True
+        return client._has_listeners(event)
+
+    def _parse_unused(self, event: str, data: Dict[str, Any]) -> None:
+        # the channel still has to know about the latest message, even if
+        # nothing is interested in the message itself
+        if event == "MESSAGE_CREATE":
+            channel, _ = self._get_guild_channel(data)
+            if channel and channel.__class__ in (TextChannel, ForumChannel, Thread, VoiceChannel):
+                channel.last_message_id = int(data["id"])  # type: ignore
+
+    def _create_store(
+        self, entity: str, on_evict: Optional[Callable[[int, Any], None]] = None
+    ) -> CacheStore[int, Any]:
+        factory = self._cache_stores.get(entity)
+        if factory is None:
+            return {}
+
+        store = factory()
+        # stores evicting on their own (like LRUCacheStore) report it, so that
+        # the indexes referring to the evicted entities can be cleaned up
+        if on_evict is not None and hasattr(store, "on_evict"):
+            store.on_evict = on_evict  # type: ignore
+        return store
 
     def process_chunk_requests(
         self, guild_id: int, nonce: Optional[str], members: List[Member], complete: bool
@@ -418,8 +614,33 @@ class ConnectionState:
     def _add_guild(self, guild: Guild) -> None:
         self._guilds[guild.id] = guild
 
+    def _reindex_member_names(self, user_id: int) -> None:
+        # users are shared between guilds, so a username or global name change
+        # seen in one guild has to be reflected in the name index of all of them
+        for guild_id in list(self._member_guild_ids.get(user_id, ())):
+            guild = self._guilds.get(guild_id)
+            member = None if guild is None else guild._members.get(user_id)
+            if member is None:
+                self._unindex_member_guild(user_id, guild_id)
+            else:
+                guild._index_member(member)  # type: ignore
+
     def _remove_guild(self, guild: Guild) -> None:
         self._guilds.pop(guild.id, None)
+        self._guild_evicted(guild.id, guild)
+
+    def _guild_evicted(self, _guild_id: int, guild: Guild) -> None:
+        for channel_id in guild._channels:
+            self._unindex_channel(channel_id)
+
+        for thread_id in guild._threads:
+            self._unindex_channel(thread_id)
+
+        for event_id in guild._scheduled_events:
+            self._unindex_scheduled_event(event_id)
+
+        for member_id in guild._member_indexed_names:
+            self._unindex_member_guild(member_id, guild.id)
 
         for emoji in guild.emojis:
             self._emojis.pop(emoji.id, None)
@@ -427,7 +648,48 @@ class ConnectionState:
         for sticker in guild.stickers:
             self._stickers.pop(sticker.id, None)
 
-        del guild
+    def _index_channel(self, channel_id: int, guild_id: int) -> None:
+        self._channel_guild_ids[channel_id] = guild_id
+
+    def _unindex_channel(self, channel_id: int) -> None:
+        self._channel_guild_ids.pop(channel_id, None)
+
+    def _index_member_guild(self, user_id: int, guild_id: int) -> None:
+        self._member_guild_ids.setdefault(user_id, {})[guild_id] = None
+
+    def _unindex_member_guild(self, user_id: int, guild_id: int) -> None:
+        guild_ids = self._member_guild_ids.get(user_id)
+        if guild_ids is None:
+            return
+
+        guild_ids.pop(guild_id, None)
+        if not guild_ids:
+            del self._member_guild_ids[user_id]
+
+    def _index_scheduled_event(self, event_id: int, guild_id: int) -> None:
+        self._scheduled_event_guild_ids[event_id] = guild_id
+
+    def _unindex_scheduled_event(self, event_id: int) -> None:
+        self._scheduled_event_guild_ids.pop(event_id, None)
+
+    def _verify_indexes(self) -> None:
+        # consistency self-check for tests, makes sure every cached channel, thread and
+        # scheduled event is reachable through the indexes used by get_channel and
+        # get_scheduled_event
+        for guild in self._guilds.values():
+            for channel_id in itertools.chain(guild._channels, guild._threads):
+                indexed = self._channel_guild_ids.get(channel_id)
+                if indexed != guild.id:
+                    raise AssertionError(
+                        f"Channel ID {channel_id} of guild ID {guild.id} is indexed under guild ID {indexed}"
+                    )
+
+            for event_id in guild._scheduled_events:
+                indexed = self._scheduled_event_guild_ids.get(event_id)
+                if indexed != guild.id:
+                    raise AssertionError(
+                        f"Scheduled event ID {event_id} of guild ID {guild.id} is indexed under guild ID {indexed}"
+                    )
 
     @property
     def emojis(self) -> List[Emoji]:
@@ -489,11 +751,7 @@ class ConnectionState:
                 self._private_channels_by_user.pop(recipient.id, None)
 
     def _get_message(self, msg_id: Optional[int]) -> Optional[Message]:
-        return (
-            utils.find(lambda m: m.id == msg_id, reversed(self._messages))
-            if self._messages
-            else None
-        )
+        return self._messages.get(msg_id) if self._messages else None
 
     def _add_guild_from_data(self, data: GuildPayload) -> Guild:
         guild = Guild(data=data, state=self)
@@ -703,6 +961,9 @@ class ConnectionState:
         update_known: bool = True,
         register_new: bool = True,
         ignore_forbidden: bool = True,
+        max_concurrency: int = 5,
+        bulk_overwrite: bool = False,
+        cache_path: Optional[Union[str, os.PathLike[str]]] = None,
     ):
         """|coro|
 
@@ -741,6 +1002,25 @@ class ConnectionState:
             If this command should raise an :class:`errors.Forbidden` exception when the bot encounters a guild where
             it doesn't have permissions to view application commands.
             Defaults to ``True``
+        max_concurrency: :class:`int`
+            The maximum number of guilds (counting global commands as one) fetched and synced at the same time.
+            Defaults to ``5``
+
+            .. versionadded:: 3.2
+        bulk_overwrite: :class:`bool`
+            If the commands of each guild should be replaced with a single bulk overwrite request instead of comparing
+            them with what Discord has, see :meth:`bulk_overwrite_application_commands`. This ignores ``data``,
+            ``associate_known``, ``delete_unknown``, ``update_known`` and ``register_new``.
+            Defaults to ``False``
+
+            .. versionadded:: 3.2
+        cache_path: Optional[Union[:class:`str`, :class:`os.PathLike`]]
+            Path to a JSON file storing a hash of the commands last synced to every guild, along with their IDs.
+            Guilds whose local commands hash the same as last time are associated from the file without any request.
+            Only complete syncs, where commands are deleted, updated and registered as needed, are stored.
+            Changes made to the commands on Discord by other means are not detected. Defaults to ``None``
+
+            .. versionadded:: 3.2
         """
         _log.debug("Beginning sync of all application commands.")
         self._get_client().add_all_application_commands()
@@ -749,44 +1029,154 @@ class ConnectionState:
         if self.application_id is None:
             raise TypeError("Could not get the current application's id")
 
+        # dicts are used as ordered sets here
+        targets: Dict[Optional[int], None] = dict.fromkeys(data)
         for app_cmd in self.application_commands:
             self.add_application_command(command=app_cmd, use_rollout=use_rollout)
 
-            if app_cmd.is_global and None not in data:
-                data[None] = await self.http.get_global_commands(self.application_id)
-                _log.debug("Fetched global application command data.")
+            if app_cmd.is_global:
+                targets[None] = None
 
             if app_cmd.is_guild:
                 for guild_id in app_cmd.guild_ids_to_rollout if use_rollout else app_cmd.guild_ids:
+                    targets[guild_id] = None
+
+        complete_sync = bulk_overwrite or (delete_unknown and update_known and register_new)
+        sync_cache = self._load_command_sync_cache(cache_path) if cache_path is not None else {}
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def sync_target(guild_id: Optional[int]) -> None:
+            cache_key = "global" if guild_id is None else str(guild_id)
+            payload_hash = self._hash_application_command_payloads(guild_id, use_rollout)
+            if cache_path is not None:
+                cached = sync_cache.get(cache_key)
+                if cached is not None and cached["hash"] == payload_hash:
+                    _log.debug("Commands for %s are unchanged, skipping sync.", cache_key)
+                    if not cached["commands"]:
+                        return
+
+                    await self.discover_application_commands(
+                        data=cached["commands"],
+                        guild_id=guild_id,
+                        associate_known=associate_known,
+                        delete_unknown=False,
+                        update_known=False,
+                    )
+                    return
+
+            async with semaphore:
+                if bulk_overwrite:
+                    _log.debug("Running bulk overwrite for %s", cache_key)
+                    await self.bulk_overwrite_application_commands(
+                        guild_id, use_rollout=use_rollout
+                    )
+                else:
                     if guild_id not in data:
                         try:
-                            data[guild_id] = await self.http.get_guild_commands(
-                                self.application_id, guild_id
-                            )
-                            _log.debug(
-                                "Fetched guild application command data for guild ID %s", guild_id
-                            )
-                        except Forbidden as e:
-                            if ignore_forbidden:
-                                _log.warning(
-                                    "nextcord.Client: Forbidden error for %s, is the applications.commands "
-                                    "Oauth scope enabled? %s",
-                                    guild_id,
-                                    e,
+                            if guild_id is None:
+                                data[None] = await self.http.get_global_commands(
+                                    self.application_id  # type: ignore
                                 )
+                                _log.debug("Fetched global application command data.")
                             else:
+                                data[guild_id] = await self.http.get_guild_commands(
+                                    self.application_id, guild_id  # type: ignore
+                                )
+                                _log.debug(
+                                    "Fetched guild application command data for guild ID %s",
+                                    guild_id,
+                                )
+                        except Forbidden as e:
+                            if guild_id is None or not ignore_forbidden:
                                 raise e
 
-        for guild_id in data:
-            _log.debug("Running sync for %s", "global" if guild_id is None else f"Guild {guild_id}")
-            await self.sync_application_commands(
-                data=data[guild_id],
-                guild_id=guild_id,
-                associate_known=associate_known,
-                delete_unknown=delete_unknown,
-                update_known=update_known,
-                register_new=register_new,
-            )
+                            _log.warning(
+                                "nextcord.Client: Forbidden error for %s, is the applications.commands "
+                                "Oauth scope enabled? %s",
+                                guild_id,
+                                e,
+                            )
+                            return
+
+                    _log.debug(
+                        "Running sync for %s", "global" if guild_id is None else f"Guild {guild_id}"
+                    )
+                    await self.sync_application_commands(
+                        data=data[guild_id],
+                        guild_id=guild_id,
+                        associate_known=associate_known,
+                        delete_unknown=delete_unknown,
+                        update_known=update_known,
+                        register_new=register_new,
+                    )
+
+            if cache_path is not None and complete_sync:
+                commands = self._get_synced_command_payloads(guild_id, use_rollout)
+                if commands is not None:
+                    sync_cache[cache_key] = {"hash": payload_hash, "commands": commands}
+
+        try:
+            await asyncio.gather(*(sync_target(guild_id) for guild_id in targets))
+        finally:
+            if cache_path is not None:
+                self._save_command_sync_cache(cache_path, sync_cache)
+
+    def _get_sync_target_commands(
+        self, guild_id: Optional[int], use_rollout: bool
+    ) -> List[BaseApplicationCommand]:
+        if guild_id is None:
+            return [app_cmd for app_cmd in self.application_commands if app_cmd.is_global]
+
+        return self.get_guild_application_commands(guild_id, rollout=use_rollout)
+
+    def _hash_application_command_payloads(self, guild_id: Optional[int], use_rollout: bool) -> str:
+        payloads = [
+            app_cmd.get_payload(guild_id)
+            for app_cmd in self._get_sync_target_commands(guild_id, use_rollout)
+        ]
+        payloads.sort(key=lambda p: (p.get("type", 1), p["name"]))
+        dumped = json.dumps(payloads, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(dumped.encode("utf-8")).hexdigest()
+
+    def _get_synced_command_payloads(
+        self, guild_id: Optional[int], use_rollout: bool
+    ) -> Optional[List[Dict[str, Any]]]:
+        # the minimal command data needed to associate local commands again,
+        # None if a command did not end up on Discord
+        commands = []
+        for app_cmd in self._get_sync_target_commands(guild_id, use_rollout):
+            command_id = app_cmd.command_ids.get(guild_id)
+            if command_id is None:
+                return None
+
+            payload = app_cmd.get_payload(guild_id)
+            payload["id"] = str(command_id)
+            if guild_id is not None:
+                payload["guild_id"] = str(guild_id)
+            commands.append(payload)
+
+        return commands
+
+    @staticmethod
+    def _load_command_sync_cache(path: Union[str, os.PathLike[str]]) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(path, encoding="utf-8") as fp:
+                return json.load(fp)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            _log.warning("Could not read the application command sync cache at %s: %s", path, e)
+            return {}
+
+    @staticmethod
+    def _save_command_sync_cache(
+        path: Union[str, os.PathLike[str]], cache: Dict[str, Dict[str, Any]]
+    ) -> None:
+        try:
+            with open(path, "w", encoding="utf-8") as fp:
+                json.dump(cache, fp, separators=(",", ":"))
+        except OSError as e:
+            _log.warning("Could not write the application command sync cache at %s: %s", path, e)
 
     async def sync_application_commands(
         self,
@@ -1148,13 +1538,49 @@ class ConnectionState:
             _log.error("Error unregistering command %s: %s", command.error_name, e)
             raise e
 
-    # async def register_bulk_application_commands(self) -> None:
-    #     # TODO: Using Bulk upsert seems to delete all commands
-    #     # It might be good to keep this around as a reminder for future work. Bulk upsert seem to delete everything
-    #     # that isn't part of that bulk upsert, for both global and guild commands. While useful, this will
-    #     # update/overwrite existing commands, which may (needs testing) wipe out all permissions associated with those
-    #     # commands. Look for an opportunity to use bulk upsert.
-    #     raise NotImplementedError
+    async def bulk_overwrite_application_commands(
+        self, guild_id: Optional[int] = None, *, use_rollout: bool = True
+    ) -> None:
+        """|coro|
+        Replaces every application command Discord has for the given guild ID, or the global commands if ``None``,
+        with the locally added ones in a single request, then associates the local commands with the response.
+
+        Commands on Discord that aren't added locally are deleted. Commands that keep their name and type keep their
+        ID.
+
+        .. versionadded:: 3.2
+
+        Parameters
+        ----------
+        guild_id: Optional[:class:`int`]
+            ID of the guild to overwrite the application commands of. If set to ``None``, global commands are
+            overwritten instead. Defaults to ``None``.
+        use_rollout: :class:`bool`
+            If the rollout guild IDs of commands should be used. Defaults to ``True``.
+        """
+        if self.application_id is None:
+            raise TypeError("Could not get the current application's id")
+
+        payload = [
+            app_cmd.get_payload(guild_id)
+            for app_cmd in self._get_sync_target_commands(guild_id, use_rollout)
+        ]
+        if guild_id:
+            data = await self.http.bulk_upsert_guild_commands(
+                self.application_id, guild_id, payload  # type: ignore
+            )
+        else:
+            data = await self.http.bulk_upsert_global_commands(self.application_id, payload)
+
+        for raw_response in data:
+            app_cmd = self.get_application_command_from_signature(
+                type=int(raw_response.get("type", 1)),
+                qualified_name=raw_response["name"],
+                guild_id=guild_id,
+            )
+            if isinstance(app_cmd, BaseApplicationCommand):
+                app_cmd.parse_discord_response(self, raw_response)
+                self.add_application_command(app_cmd, use_rollout=use_rollout)
 
     async def chunker(
         self,
@@ -1262,6 +1688,7 @@ class ConnectionState:
             self._ready_task.cancel()
 
         self._ready_state = asyncio.Queue()
+        self._restored_sessions.discard(data["__shard_id__"])
         self.clear(views=False)
         self.user = ClientUser(state=self, data=data["user"])
         self.store_user(data["user"])
@@ -1282,8 +1709,16 @@ class ConnectionState:
         self.dispatch("connect")
         self._ready_task = asyncio.create_task(self._delay_ready())
 
+    def _ready_from_stored_session(self, shard_id: Optional[int]) -> None:
+        self._restored_sessions.discard(shard_id)
+        if not self._restored_sessions and not self._get_client().is_ready():
+            self.call_handlers("ready")
+            self.dispatch("ready")
+
     def parse_resumed(self, data) -> None:
         self.dispatch("resumed")
+        if data["__shard_id__"] in self._restored_sessions:
+            self._ready_from_stored_session(data["__shard_id__"])
 
     def parse_message_create(self, data) -> None:
         channel, _ = self._get_guild_channel(data)
@@ -1307,19 +1742,13 @@ class ConnectionState:
 
     def parse_message_delete_bulk(self, data) -> None:
         raw = RawBulkMessageDeleteEvent(data)
-        if self._messages:
-            found_messages = [
-                message for message in self._messages if message.id in raw.message_ids
-            ]
-        else:
-            found_messages = []
+        found_messages = (
+            self._messages.pop_many(raw.channel_id, raw.message_ids) if self._messages else []
+        )
         raw.cached_messages = found_messages
         self.dispatch("raw_bulk_message_delete", raw)
         if found_messages:
             self.dispatch("bulk_message_delete", found_messages)
-            for msg in found_messages:
-                # self._messages won't be None here
-                self._messages.remove(msg)  # type: ignore
 
     def parse_message_update(self, data) -> None:
         raw = RawMessageUpdateEvent(data)
@@ -1444,12 +1873,15 @@ class ConnectionState:
             )
             return
 
-        old_member = Member._copy(member)
+        # the snapshot of the member is only taken if something will receive it
+        old_member = Member._copy(member) if self._has_listeners("presence_update") else None
         user_update = member._presence_update(data=data, user=user)
         if user_update:
+            self._reindex_member_names(member_id)
             self.dispatch("user_update", user_update[0], user_update[1])
 
-        self.dispatch("presence_update", old_member, member)
+        if old_member is not None:
+            self.dispatch("presence_update", old_member, member)
 
     def parse_user_update(self, data) -> None:
         # self.user is *always* cached when this is called
@@ -1458,6 +1890,7 @@ class ConnectionState:
         ref = self._users.get(user.id)
         if ref:
             ref._update(data)
+        self._reindex_member_names(user.id)
 
     def parse_invite_create(self, data) -> None:
         invite = Invite.from_gateway(state=self, data=data)
@@ -1475,6 +1908,8 @@ class ConnectionState:
             if channel is not None:
                 guild._remove_channel(channel)
                 self.dispatch("guild_channel_delete", channel)
+                if self._messages is not None:
+                    self._messages.remove_channel(channel_id)
 
     def parse_channel_update(self, data) -> None:
         channel_type = try_enum(ChannelType, data.get("type"))
@@ -1492,9 +1927,14 @@ class ConnectionState:
         if guild is not None:
             channel = guild.get_channel(channel_id)
             if channel is not None:
-                old_channel = copy.copy(channel)
+                old_channel = (
+                    copy.copy(channel) if self._has_listeners("guild_channel_update") else None
+                )
+                guild._unsort_channel(channel)
                 channel._update(guild, data)
-                self.dispatch("guild_channel_update", old_channel, channel)
+                guild._sort_channel(channel)
+                if old_channel is not None:
+                    self.dispatch("guild_channel_update", old_channel, channel)
             else:
                 _log.debug(
                     "CHANNEL_UPDATE referencing an unknown channel ID: %s. Discarding.", channel_id
@@ -1599,6 +2039,8 @@ class ConnectionState:
         if thread is not None:
             guild._remove_thread(thread)
             self.dispatch("thread_delete", thread)
+            if self._messages is not None:
+                self._messages.remove_channel(thread_id)
 
     def parse_thread_list_sync(self, data) -> None:
         guild_id = int(data["guild_id"])
@@ -1612,7 +2054,7 @@ class ConnectionState:
         except KeyError:
             # If not provided, then the entire guild is being synced
             # So all previous thread data should be overwritten
-            previous_threads = guild._threads.copy()
+            previous_threads = dict(guild._threads.items())
             guild._clear_threads()
         else:
             previous_threads = guild._filter_threads(channel_ids)
@@ -1746,13 +2188,17 @@ class ConnectionState:
 
         member = guild.get_member(user_id)
         if member is not None:
-            old_member = Member._copy(member)
+            old_member = Member._copy(member) if self._has_listeners("member_update") else None
             member._update(data)
             user_update = member._update_inner_user(user)
             if user_update:
+                self._reindex_member_names(user_id)
                 self.dispatch("user_update", user_update[0], user_update[1])
+            else:
+                guild._index_member(member)
 
-            self.dispatch("member_update", old_member, member)
+            if old_member is not None:
+                self.dispatch("member_update", old_member, member)
         else:
             if self.member_cache_flags.joined:
                 member = Member(data=data, guild=guild, state=self)
@@ -1760,6 +2206,7 @@ class ConnectionState:
                 # Force an update on the inner user if necessary
                 user_update = member._update_inner_user(user)
                 if user_update:
+                    self._reindex_member_names(user_id)
                     self.dispatch("user_update", user_update[0], user_update[1])
 
                 guild._add_member(member)
@@ -1871,9 +2318,10 @@ class ConnectionState:
     def parse_guild_update(self, data) -> None:
         guild = self._get_guild(int(data["id"]))
         if guild is not None:
-            old_guild = copy.copy(guild)
+            old_guild = copy.copy(guild) if self._has_listeners("guild_update") else None
             guild._from_data(data)
-            self.dispatch("guild_update", old_guild, guild)
+            if old_guild is not None:
+                self.dispatch("guild_update", old_guild, guild)
         else:
             _log.debug("GUILD_UPDATE referencing an unknown guild ID: %s. Discarding.", data["id"])
 
@@ -1892,9 +2340,7 @@ class ConnectionState:
 
         # do a cleanup of the messages cache
         if self._messages is not None:
-            self._messages: Optional[Deque[Message]] = deque(
-                (msg for msg in self._messages if msg.guild != guild), maxlen=self.max_messages
-            )
+            self._messages.remove_guild(guild.id)
 
         self._remove_guild(guild)
         self.dispatch("guild_remove", guild)
@@ -1960,6 +2406,7 @@ class ConnectionState:
             if role is not None:
                 old_role = copy.copy(role)
                 role._update(role_data)
+                guild._invalidate_permissions()
                 self.dispatch("guild_role_update", old_role, role)
         else:
             _log.debug(
@@ -1982,8 +2429,8 @@ class ConnectionState:
                 user = presence["user"]
                 member_id = user["id"]
                 member = member_dict.get(member_id)
-                if member is not None:
-                    member._presence_update(presence, user)
+                if member is not None and member._presence_update(presence, user):
+                    self._reindex_member_names(member.id)
 
         complete = data.get("chunk_index", 0) + 1 == data.get("chunk_count")
         self.process_chunk_requests(guild_id, data.get("nonce"), members, complete)
@@ -2219,19 +2666,12 @@ class ConnectionState:
         if pm is not None:
             return pm
 
-        for guild in self.guilds:
-            channel = guild._resolve_channel(id)
-            if channel is not None:
-                return channel
-
-        return None
+        guild = self._get_guild(self._channel_guild_ids.get(id))
+        return guild and guild._resolve_channel(id)
 
     def get_scheduled_event(self, id: int) -> Optional[ScheduledEvent]:
-        for guild in self.guilds:
-            if event := guild.get_scheduled_event(id):
-                return event
-
-        return None
+        guild = self._get_guild(self._scheduled_event_guild_ids.get(id))
+        return guild and guild.get_scheduled_event(id)
 
     def create_message(
         self,
@@ -2485,6 +2925,8 @@ class AutoShardedConnectionState(ConnectionState):
         if not hasattr(self, "_ready_state"):
             self._ready_state = asyncio.Queue()
 
+        self._restored_sessions.discard(data["__shard_id__"])
+
         self.user = user = ClientUser(state=self, data=data["user"])
         # self._users is a list of Users, we're setting a ClientUser
         self._users[user.id] = user  # type: ignore
@@ -2510,6 +2952,20 @@ class AutoShardedConnectionState(ConnectionState):
         if self._ready_task is None:
             self._ready_task = asyncio.create_task(self._delay_ready())
 
+    def _ready_from_stored_session(self, shard_id: Optional[int]) -> None:
+        self._restored_sessions.discard(shard_id)
+        self.dispatch("shard_ready", shard_id)
+        # shards that identified dispatch ready by themselves once their guilds arrived
+        if (
+            not self._restored_sessions
+            and self._ready_task is None
+            and not self._get_client().is_ready()
+        ):
+            self.call_handlers("ready")
+            self.dispatch("ready")
+
     def parse_resumed(self, data) -> None:
         self.dispatch("resumed")
         self.dispatch("shard_resumed", data["__shard_id__"])
+        if data["__shard_id__"] in self._restored_sessions:
+            self._ready_from_stored_session(data["__shard_id__"])
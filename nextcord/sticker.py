@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import unicodedata
-from typing import TYPE_CHECKING, List, Literal, Optional, Tuple, Type, Union
+from typing import TYPE_CHECKING, AsyncIterator, List, Literal, Optional, Tuple, Type, Union
 
 from .asset import Asset, AssetMixin
 from .enums import StickerFormatType, StickerType, try_enum
@@ -147,6 +147,34 @@ class _StickerTag(Hashable, AssetMixin):
             raise TypeError('Cannot read stickers of format "lottie".')
         return await super().read()
 
+    def stream(self, *, chunk_size: int = 65536) -> AsyncIterator[bytes]:
+        """Returns an async iterator over the content of this sticker, downloading
+        it in chunks instead of loading it into memory at once.
+
+        .. versionadded:: 3.2
+
+        .. note::
+
+            Stickers that use the :attr:`StickerFormatType.lottie` format cannot be read.
+
+        Raises
+        ------
+        HTTPException
+            Downloading the asset failed.
+        NotFound
+            The asset was deleted.
+        TypeError
+            The sticker is a lottie type.
+
+        Yields
+        ------
+        :class:`bytes`
+            A chunk of the content of the asset.
+        """
+        if self.format is StickerFormatType.lottie:
+            raise TypeError('Cannot read stickers of format "lottie".')
+        return super().stream(chunk_size=chunk_size)
+
 
 class StickerItem(_StickerTag):
     """Represents a sticker item.
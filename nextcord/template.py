@@ -55,6 +55,27 @@ class _PartialTemplateState:
     def _get_voice_client(self, id):
         return None
 
+    def _create_store(self, entity, on_evict=None):
+        return {}
+
+    def _index_channel(self, channel_id, guild_id):
+        pass
+
+    def _unindex_channel(self, channel_id):
+        pass
+
+    def _index_member_guild(self, user_id, guild_id):
+        pass
+
+    def _unindex_member_guild(self, user_id, guild_id):
+        pass
+
+    def _index_scheduled_event(self, event_id, guild_id):
+        pass
+
+    def _unindex_scheduled_event(self, event_id):
+        pass
+
     def _get_message(self, id):
         return None
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
 import logging
 import os
 import sys
@@ -187,30 +188,12 @@ class View:
         self.id: str = os.urandom(16).hex()
         self.__cancel_callback: Optional[Callable[[View], None]] = None
         self.__timeout_expiry: Optional[float] = None
-        self.__timeout_task: Optional[asyncio.Task[None]] = None
         self.__background_tasks: Set[asyncio.Task[None]] = set()
         self.__stopped: asyncio.Future[bool] = loop.create_future()
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} timeout={self.timeout} children={len(self.children)}>"
 
-    async def __timeout_task_impl(self) -> None:
-        while True:
-            # Guard just in case someone changes the value of the timeout at runtime
-            if self.timeout is None:
-                return None
-
-            if self.__timeout_expiry is None:
-                return self._dispatch_timeout()
-
-            # Check if we've elapsed our currently set timeout
-            now = time.monotonic()
-            if now >= self.__timeout_expiry:
-                return self._dispatch_timeout()
-
-            # Wait N seconds to see if timeout data has been refreshed
-            await asyncio.sleep(self.__timeout_expiry - now)
-
     def to_components(self) -> List[ActionRowPayload]:
         def key(item: Item) -> int:
             return item._rendered_row or 0
@@ -394,14 +377,10 @@ class View:
             return await self.on_error(e, item, interaction)
 
     def _start_listening_from_store(self, store: ViewStore) -> None:
-        self.__cancel_callback = partial(store.remove_view)
+        self.__cancel_callback = partial(store._forget_view)
         if self.timeout:
-            loop = asyncio.get_running_loop()
-            if self.__timeout_task is not None:
-                self.__timeout_task.cancel()
-
             self.__timeout_expiry = time.monotonic() + self.timeout
-            self.__timeout_task = loop.create_task(self.__timeout_task_impl())
+            store._schedule_timeout(self)
 
     def _dispatch_timeout(self) -> None:
         if self.__stopped.done():
@@ -452,10 +431,6 @@ class View:
             self.__stopped.set_result(False)
 
         self.__timeout_expiry = None
-        if self.__timeout_task is not None:
-            self.__timeout_task.cancel()
-            self.__timeout_task = None
-
         if self.__cancel_callback:
             self.__cancel_callback(self)
             self.__cancel_callback = None
@@ -491,58 +466,175 @@ class View:
         return await self.__stopped
 
 
+ViewKey = Tuple[int, Optional[int], str]
+
+
 class ViewStore:
     def __init__(self, state: ConnectionState) -> None:
-        self._views: Dict[Tuple[int, Optional[int], str], Tuple[View, Item]] = {}
+        self._views: Dict[ViewKey, Tuple[View, Item]] = {}
         """(component_type, message_id, custom_id): (View, Item)"""
         self._synced_message_views: Dict[int, View] = {}
         """message_id: View"""
+        self._view_keys: Dict[str, Tuple[View, Set[ViewKey]]] = {}
+        """view_id: (View, keys registered in _views for it)"""
+        self._view_messages: Dict[str, Set[int]] = {}
+        """view_id: message_ids tracked in _synced_message_views for it"""
+        self._timeouts: List[Tuple[float, str, View]] = []
+        """heap of (deadline, view_id, View), may contain stale entries"""
+        self._timeout_deadlines: Dict[str, float] = {}
+        """view_id: the deadline of its live entry in _timeouts"""
+        self._timeout_handle: Optional[asyncio.TimerHandle] = None
+        self._timeout_handle_deadline: float = 0.0
         self._state: ConnectionState = state
 
     def all_views(self) -> List[View]:
-        # Create a unique list of views, as _views stores the same view multiple times,
-        # one for each dispatchable item.
-        views = {view.id: view for view, _ in self._views.values()}
-        return list(views.values())
+        return [view for view, _ in self._view_keys.values()]
 
     def views(self, persistent: bool = True) -> List[View]:
         views = self.all_views()
         return [v for v in views if v.is_persistent() ^ (not persistent)]
 
-    def __verify_integrity(self) -> None:
-        to_remove: List[Tuple[int, Optional[int], str]] = []
-        for k, (view, _) in self._views.items():
-            if view.is_finished():
-                to_remove.append(k)
-
-        for k in to_remove:
-            del self._views[k]
-
     def add_view(self, view: View, message_id: Optional[int] = None) -> None:
-        self.__verify_integrity()
-
         view._start_listening_from_store(self)
+        if view.is_finished():
+            return
+
+        keys: Set[ViewKey] = set()
         for item in view.children:
             if item.is_dispatchable():
-                self._views[(item.type.value, message_id, item.custom_id)] = (view, item)  # type: ignore
+                key = (item.type.value, message_id, item.custom_id)  # type: ignore
+                previous = self._views.get(key)
+                if previous is not None and previous[0] is not view:
+                    self._unregister_key(previous[0], key)
+                self._views[key] = (view, item)
+                keys.add(key)
+
+        if keys:
+            try:
+                self._view_keys[view.id][1].update(keys)
+            except KeyError:
+                self._view_keys[view.id] = (view, keys)
 
         if message_id is not None:
+            previous_view = self._synced_message_views.get(message_id)
+            if previous_view is not None and previous_view is not view:
+                self._untrack_message(previous_view, message_id)
             self._synced_message_views[message_id] = view
+            self._view_messages.setdefault(view.id, set()).add(message_id)
 
     def remove_view(self, view: View, message_id: Optional[int] = None) -> None:
         for item in view.children:
             if item.is_dispatchable():
-                self._views.pop((item.type.value, message_id, item.custom_id), None)  # type: ignore
+                key = (item.type.value, message_id, item.custom_id)  # type: ignore
+                value = self._views.get(key)
+                if value is not None and value[0] is view:
+                    del self._views[key]
+                    self._unregister_key(view, key)
+
+        for tracked_message_id in self._view_messages.pop(view.id, ()):
+            if self._synced_message_views.get(tracked_message_id) is view:
+                del self._synced_message_views[tracked_message_id]
+
+    def _unregister_key(self, view: View, key: ViewKey) -> None:
+        entry = self._view_keys.get(view.id)
+        if entry is None:
+            return
+
+        keys = entry[1]
+        keys.discard(key)
+        if not keys:
+            del self._view_keys[view.id]
+
+    def _untrack_message(self, view: View, message_id: int) -> None:
+        message_ids = self._view_messages.get(view.id)
+        if message_ids is None:
+            return
+
+        message_ids.discard(message_id)
+        if not message_ids:
+            del self._view_messages[view.id]
 
-        for key, value in self._synced_message_views.items():
-            if value.id == view.id:
-                del self._synced_message_views[key]
-                break
+    def _forget_view(self, view: View) -> None:
+        # called once a view has finished, drops everything stored for it
+        _, keys = self._view_keys.pop(view.id, (view, ()))
+        for key in keys:
+            value = self._views.get(key)
+            if value is not None and value[0] is view:
+                del self._views[key]
+
+        for message_id in self._view_messages.pop(view.id, ()):
+            if self._synced_message_views.get(message_id) is view:
+                del self._synced_message_views[message_id]
+
+        # the heap entry becomes stale and is skipped once it is popped
+        self._timeout_deadlines.pop(view.id, None)
+
+    def _schedule_timeout(self, view: View) -> None:
+        deadline = view._expires_at
+        if deadline is None:
+            return
+
+        # an entry that fires earlier will reschedule itself once it is reached
+        current = self._timeout_deadlines.get(view.id)
+        if current is not None and current <= deadline:
+            return
+
+        self._timeout_deadlines[view.id] = deadline
+        heapq.heappush(self._timeouts, (deadline, view.id, view))
+        self._arm_timeouts()
+
+    def _arm_timeouts(self) -> None:
+        timeouts = self._timeouts
+        while timeouts and self._timeout_deadlines.get(timeouts[0][1]) != timeouts[0][0]:
+            heapq.heappop(timeouts)
+
+        handle = self._timeout_handle
+        if not timeouts:
+            if handle is not None:
+                handle.cancel()
+                self._timeout_handle = None
+            return
+
+        deadline = timeouts[0][0]
+        if handle is not None:
+            if self._timeout_handle_deadline <= deadline:
+                return
+            handle.cancel()
+
+        loop = asyncio.get_running_loop()
+        delay = max(deadline - time.monotonic(), 0)
+        self._timeout_handle = loop.call_later(delay, self._process_timeouts)
+        self._timeout_handle_deadline = deadline
+
+    def _process_timeouts(self) -> None:
+        self._timeout_handle = None
+        timeouts = self._timeouts
+        now = time.monotonic()
+        while timeouts and timeouts[0][0] <= now:
+            deadline, view_id, view = heapq.heappop(timeouts)
+            if self._timeout_deadlines.get(view_id) != deadline:
+                continue
+
+            del self._timeout_deadlines[view_id]
+            # Guard just in case someone changes the value of the timeout at runtime
+            if view.timeout is None or view.is_finished():
+                continue
+
+            # The timeout is refreshed on every interaction, so this entry may be outdated
+            expiry = view._expires_at
+            if expiry is not None and expiry > now:
+                self._timeout_deadlines[view_id] = expiry
+                heapq.heappush(timeouts, (expiry, view_id, view))
+                continue
+
+            view._dispatch_timeout()
+            self._forget_view(view)
+
+        self._arm_timeouts()
 
     def dispatch(
         self, component_type: int, custom_id: str, interaction: Interaction[ClientT]
     ) -> None:
-        self.__verify_integrity()
         message_id: Optional[int] = interaction.message and interaction.message.id
         key = (component_type, message_id, custom_id)
         # Fallback to None message_id searches in case a persistent view
@@ -559,7 +651,10 @@ class ViewStore:
         return message_id in self._synced_message_views
 
     def remove_message_tracking(self, message_id: int) -> Optional[View]:
-        return self._synced_message_views.pop(message_id, None)
+        view = self._synced_message_views.pop(message_id, None)
+        if view is not None:
+            self._untrack_message(view, message_id)
+        return view
 
     def update_from_message(self, message_id: int, components: List[ComponentPayload]) -> None:
         # pre-req: is_message_tracked == true
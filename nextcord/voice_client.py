@@ -22,13 +22,14 @@ import logging
 import socket
 import struct
 import threading
+import time
 from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple, Union, cast
 
 from . import opus, utils
 from .backoff import ExponentialBackoff
 from .errors import ClientException, ConnectionClosed
 from .gateway import *
-from .player import AudioPlayer, AudioSource
+from .player import AudioPlayer, AudioScheduler, AudioSource, _ScheduledAudioPlayer
 from .utils import MISSING
 
 if TYPE_CHECKING:
@@ -62,6 +63,9 @@ __all__ = (
 
 _log = logging.getLogger(__name__)
 
+_RTP_HEADER = struct.Struct(">BBHII")
+_LITE_NONCE = struct.Struct(">I")
+
 
 class VoiceProtocol:
     """A class that represents the Discord voice protocol.
@@ -235,6 +239,11 @@ class VoiceClient(VoiceProtocol):
         self.encoder: Encoder = MISSING
         self._lite_nonce: int = 0
         self.ws: DiscordVoiceWebSocket = MISSING
+        # resolved once per secret key instead of once per packet
+        self._secret_box: Optional[nacl.secret.SecretBox] = None
+        self._encrypt_packet: Optional[Callable[[bytes, bytes], bytes]] = None
+        self._packets_sent: int = 0
+        self._packet_cpu_time: int = 0
 
     warn_nacl = not has_nacl
     supported_modes: Tuple[SupportedModes, ...] = (
@@ -504,43 +513,45 @@ class VoiceClient(VoiceProtocol):
 
     # audio related
 
+    def _update_encryption(self) -> None:
+        # called whenever a new secret key is received
+        self._secret_box = nacl.secret.SecretBox(bytes(self.secret_key))
+        self._encrypt_packet = getattr(self, "_encrypt_" + self.mode)
+
     def _get_voice_packet(self, data):
-        header = bytearray(12)
+        if self._encrypt_packet is None:
+            self._update_encryption()
 
         # Formulate rtp header
-        header[0] = 0x80
-        header[1] = 0x78
-        struct.pack_into(">H", header, 2, self.sequence)
-        struct.pack_into(">I", header, 4, self.timestamp)
-        struct.pack_into(">I", header, 8, self.ssrc)
-
-        encrypt_packet = getattr(self, "_encrypt_" + self.mode)
-        return encrypt_packet(header, data)
+        header = _RTP_HEADER.pack(0x80, 0x78, self.sequence, self.timestamp, self.ssrc)
+        return self._encrypt_packet(header, data)  # type: ignore
 
     def _encrypt_xsalsa20_poly1305(self, header: bytes, data) -> bytes:
-        box = nacl.secret.SecretBox(bytes(self.secret_key))
-        nonce = bytearray(24)
-        nonce[:12] = header
+        nonce = header + bytes(12)
 
-        return header + box.encrypt(bytes(data), bytes(nonce)).ciphertext
+        return header + self._secret_box.encrypt(bytes(data), nonce).ciphertext  # type: ignore
 
     def _encrypt_xsalsa20_poly1305_suffix(self, header: bytes, data) -> bytes:
-        box = nacl.secret.SecretBox(bytes(self.secret_key))
         nonce = nacl.utils.random(nacl.secret.SecretBox.NONCE_SIZE)  # type: ignore
 
-        return header + box.encrypt(bytes(data), nonce).ciphertext + nonce
+        return header + self._secret_box.encrypt(bytes(data), nonce).ciphertext + nonce  # type: ignore
 
     def _encrypt_xsalsa20_poly1305_lite(self, header: bytes, data) -> bytes:
-        box = nacl.secret.SecretBox(bytes(self.secret_key))
-        nonce = bytearray(24)
-
-        nonce[:4] = struct.pack(">I", self._lite_nonce)
-        self.checked_add("_lite_nonce", 1, 4294967295)
+        nonce = _LITE_NONCE.pack(self._lite_nonce)
+        self._lite_nonce = 0 if self._lite_nonce >= 4294967295 else self._lite_nonce + 1
 
-        return header + box.encrypt(bytes(data), bytes(nonce)).ciphertext + nonce[:4]
+        return (
+            header
+            + self._secret_box.encrypt(bytes(data), nonce + bytes(20)).ciphertext  # type: ignore
+            + nonce
+        )
 
     def play(
-        self, source: AudioSource, *, after: Optional[Callable[[Optional[Exception]], Any]] = None
+        self,
+        source: AudioSource,
+        *,
+        after: Optional[Callable[[Optional[Exception]], Any]] = None,
+        scheduler: Optional[AudioScheduler] = None,
     ) -> None:
         """Plays an :class:`AudioSource`.
 
@@ -560,6 +571,11 @@ class VoiceClient(VoiceProtocol):
             This function must have a single parameter, ``error``, that
             denotes an optional exception that was raised during playing.
             If the function is a coroutine, it will be awaited when called.
+        scheduler: Optional[:class:`AudioScheduler`]
+            The scheduler to drive this connection from, instead of starting
+            a dedicated audio thread for it.
+
+            .. versionadded:: 3.2
 
         Raises
         ------
@@ -583,7 +599,10 @@ class VoiceClient(VoiceProtocol):
         if not self.encoder and not source.is_opus():
             self.encoder = opus.Encoder()
 
-        self._player = AudioPlayer(source, self, after=after)
+        if scheduler is None:
+            self._player = AudioPlayer(source, self, after=after)
+        else:
+            self._player = _ScheduledAudioPlayer(source, self, scheduler=scheduler, after=after)
         self._player.start()
 
     def is_playing(self) -> bool:
@@ -648,7 +667,8 @@ class VoiceClient(VoiceProtocol):
             Encoding the data failed.
         """
 
-        self.checked_add("sequence", 1, 65535)
+        start = time.thread_time_ns()
+        self.sequence = 0 if self.sequence >= 65535 else self.sequence + 1
         encoded_data = self.encoder.encode(data, self.encoder.SAMPLES_PER_FRAME) if encode else data
         packet = self._get_voice_packet(encoded_data)
         try:
@@ -659,3 +679,29 @@ class VoiceClient(VoiceProtocol):
             )
 
         self.checked_add("timestamp", opus.Encoder.SAMPLES_PER_FRAME, 4294967295)
+        self._packets_sent += 1
+        self._packet_cpu_time += time.thread_time_ns() - start
+
+    @property
+    def packets_sent(self) -> int:
+        """:class:`int`: The number of audio packets sent through this voice client.
+
+        .. versionadded:: 3.2
+        """
+        return self._packets_sent
+
+    @property
+    def average_packet_cpu_time(self) -> float:
+        """:class:`float`: The average CPU time, in seconds, spent encoding, encrypting and
+        sending a single audio packet through :meth:`send_audio_packet`.
+
+        This is measured on the thread sending the packets, so it only accounts
+        for the work done for this voice client's stream.
+        Returns ``0.0`` if no packet has been sent yet.
+
+        .. versionadded:: 3.2
+        """
+        if not self._packets_sent:
+            return 0.0
+
+        return self._packet_cpu_time / self._packets_sent / 1e9
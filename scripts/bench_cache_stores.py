@@ -0,0 +1,77 @@
+# SPDX-License-Identifier: MIT
+
+"""Measures the memory use and lookup latency of a member cache store.
+
+Run with ``python scripts/bench_cache_stores.py --store dict`` and
+``python scripts/bench_cache_stores.py --store lru`` from the repository root.
+Each run fills one guild with synthetic members through the cache store, then
+reports the peak RSS of the process and the average time of a member lookup.
+The stores are measured in separate runs, as the peak RSS of a process never
+goes back down.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import resource
+import sys
+import time
+
+import nextcord
+from nextcord.guild import Guild
+from nextcord.member import Member
+
+
+def _peak_rss_mib() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, kibibytes everywhere else
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def main(store: str, members: int, maxsize: int, lookups: int) -> None:
+    cache_stores = {}
+    if store == "lru":
+        cache_stores["members"] = nextcord.LRUCacheStore.factory(maxsize)
+
+    client = nextcord.Client(intents=nextcord.Intents.all(), cache_stores=cache_stores)
+    state = client._connection
+    guild = Guild(data={"id": "1", "name": "benchmark"}, state=state)  # type: ignore
+    state._add_guild(guild)
+
+    baseline = _peak_rss_mib()
+    for user_id in range(1, members + 1):
+        data = {
+            "user": {
+                "id": str(user_id),
+                "username": f"user{user_id}",
+                "discriminator": "0",
+                "global_name": None,
+                "avatar": None,
+            },
+            "roles": [],
+            "joined_at": None,
+        }
+        guild._add_member(Member(data=data, guild=guild, state=state))  # type: ignore
+    filled = _peak_rss_mib()
+
+    ids = [random.randint(1, members) for _ in range(lookups)]
+    get_member = guild.get_member
+    start = time.perf_counter()
+    for member_id in ids:
+        get_member(member_id)
+    elapsed = time.perf_counter() - start
+
+    print(f"store: {store}, cached members: {len(guild._members):,}")
+    print(f"peak RSS: {filled:.1f} MiB (+{filled - baseline:.1f} MiB while filling)")
+    print(f"lookup: {elapsed / lookups * 1e9:.0f} ns on average over {lookups:,} lookups")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--store", choices=("dict", "lru"), default="dict")
+    parser.add_argument("--members", type=int, default=200_000)
+    parser.add_argument("--maxsize", type=int, default=10_000)
+    parser.add_argument("--lookups", type=int, default=1_000_000)
+    args = parser.parse_args()
+    main(args.store, args.members, args.maxsize, args.lookups)
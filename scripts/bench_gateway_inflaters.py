@@ -0,0 +1,165 @@
+# SPDX-License-Identifier: MIT
+
+"""Times the gateway inflaters over synthetic GUILD_CREATE and MESSAGE_CREATE frames.
+
+Run with ``python scripts/bench_gateway_inflaters.py`` from the repository root.
+The frames are compressed once like Discord sends them, with large GUILD_CREATE
+payloads split over multiple frames, then every inflater decompresses the stream
+and decodes each message from JSON. The zlib inflater is compared with buffering
+every frame and decoding the text first, as was done before, and ``zstd-stream``
+is only measured when it is available.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+import zlib
+from typing import Any, Callable, Dict, List, Optional
+
+from nextcord import utils
+from nextcord.gateway import _ZLIB_SUFFIX, HAS_ZSTD, ZlibStreamInflater, ZstdStreamInflater
+
+_FRAME_SIZE = 16 * 1024
+"""Size of the frames the large messages are split over."""
+
+
+class BufferedZlibInflater:
+    # every frame is copied into a buffer and inflated to text, like before
+    def __init__(self) -> None:
+        self._zlib = zlib.decompressobj()
+        self._buffer = bytearray()
+
+    def feed(self, data: bytes) -> Optional[str]:
+        self._buffer.extend(data)
+        if len(data) < 4 or data[-4:] != _ZLIB_SUFFIX:
+            return None
+
+        msg = self._zlib.decompress(self._buffer).decode("utf-8")
+        self._buffer = bytearray()
+        return msg
+
+
+def _user(user_id: int) -> Dict[str, Any]:
+    return {
+        "id": str(user_id),
+        "username": f"user{user_id}",
+        "discriminator": "0",
+        "global_name": f"User {user_id}",
+        "avatar": f"{random.getrandbits(128):032x}",
+    }
+
+
+def _guild_create(guild_id: int, members: int) -> Dict[str, Any]:
+    return {
+        "id": str(guild_id),
+        "name": f"guild {guild_id}",
+        "member_count": members,
+        "roles": [
+            {"id": str(guild_id + i), "name": f"role {i}", "permissions": "0"} for i in range(20)
+        ],
+        "channels": [
+            {"id": str(guild_id + 100 + i), "type": 0, "name": f"channel-{i}", "position": i}
+            for i in range(50)
+        ],
+        "members": [
+            {"user": _user(user_id), "roles": [str(guild_id + 1)], "joined_at": None}
+            for user_id in range(guild_id, guild_id + members)
+        ],
+    }
+
+
+def _message_create(message_id: int) -> Dict[str, Any]:
+    return {
+        "id": str(message_id),
+        "channel_id": "100",
+        "guild_id": "1",
+        "author": _user(random.randint(1, 10_000)),
+        "content": " ".join(random.choices(("hello", "world", "nextcord", "gateway"), k=20)),
+        "embeds": [],
+        "attachments": [],
+        "mentions": [],
+    }
+
+
+def _payloads(guilds: int, members: int, messages: int) -> List[Dict[str, Any]]:
+    payloads = [
+        {"op": 0, "s": None, "t": "GUILD_CREATE", "d": _guild_create(i << 22, members)}
+        for i in range(1, guilds + 1)
+    ]
+    payloads.extend(
+        {"op": 0, "s": None, "t": "MESSAGE_CREATE", "d": _message_create(i)}
+        for i in range(messages)
+    )
+    return payloads
+
+
+def _zlib_frames(payloads: List[Dict[str, Any]]) -> List[bytes]:
+    compressor = zlib.compressobj()
+    frames = []
+    for payload in payloads:
+        data = compressor.compress(json.dumps(payload).encode())
+        data += compressor.flush(zlib.Z_SYNC_FLUSH)
+        frames.extend(data[i : i + _FRAME_SIZE] for i in range(0, len(data), _FRAME_SIZE))
+    return frames
+
+
+def _zstd_frames(payloads: List[Dict[str, Any]]) -> List[bytes]:
+    try:
+        from compression import zstd  # type: ignore
+
+        compressor = zstd.ZstdCompressor()
+        compress: Callable[[bytes], bytes] = lambda data: compressor.compress(
+            data, zstd.ZstdCompressor.FLUSH_BLOCK
+        )
+    except ImportError:
+        import zstandard  # type: ignore
+
+        compressobj = zstandard.ZstdCompressor().compressobj()
+        compress = lambda data: compressobj.compress(data) + compressobj.flush(
+            zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        )
+
+    # zstd-stream messages always arrive in a single frame
+    return [compress(json.dumps(payload).encode()) for payload in payloads]
+
+
+def _run(inflater: Any, frames: List[bytes]) -> float:
+    feed = inflater.feed
+    start = time.perf_counter()
+    for frame in frames:
+        msg = feed(frame)
+        if msg is not None:
+            utils.from_json(msg)
+    return time.perf_counter() - start
+
+
+def main(guilds: int, members: int, messages: int, repeat: int) -> None:
+    payloads = _payloads(guilds, members, messages)
+    runs: List[tuple] = []
+    zlib_frames = _zlib_frames(payloads)
+    runs.append(("zlib-stream", ZlibStreamInflater, zlib_frames))
+    runs.append(("zlib-stream (buffered)", BufferedZlibInflater, zlib_frames))
+    if HAS_ZSTD:
+        runs.append(("zstd-stream", ZstdStreamInflater, _zstd_frames(payloads)))
+    else:
+        print("zstd-stream is not available, install zstandard or use Python 3.14+")
+
+    print(f"{len(payloads):,} messages")
+    for label, factory, frames in runs:
+        # every run needs a fresh inflater, as the stream has to be read from the start
+        best = min(_run(factory(), frames) for _ in range(repeat))
+        size = sum(len(frame) for frame in frames)
+        print(f"{label:>24}: {best * 1000:8.1f}ms over {len(frames):,} frames ({size:,} bytes)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--guilds", type=int, default=20)
+    parser.add_argument("--members", type=int, default=1000)
+    parser.add_argument("--messages", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    main(args.guilds, args.members, args.messages, args.repeat)
@@ -0,0 +1,85 @@
+# SPDX-License-Identifier: MIT
+
+"""Times a synthetic flood of PRESENCE_UPDATE events through the parser.
+
+Run with ``python scripts/bench_presence_updates.py`` from the repository root.
+By default, 100,000 updates spread over 10,000 members are parsed, once without
+any ``presence_update`` listener, where no snapshot of the member is taken, and
+once with a listener receiving the ``before`` member.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import time
+
+import nextcord
+from nextcord.guild import Guild
+from nextcord.member import Member
+
+
+def _user(user_id: int) -> dict:
+    return {
+        "id": str(user_id),
+        "username": f"user{user_id}",
+        "discriminator": "0",
+        "global_name": None,
+        "avatar": None,
+    }
+
+
+def _presences(members: int, events: int) -> list:
+    statuses = ("online", "idle", "dnd", "offline")
+    return [
+        {
+            "guild_id": "1",
+            "user": {"id": str(random.randint(1, members))},
+            "status": random.choice(statuses),
+            "activities": [],
+            "client_status": {"desktop": random.choice(statuses)},
+        }
+        for _ in range(events)
+    ]
+
+
+async def _flood(client: nextcord.Client, presences: list) -> float:
+    parse = client._connection.parse_presence_update
+    start = time.perf_counter()
+    for presence in presences:
+        parse(presence)
+    elapsed = time.perf_counter() - start
+    # let the scheduled listener calls run so they don't pile up between runs
+    await asyncio.sleep(0)
+    return elapsed
+
+
+async def main(members: int, events: int) -> None:
+    client = nextcord.Client(intents=nextcord.Intents.all())
+    state = client._connection
+    guild = Guild(data={"id": "1", "name": "benchmark"}, state=state)  # type: ignore
+    state._add_guild(guild)
+    for user_id in range(1, members + 1):
+        data = {"user": _user(user_id), "roles": [], "joined_at": None}
+        guild._add_member(Member(data=data, guild=guild, state=state))  # type: ignore
+
+    presences = _presences(members, events)
+    unlistened = await _flood(client, presences)
+
+    async def on_presence_update(before: Member, after: Member) -> None:
+        pass
+
+    client.event(on_presence_update)
+    listened = await _flood(client, presences)
+
+    for label, elapsed in (("no listener", unlistened), ("listener", listened)):
+        print(f"{label:>12}: {elapsed:.3f}s ({events / elapsed:,.0f} events/s)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--members", type=int, default=10_000)
+    parser.add_argument("--events", type=int, default=100_000)
+    args = parser.parse_args()
+    asyncio.run(main(args.members, args.events))
@@ -0,0 +1,209 @@
+# SPDX-License-Identifier: MIT
+
+"""Runs a ShardCluster against a local fake Discord API and gateway.
+
+Run with ``python scripts/fake_gateway.py`` from the repository root.
+The fake API answers the few HTTP routes needed to start, and the fake gateway
+accepts ``zlib-stream`` connections, answering IDENTIFY with READY and one
+GUILD_CREATE for every guild of the shard, and acknowledging heartbeats.
+
+Once the cluster has run for ``--duration`` seconds it is closed, and the time
+every shard identified at is printed, which shows how the coordinator paces the
+IDENTIFYs of the workers.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import functools
+import json
+import time
+import zlib
+from typing import Any, Dict, List
+
+from aiohttp import WSMsgType, web
+
+import nextcord
+from nextcord.http import Route
+
+_USER = {
+    "id": "1",
+    "username": "fake",
+    "discriminator": "0",
+    "global_name": None,
+    "avatar": None,
+    "bot": True,
+}
+
+
+def _json(data: Any) -> web.Response:
+    # the library only decodes responses with this exact content type
+    return web.Response(
+        body=json.dumps(data).encode(), headers={"Content-Type": "application/json"}
+    )
+
+
+def create_client(base: str, **kwargs: Any) -> nextcord.AutoShardedClient:
+    # runs in the worker processes, which have their own copy of Route
+    Route.BASE = base
+    return nextcord.AutoShardedClient(intents=nextcord.Intents.default(), **kwargs)
+
+
+class FakeDiscord:
+    def __init__(self, port: int, shards: int, guilds: int, max_concurrency: int) -> None:
+        self.port: int = port
+        self.shards: int = shards
+        self.guilds: int = guilds
+        self.max_concurrency: int = max_concurrency
+        self.started: float = time.monotonic()
+        self.identifies: List[tuple] = []
+        self.heartbeats: Dict[int, int] = {}
+
+    @property
+    def base(self) -> str:
+        return f"http://127.0.0.1:{self.port}/api/v10"
+
+    @property
+    def gateway(self) -> str:
+        return f"ws://127.0.0.1:{self.port}/gateway"
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/api/v10/users/@me", self.get_user)
+        app.router.add_get("/api/v10/gateway", self.get_gateway)
+        app.router.add_get("/api/v10/gateway/bot", self.get_gateway_bot)
+        app.router.add_get("/api/v10/applications/{application_id}/commands", self.get_commands)
+        app.router.add_get(
+            "/api/v10/applications/{application_id}/guilds/{guild_id}/commands",
+            self.get_commands,
+        )
+        app.router.add_get("/gateway", self.connect)
+        return app
+
+    async def get_user(self, _request: web.Request) -> web.Response:
+        return _json(_USER)
+
+    async def get_commands(self, _request: web.Request) -> web.Response:
+        return _json([])
+
+    async def get_gateway(self, _request: web.Request) -> web.Response:
+        return _json({"url": self.gateway})
+
+    async def get_gateway_bot(self, _request: web.Request) -> web.Response:
+        return _json(
+            {
+                "url": self.gateway,
+                "shards": self.shards,
+                "session_start_limit": {
+                    "total": 1000,
+                    "remaining": 1000,
+                    "reset_after": 86_400_000,
+                    "max_concurrency": self.max_concurrency,
+                },
+            }
+        )
+
+    def _guilds(self, shard_id: int) -> List[int]:
+        return [
+            guild_id
+            for guild_id in range(1 << 22, (self.guilds + 1) << 22, 1 << 22)
+            if (guild_id >> 22) % self.shards == shard_id
+        ]
+
+    async def connect(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        compressor = zlib.compressobj()
+        sequence = 0
+
+        async def send(op: int, data: Any, event: Any = None) -> None:
+            nonlocal sequence
+            payload: Dict[str, Any] = {"op": op, "d": data, "s": None, "t": event}
+            if op == 0:
+                sequence += 1
+                payload["s"] = sequence
+            raw = json.dumps(payload).encode()
+            await ws.send_bytes(compressor.compress(raw) + compressor.flush(zlib.Z_SYNC_FLUSH))
+
+        await send(10, {"heartbeat_interval": 5000})
+        shard_id = 0
+        async for message in ws:
+            if message.type is not WSMsgType.TEXT:
+                break
+
+            payload = json.loads(message.data)
+            op = payload["op"]
+            if op == 1:
+                self.heartbeats[shard_id] = self.heartbeats.get(shard_id, 0) + 1
+                await send(11, None)
+            elif op == 2:
+                shard_id = payload["d"]["shard"][0]
+                self.identifies.append((shard_id, time.monotonic() - self.started))
+                guilds = self._guilds(shard_id)
+                ready = {
+                    "v": 10,
+                    "user": _USER,
+                    "guilds": [{"id": str(guild_id), "unavailable": True} for guild_id in guilds],
+                    "session_id": f"session-{shard_id}",
+                    "resume_gateway_url": self.gateway,
+                    "shard": [shard_id, self.shards],
+                    "application": {"id": _USER["id"], "flags": 0},
+                }
+                await send(0, ready, "READY")
+                for guild_id in guilds:
+                    guild = {
+                        "id": str(guild_id),
+                        "name": f"guild {guild_id >> 22}",
+                        "member_count": 1,
+                        "channels": [],
+                        "roles": [],
+                        "emojis": [],
+                        "members": [],
+                    }
+                    await send(0, guild, "GUILD_CREATE")
+
+        return ws
+
+
+async def main(args: argparse.Namespace) -> None:
+    fake = FakeDiscord(args.port, args.shards, args.guilds, args.max_concurrency)
+    runner = web.AppRunner(fake.app())
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", args.port).start()
+    Route.BASE = fake.base
+
+    cluster = nextcord.ShardCluster(
+        functools.partial(create_client, fake.base), processes=args.processes
+    )
+
+    async def stop() -> None:
+        await asyncio.sleep(args.duration)
+        await cluster.close()
+
+    stopper = asyncio.create_task(stop())
+    try:
+        await cluster.start("fake-token")
+    finally:
+        # the workers may all exit before the coordinator is done closing
+        if not cluster.is_closed():
+            stopper.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await stopper
+        await runner.cleanup()
+
+    for shard_id, at in sorted(fake.identifies, key=lambda identify: identify[1]):
+        print(f"shard {shard_id:>3} identified at {at:6.2f}s")
+    print(f"heartbeats acknowledged: {sum(fake.heartbeats.values())}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--shards", type=int, default=4)
+    parser.add_argument("--guilds", type=int, default=20)
+    parser.add_argument("--processes", type=int, default=2)
+    parser.add_argument("--max-concurrency", type=int, default=1)
+    parser.add_argument("--duration", type=float, default=30.0)
+    asyncio.run(main(parser.parse_args()))